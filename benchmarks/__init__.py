@@ -0,0 +1,6 @@
+"""Timing scripts for the matching engine.
+
+Not part of the test suite and not shipped with the package. Each module runs on
+its own from the repository root, for example ``python -m benchmarks.scoring``,
+and prints JSON so two commits can be compared by diffing their output.
+"""
@@ -0,0 +1,93 @@
+"""Greedy against optimal assignment on one very large scope.
+
+    python -m benchmarks.assignment [--sizes 100,1000,5000] [--repeat N]
+
+Every ungrouped control from the saved Greenhouse, Lever and tricky forms is
+repeated until the scope holds the requested number of controls, which is the
+worst case for the one to one constraint: every field has hundreds of
+contenders. The confidence matrix is scored once and each strategy is timed on
+it alone, so the numbers are the cost of assignment, not of scoring. Reports
+the total confidence each strategy reaches as well.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from dataclasses import replace
+from pathlib import Path
+
+from resume_filler.extractors import fields_from_html
+from resume_filler.field_map import (
+    CANONICAL_FIELDS,
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    ConfidenceMatrix,
+    _claim_greedily,
+    _claim_optimally,
+)
+from resume_filler.models import FormField
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+FORMS = ("greenhouse_form.html", "lever_form.html", "tricky_form.html")
+
+
+def _scope(size: int) -> list[FormField]:
+    template = [
+        form_field
+        for name in FORMS
+        for form_field in fields_from_html((FIXTURES / name).read_text(encoding="utf-8"))
+        if not form_field.is_grouped
+    ]
+    return [
+        replace(template[i % len(template)], name=f"{template[i % len(template)].name}-{i}")
+        for i in range(size)
+    ]
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run(sizes: list[int], repeat: int) -> list[dict[str, object]]:
+    results: list[dict[str, object]] = []
+    for size in sizes:
+        fields = _scope(size)
+        matrix = ConfidenceMatrix.score(
+            fields, list(range(size)), CANONICAL_FIELDS, DEFAULT_CONFIDENCE_THRESHOLD
+        )
+        greedy, optimal = _claim_greedily(matrix), _claim_optimally(matrix)
+        results.append(
+            {
+                "controls": size,
+                "assigned": {"greedy": len(greedy), "optimal": len(optimal)},
+                "total_confidence": {
+                    "greedy": round(sum(value for _, value in greedy.values()), 4),
+                    "optimal": round(sum(value for _, value in optimal.values()), 4),
+                },
+                "seconds": {
+                    "greedy": round(_best_of(repeat, lambda m=matrix: _claim_greedily(m)), 6),
+                    "optimal": round(_best_of(repeat, lambda m=matrix: _claim_optimally(m)), 6),
+                },
+            }
+        )
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Time the assignment strategies.")
+    parser.add_argument("--sizes", default="100,1000,5000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    print(json.dumps(run(sizes, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
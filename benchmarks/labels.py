@@ -0,0 +1,120 @@
+"""Label resolution on large pages, indexed against searching the document.
+
+    python -m benchmarks.labels [--sizes 100,1000] [--html PAGE.html ...] [--repeat N]
+
+Scans synthetic Workday, Lever and iCIMS forms of each size, and any saved
+pages given with ``--html``, once with the ``LabelIndex`` the static adapter
+builds per document and once with every lookup searching the whole document,
+and every container selected afresh for each control, as it used to. Reports both timings of ``fields_from_html`` and whether
+every control came out with the same label.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+from bs4 import BeautifulSoup, Tag
+
+from benchmarks import synthetic
+from resume_filler import extractors
+from resume_filler.extractors import _clean, fields_from_html
+
+SHAPES = ("workday", "lever", "icims")
+
+
+class _Searching:
+    """The lookups ``LabelIndex`` replaced, each one a walk of the whole page."""
+
+    def __init__(self, soup: BeautifulSoup) -> None:
+        self.soup = soup
+
+    def label_for(self, element_id: str) -> Tag | None:
+        return self.soup.find("label", attrs={"for": element_id})
+
+    def element(self, element_id: str) -> Tag | None:
+        return self.soup.find(id=element_id)
+
+    def legend(self, element: Tag) -> str:
+        fieldset = element.find_parent("fieldset")
+        if fieldset:
+            legend = fieldset.find("legend")
+            if legend:
+                return _clean(legend.get_text(" "))
+        return ""
+
+    def candidates(self, container: Tag) -> list[tuple[str, str]]:
+        found = []
+        for candidate in container.select(extractors._LABEL_LIKE_SELECTOR):
+            text = _clean(candidate.get_text(" "))
+            if text:
+                bound_to = candidate.get("for")
+                found.append((str(bound_to) if bound_to else "", text))
+        return found
+
+
+@contextmanager
+def _searching() -> Iterator[None]:
+    original = extractors.LabelIndex
+    extractors.LabelIndex = SimpleNamespace(build=_Searching)
+    try:
+        yield
+    finally:
+        extractors.LabelIndex = original
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _compare(html: str, repeat: int) -> dict[str, object]:
+    indexed = [field.label for field in fields_from_html(html)]
+    indexed_seconds = _best_of(repeat, lambda: fields_from_html(html))
+    with _searching():
+        searched = [field.label for field in fields_from_html(html)]
+        searched_seconds = _best_of(repeat, lambda: fields_from_html(html))
+    return {
+        "bytes": len(html.encode("utf-8")),
+        "controls": len(indexed),
+        "labels_agree": indexed == searched,
+        "seconds": {"indexed": round(indexed_seconds, 6), "searched": round(searched_seconds, 6)},
+        "speedup": round(searched_seconds / indexed_seconds, 1) if indexed_seconds else None,
+    }
+
+
+def run(sizes: list[int], pages: list[Path], repeat: int) -> dict[str, dict[str, object]]:
+    report: dict[str, dict[str, object]] = {}
+    for shape in SHAPES:
+        report[shape] = {
+            str(size): _compare(synthetic.SHAPES[shape](size), repeat) for size in sizes
+        }
+    if pages:
+        report["pages"] = {
+            page.name: _compare(page.read_text(encoding="utf-8", errors="replace"), repeat)
+            for page in pages
+        }
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Time label resolution on large pages.")
+    parser.add_argument("--sizes", default="100,1000")
+    parser.add_argument("--html", type=Path, nargs="*", default=[])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    print(json.dumps(run(sizes, args.html, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
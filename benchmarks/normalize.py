@@ -0,0 +1,113 @@
+"""How often planning normalises text, with and without the caches.
+
+    python -m benchmarks.normalize [--repeat N]
+
+Plans every saved fixture form once with ``normalize`` uncached and every
+attribute re-normalised wherever it is read, as the engine used to, and once as
+it is now: each control's attributes normalised on first use and ``normalize``
+itself behind an LRU. Counts the calls that reach ``normalize`` and the ones
+that actually had to compute, then times planning each way on a fresh scan.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+from resume_filler import field_map
+from resume_filler.extractors import fields_from_html
+from resume_filler.field_map import NORMALIZE_CACHE_SIZE, plan_fill
+from resume_filler.models import FormField, ResumeData
+from resume_filler.resume_parser import parse_resume_text
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+@contextmanager
+def _counted(cached: bool) -> Iterator[dict[str, int]]:
+    """Swap in a ``normalize`` that counts, cached like the real one or not at all."""
+    raw = field_map.normalize.__wrapped__
+    counts = {"calls": 0, "computed": 0}
+
+    def computing(text: str) -> str:
+        counts["computed"] += 1
+        return raw(text)
+
+    inner = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(computing) if cached else computing
+
+    def calling(text: str) -> str:
+        counts["calls"] += 1
+        return inner(text)
+
+    originals = (field_map.normalize, field_map.normalized_attribute)
+    field_map.normalize = calling
+    if not cached:
+        field_map.normalized_attribute = lambda form_field, attribute: calling(
+            getattr(form_field, attribute, "")
+        )
+    try:
+        yield counts
+    finally:
+        field_map.normalize, field_map.normalized_attribute = originals
+
+
+def _forms() -> dict[str, list[FormField]]:
+    return {
+        path.name: fields_from_html(path.read_text(encoding="utf-8"))
+        for path in sorted(FIXTURES.glob("*.html"))
+    }
+
+
+def _fresh(forms: dict[str, list[FormField]]) -> None:
+    """Forget every control's normalised attributes, as a new scan would."""
+    for fields in forms.values():
+        for form_field in fields:
+            form_field.normalized_attributes.clear()
+
+
+def _plan_all(forms: dict[str, list[FormField]], resume: ResumeData) -> None:
+    _fresh(forms)
+    for fields in forms.values():
+        plan_fill(fields, resume)
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run(repeat: int) -> dict[str, object]:
+    forms = _forms()
+    resume = parse_resume_text((FIXTURES / "sample_resume.txt").read_text(encoding="utf-8"))
+    report: dict[str, object] = {
+        "forms": len(forms),
+        "controls": sum(len(fields) for fields in forms.values()),
+    }
+    for label, cached in (("uncached", False), ("cached", True)):
+        with _counted(cached) as counts:
+            _plan_all(forms, resume)
+            report[label] = {
+                **counts,
+                "plan_seconds": round(_best_of(repeat, lambda: _plan_all(forms, resume)), 6),
+            }
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Count normalize calls while planning.")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
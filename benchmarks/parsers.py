@@ -0,0 +1,94 @@
+"""The HTML tree builders against each other on large pages.
+
+    python -m benchmarks.parsers [--sizes 100,1000] [--html PAGE.html ...] [--repeat N]
+
+Parses synthetic Workday, Lever and iCIMS forms of each size, and any saved
+pages given with ``--html``, with every parser in ``HTML_PARSERS`` that is
+installed. Reports the time to build the tree alone and the time for the whole
+``fields_from_html`` scan, and whether each parser found the same controls with
+the same labels as html.parser.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from benchmarks import synthetic
+from resume_filler.extractors import (
+    DEFAULT_HTML_PARSER,
+    HTML_PARSERS,
+    fields_from_html,
+    parse_html,
+)
+
+SHAPES = ("workday", "lever", "icims")
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _scan(html: str, parser: str) -> list[tuple[str, str, str, str]]:
+    fields = fields_from_html(html, parser=parser)
+    return [(f.tag, f.field_type, f.name or f.element_id, f.label) for f in fields]
+
+
+def _timings(html: str, parser: str, repeat: int) -> dict[str, object]:
+    return {
+        "parse_seconds": round(_best_of(repeat, lambda: parse_html(html, parser)), 6),
+        "scan_seconds": round(_best_of(repeat, lambda: fields_from_html(html, parser=parser)), 6),
+    }
+
+
+def _compare(html: str, parsers: list[str], repeat: int) -> dict[str, object]:
+    reference = _scan(html, DEFAULT_HTML_PARSER)
+    result: dict[str, object] = {"bytes": len(html.encode("utf-8")), "controls": len(reference)}
+    for parser in parsers:
+        result[parser] = {
+            **_timings(html, parser, repeat),
+            "fields_agree": _scan(html, parser) == reference,
+        }
+    return result
+
+
+def run(sizes: list[int], pages: list[Path], repeat: int) -> dict[str, dict[str, object]]:
+    parsers = [
+        parser
+        for parser in HTML_PARSERS
+        if parser == DEFAULT_HTML_PARSER or importlib.util.find_spec(parser) is not None
+    ]
+    report: dict[str, dict[str, object]] = {"installed": {"parsers": parsers}}
+    for shape in SHAPES:
+        report[shape] = {
+            str(size): _compare(synthetic.SHAPES[shape](size), parsers, repeat) for size in sizes
+        }
+    if pages:
+        report["pages"] = {
+            page.name: _compare(page.read_text(encoding="utf-8", errors="replace"), parsers, repeat)
+            for page in pages
+        }
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Time each HTML parser on large pages.")
+    parser.add_argument("--sizes", default="100,1000")
+    parser.add_argument("--html", type=Path, nargs="*", default=[])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    print(json.dumps(run(sizes, args.html, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Pruning saved pages before parsing, against parsing them whole.
+
+    python -m benchmarks.pruning [--sizes 100,1000] [--kilobytes 300] [--html PAGE.html ...]
+                                 [--repeat N]
+
+Wraps synthetic Workday, Lever and iCIMS forms of each size in the scripts,
+styles and icons a saved page carries (see ``synthetic.saved``), and reads any
+saved pages given with ``--html`` as they are. Each page goes through
+``fields_from_html`` and ``from_html_file`` twice: once pruned, and once parsed
+whole, as both used to be, the posting reader decomposing scripts only after
+building the tree. Reports the best
+timing and the peak memory of each, and whether the fields and the posting
+came out the same.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import astuple, replace
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from benchmarks import synthetic
+from resume_filler import extractors, sources
+from resume_filler.extractors import DEFAULT_HTML_PARSER, fields_from_html
+from resume_filler.models import JobPosting
+
+SHAPES = ("workday", "lever", "icims")
+
+
+def _parse_then_decompose(html: str, parser: str = DEFAULT_HTML_PARSER) -> BeautifulSoup:
+    soup = BeautifulSoup(html, parser)
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+    return soup
+
+
+@contextmanager
+def _unpruned() -> Iterator[None]:
+    """Parse every page whole, as the adapters did before pruning."""
+    saved = (extractors.prune_html, sources._posting_markup, sources.parse_html)
+    extractors.prune_html = sources._posting_markup = lambda html: html
+    sources.parse_html = _parse_then_decompose
+    try:
+        yield
+    finally:
+        extractors.prune_html, sources._posting_markup, sources.parse_html = saved
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _peak_bytes(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _measure(html: str, page: Path, repeat: int) -> dict[str, object]:
+    stages: dict[str, Callable[[], object]] = {
+        "fields_from_html": lambda: fields_from_html(html),
+        "from_html_file": lambda: sources.from_html_file(page),
+    }
+    return {
+        stage: {"seconds": round(_best_of(repeat, func), 6), "peak_bytes": _peak_bytes(func)}
+        for stage, func in stages.items()
+    }
+
+
+def _output(html: str, page: Path) -> tuple[list[tuple[object, ...]], list[JobPosting]]:
+    fields = [replace(form_field, handle=None) for form_field in fields_from_html(html)]
+    return [astuple(form_field) for form_field in fields], sources.from_html_file(page)
+
+
+def _compare(html: str, repeat: int) -> dict[str, object]:
+    with tempfile.TemporaryDirectory() as scratch:
+        page = Path(scratch) / "page.html"
+        page.write_text(html, encoding="utf-8")
+        pruned, pruned_output = _measure(html, page, repeat), _output(html, page)
+        with _unpruned():
+            whole, whole_output = _measure(html, page, repeat), _output(html, page)
+    return {
+        "bytes": len(html.encode("utf-8")),
+        "same_output": pruned_output == whole_output,
+        "pruned": pruned,
+        "whole": whole,
+    }
+
+
+def run(
+    sizes: list[int], kilobytes: int, pages: list[Path], repeat: int
+) -> dict[str, dict[str, object]]:
+    report: dict[str, dict[str, object]] = {}
+    for shape in SHAPES:
+        report[shape] = {
+            str(size): _compare(synthetic.saved(synthetic.SHAPES[shape](size), kilobytes), repeat)
+            for size in sizes
+        }
+    if pages:
+        report["pages"] = {
+            page.name: _compare(page.read_text(encoding="utf-8", errors="replace"), repeat)
+            for page in pages
+        }
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Time parsing saved pages with and without pruning."
+    )
+    parser.add_argument("--sizes", default="100,1000")
+    parser.add_argument("--kilobytes", type=int, default=300)
+    parser.add_argument("--html", type=Path, nargs="*", default=[])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    print(json.dumps(run(sizes, args.kilobytes, args.html, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
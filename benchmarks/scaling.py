@@ -0,0 +1,153 @@
+"""How extraction and planning scale with the size of the form.
+
+    python -m benchmarks.scaling [--shapes greenhouse,workday] [--sizes 10,100,1000]
+                                 [--rows N] [--repeat N] [--output FILE]
+
+Generates synthetic forms of each shape and size (see ``benchmarks.synthetic``)
+and times the four stages a run goes through: ``fields_from_html``,
+``normalize_fields``, ``match_form`` and ``plan_fill``. Every stage reports the
+best of ``--repeat`` timings, its throughput in controls per second and the
+peak memory it allocated, measured on a separate pass so tracing does not
+inflate the timings. ``--rows`` sizes the Workday shape by repeating rows
+instead of by controls.
+
+Each stage is timed twice. ``cold`` empties the normalisation, pattern score
+and token caches before every repeat, as for the first form a run sees;
+``warm`` leaves them filled by the previous repeat, as for the hundredth form
+on the same board. Without the split, whichever stage ran first paid for
+filling the caches and the next was timed warm. The compiled vocabulary is
+built once before anything is timed, since a run pays for that only once.
+
+The report is stable JSON, keyed by shape and size, so two commits can be
+compared with an ordinary diff of their ``--output`` files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import replace
+from pathlib import Path
+
+from benchmarks import synthetic
+from resume_filler import field_map
+from resume_filler.extractors import fields_from_html, normalize_fields
+from resume_filler.field_map import ResumeValues, match_form, plan_fill
+from resume_filler.models import FormField, ResumeData
+from resume_filler.resume_parser import parse_resume_text
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def _clear_caches() -> None:
+    """Forget every text the matching engine has seen, as a new process would."""
+    field_map.normalize.cache_clear()
+    field_map.pattern_scores.cache_clear()
+    field_map._token_candidates.cache_clear()
+    field_map.group_source.cache_clear()
+
+
+def _best_of(
+    repeat: int, func: Callable[[], object], before: Callable[[], object] | None = None
+) -> float:
+    """Best timing of ``func``, running ``before`` untimed ahead of each repeat."""
+    timings = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _peak_bytes(func: Callable[[], object]) -> int:
+    _clear_caches()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _unscanned(fields: list[FormField]) -> list[FormField]:
+    """Copies as the adapters hand them over, before groups and date labels."""
+    return [replace(form_field, group="", group_index=-1) for form_field in fields]
+
+
+def _stages(
+    html: str, fields: list[FormField], resume: ResumeData, values: ResumeValues
+) -> dict[str, Callable[[], object]]:
+    # Copied per call: normalize_fields mutates its input, and match_form
+    # would otherwise reuse attributes normalised by the previous repeat.
+    return {
+        "fields_from_html": lambda: fields_from_html(html),
+        "normalize_fields": lambda: normalize_fields(_unscanned(fields)),
+        "match_form": lambda: match_form([replace(f) for f in fields]),
+        "plan_fill": lambda: plan_fill([replace(f) for f in fields], resume, values=values),
+    }
+
+
+def run(
+    shapes: list[str], sizes: list[int], repeat: int, rows: int | None = None
+) -> dict[str, dict[str, object]]:
+    resume = parse_resume_text((FIXTURES / "sample_resume.txt").read_text(encoding="utf-8"))
+    values = ResumeValues.build(resume)
+    # Builds the compiled vocabulary, which no stage should be charged for.
+    match_form(fields_from_html(synthetic.SHAPES["greenhouse"](10)))
+    report: dict[str, dict[str, object]] = {}
+    for shape in shapes:
+        report[shape] = {}
+        for size in sizes:
+            if shape == "workday" and rows is not None:
+                html = synthetic.workday(size, rows=rows)
+            else:
+                html = synthetic.SHAPES[shape](size)
+            fields = fields_from_html(html)
+            stages: dict[str, object] = {}
+            for stage, func in _stages(html, fields, resume, values).items():
+                timed = {"cold": _best_of(repeat, func, _clear_caches)}
+                func()
+                timed["warm"] = _best_of(repeat, func)
+                stages[stage] = {
+                    **{
+                        temperature: {
+                            "seconds": round(seconds, 6),
+                            "controls_per_second": round(len(fields) / seconds)
+                            if seconds
+                            else None,
+                        }
+                        for temperature, seconds in timed.items()
+                    },
+                    "peak_bytes": _peak_bytes(func),
+                }
+            report[shape][str(size)] = {
+                "controls": len(fields),
+                "grouped": sum(1 for form_field in fields if form_field.is_grouped),
+                "stages": stages,
+            }
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Time extraction and planning by form size.")
+    parser.add_argument("--shapes", default=",".join(synthetic.SHAPES))
+    parser.add_argument("--sizes", default="10,100,1000")
+    parser.add_argument("--rows", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+    shapes = [shape for shape in args.shapes.split(",") if shape]
+    sizes = [int(size) for size in args.sizes.split(",")]
+    report = json.dumps(run(shapes, sizes, args.repeat, args.rows), indent=2)
+    if args.output is not None:
+        args.output.write_text(report + "\n", encoding="utf-8")
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
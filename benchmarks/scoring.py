@@ -0,0 +1,119 @@
+"""Pattern scoring on the saved Workday work-history page.
+
+    python -m benchmarks.scoring [--repeat N]
+
+Runs ``match_form`` over the fixture with the per-pattern ``re.search`` scorer
+the engine used to have, then with the compiled tiers from a cold cache (a form
+seen for the first time) and a warm one (the same template seen again). Exits
+with an error if the two scorers disagree on any control.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from resume_filler import field_map
+from resume_filler.extractors import fields_from_html
+from resume_filler.field_map import ATTRIBUTE_WEIGHTS, CanonicalField, match_form, normalize
+from resume_filler.models import FormField
+
+FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "workday_experience.html"
+
+
+def _per_pattern_attribute_score(form_field: FormField, canonical: CanonicalField) -> float:
+    """The scorer as it was: every raw pattern string searched one at a time."""
+    best = 0.0
+    for attribute, weight in ATTRIBUTE_WEIGHTS.items():
+        text = normalize(getattr(form_field, attribute, ""))
+        if not text or any(re.search(negative, text) for negative in canonical.negatives):
+            continue
+        strength = max((s for p, s in canonical.patterns if re.search(p, text)), default=0.0)
+        if strength:
+            best = max(best, strength * weight)
+    return round(best, 4)
+
+
+def _per_pair_control_score(
+    form_field: FormField,
+    vocabulary: tuple[CanonicalField, ...],
+    *,
+    only: Iterable[CanonicalField] | None = None,
+) -> dict[str, float]:
+    """Scoring as it was: every attribute re-normalised for every field."""
+    return {
+        canonical.name: field_map.score_field(form_field, canonical) for canonical in vocabulary
+    }
+
+
+@contextmanager
+def _per_pattern_scoring() -> Iterator[None]:
+    originals = (field_map._best_attribute_score, field_map.score_control)
+    field_map._best_attribute_score = _per_pattern_attribute_score
+    field_map.score_control = _per_pair_control_score
+    try:
+        yield
+    finally:
+        field_map._best_attribute_score, field_map.score_control = originals
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _outcome(fields: list[FormField]) -> list[tuple[str, float]]:
+    return [(match.canonical, match.confidence) for match in match_form(fields)]
+
+
+def run(repeat: int) -> dict[str, object]:
+    fields = fields_from_html(FIXTURE.read_text(encoding="utf-8"))
+
+    def cold() -> None:
+        field_map.pattern_scores.cache_clear()
+        field_map._token_candidates.cache_clear()
+        match_form(fields)
+
+    with _per_pattern_scoring():
+        reference = _outcome(fields)
+        per_pattern = _best_of(repeat, lambda: match_form(fields))
+
+    cold()
+    if _outcome(fields) != reference:
+        raise SystemExit("Compiled scoring changed the outcome of match_form.")
+    compiled_cold = _best_of(repeat, cold)
+    compiled_warm = _best_of(repeat, lambda: match_form(fields))
+
+    return {
+        "fixture": FIXTURE.name,
+        "controls": len(fields),
+        "match_form_seconds": {
+            "per_pattern": round(per_pattern, 6),
+            "compiled_cold": round(compiled_cold, 6),
+            "compiled_warm": round(compiled_warm, 6),
+        },
+        "speedup": {
+            "cold": round(per_pattern / compiled_cold, 2),
+            "warm": round(per_pattern / compiled_warm, 2),
+        },
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Time pattern scoring in match_form.")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
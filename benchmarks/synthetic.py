@@ -0,0 +1,225 @@
+"""Synthetic application forms of any size, shaped like the real ATS pages.
+
+The saved fixtures are a few dozen controls each, too small to show how the
+engine scales. These generators write the same markup patterns the fixtures
+capture, repeated until the form reaches the requested number of controls:
+
+``greenhouse``
+    A flat form: contact details, two uploads, then custom questions and the
+    voluntary self-identification selects, repeated.
+``lever``
+    A flat form with ``urls[...]`` links and ``cards[...]`` custom questions.
+``workday``
+    Contact details, then work-history and education rows with the split
+    month and year spinbuttons. ``rows`` fixes the number of rows instead.
+``icims``
+    The account registration block asked again for the profile, as iCIMS does,
+    repeated so every question appears many times over.
+
+Every generator returns HTML, so ``fields_from_html`` can be timed as well as
+everything downstream of it. ``saved`` wraps any of them in the scripts,
+styles and icons a browser's saved copy of the page carries. ``fields`` scans
+that HTML into ``FormField`` lists.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+
+from resume_filler.extractors import fields_from_html
+from resume_filler.models import FormField
+
+SIZES = (10, 100, 1_000, 10_000)
+
+
+def _page(body: list[str]) -> str:
+    return "<html><body><form>\n" + "\n".join(body) + "\n</form></body></html>"
+
+
+def _text(control_id: str, label: str, name: str = "", kind: str = "text", extra: str = "") -> str:
+    return (
+        f'<label for="{control_id}">{label}</label>'
+        f'<input type="{kind}" id="{control_id}" name="{name or control_id}"{extra}>'
+    )
+
+
+def _select(control_id: str, label: str, options: tuple[str, ...]) -> str:
+    rendered = "".join(f"<option>{option}</option>" for option in options)
+    return f'<label for="{control_id}">{label}</label><select id="{control_id}">{rendered}</select>'
+
+
+_GENDER = ("Male", "Female", "Decline to self identify")
+_VETERAN = ("I am a protected veteran", "I am not a protected veteran", "Decline to answer")
+
+
+def greenhouse(size: int) -> str:
+    body = [
+        _text("first_name", "First Name", "job_application[first_name]"),
+        _text("last_name", "Last Name", "job_application[last_name]"),
+        _text("email", "Email", "job_application[email]", "email"),
+        _text("phone", "Phone", "job_application[phone]", "tel"),
+        _text("resume", "Resume/CV", "job_application[resume]", "file", ' accept=".pdf,.docx"'),
+        _text("cover_letter", "Cover Letter", "job_application[cover_letter]", "file"),
+    ]
+    question = 0
+    while len(body) < size:
+        body.extend(
+            [
+                _text(
+                    f"job_application_answers_attributes_{question}_text_value",
+                    "LinkedIn Profile" if question == 0 else f"Website {question}",
+                    f"job_application[answers_attributes][{question}][text_value]",
+                ),
+                f'<label for="q{question}">Why do you want to work here? ({question})</label>'
+                f'<textarea id="q{question}" name="question_{question}"></textarea>',
+                _select(f"gender_{question}", "Gender", _GENDER),
+                _select(f"veteran_{question}", "Veteran Status", _VETERAN),
+            ]
+        )
+        question += 1
+    return _page(body[:size])
+
+
+def lever(size: int) -> str:
+    body = [
+        _text("name", "Full name", "name"),
+        _text("email", "Email", "email", "email"),
+        _text("phone", "Phone", "phone", "tel"),
+        _text("org", "Current company", "org"),
+        _text("resume-upload-input", "Resume/CV", "resume", "file"),
+    ]
+    card = 0
+    while len(body) < size:
+        body.extend(
+            [
+                _text(f"urls-{card}", "LinkedIn URL", "urls[LinkedIn]"),
+                _text(f"github-{card}", "GitHub URL", "urls[GitHub]"),
+                _text(
+                    f"card-{card}",
+                    f"How did you hear about us? ({card})",
+                    f"cards[c{card}][field0]",
+                ),
+                f'<label for="card-{card}-essay">Tell us about a project you are proud of</label>'
+                f'<textarea id="card-{card}-essay" name="cards[c{card}][field1]"></textarea>',
+            ]
+        )
+        card += 1
+    return _page(body[:size])
+
+
+_WORKDAY_HEADER = (
+    _text("legalName--firstName", "Given Name(s)", "legalName--firstName"),
+    _text("legalName--lastName", "Family Name", "legalName--lastName"),
+    _text("email", "Email Address", "email", "email"),
+    _text("phoneNumber--phoneNumber", "Phone Number", "phoneNumber--phoneNumber", "tel"),
+)
+
+
+def _work_row(row: int) -> list[str]:
+    prefix = f"workExperience-{row * 3 + 1}"
+    dates = []
+    for part, caption in (("startDate", "From"), ("endDate", "To")):
+        dates.append(
+            f'<div><span class="application-label">{caption}</span>'
+            f'<input role="spinbutton" id="{prefix}--{part}Month" aria-label="Month">'
+            f'<input role="spinbutton" id="{prefix}--{part}Year" aria-label="Year"></div>'
+        )
+    return [
+        _text(f"{prefix}--jobTitle", "Job Title *", "jobTitle"),
+        _text(f"{prefix}--companyName", "Company *", "companyName"),
+        _text(f"{prefix}--location", "Location", "location"),
+        _text(f"{prefix}--currentlyWorkHere", "I currently work here", kind="checkbox"),
+        *dates,
+        f'<label for="{prefix}--roleDescription">Role Description</label>'
+        f'<textarea id="{prefix}--roleDescription"></textarea>',
+    ]
+
+
+def _education_row(row: int) -> list[str]:
+    prefix = f"education-{row * 2 + 1}"
+    return [
+        _text(f"{prefix}--schoolName", "School or University", "schoolName"),
+        _text(f"{prefix}--degree", "Degree", "degree"),
+        _text(f"{prefix}--fieldOfStudy", "Field of Study", "fieldOfStudy"),
+    ]
+
+
+# Controls per generated row, counting each date wrapper as its two inputs.
+_WORK_ROW_CONTROLS = 9
+_EDUCATION_ROW_CONTROLS = 3
+
+
+def workday(size: int, rows: int | None = None) -> str:
+    """Contact details, then work and education rows; ``rows`` overrides ``size``."""
+    if rows is None:
+        per_pair = _WORK_ROW_CONTROLS + _EDUCATION_ROW_CONTROLS
+        rows = max(1, (size - len(_WORKDAY_HEADER)) // per_pair)
+    body = list(_WORKDAY_HEADER)
+    for row in range(rows):
+        body.extend(_work_row(row))
+    for row in range(rows):
+        body.extend(_education_row(row))
+    return _page(body)
+
+
+def icims(size: int) -> str:
+    body: list[str] = []
+    block = 0
+    while len(body) < size:
+        for section in ("account", "profile"):
+            body.extend(
+                [
+                    _text(f"{section}{block}_FirstName", "First Name"),
+                    _text(f"{section}{block}_LastName", "Last Name"),
+                    _text(f"{section}{block}_Email", "Email", kind="email"),
+                ]
+            )
+        body.append(_text(f"profile{block}_Phone", "Phone Number", kind="tel"))
+        block += 1
+    return _page(body[:size])
+
+
+SHAPES: dict[str, Callable[[int], str]] = {
+    "greenhouse": greenhouse,
+    "lever": lever,
+    "workday": workday,
+    "icims": icims,
+}
+
+
+_ICON = (
+    '<svg viewBox="0 0 24 24" aria-hidden="true"><path d="'
+    + "M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2z" * 8
+    + '"/></svg>'
+)
+
+
+def saved(html: str, kilobytes: int = 300) -> str:
+    """The same form as a browser saves it, carrying the page's dead weight.
+
+    A saved Workday page is mostly inline scripts, a JSON state blob,
+    stylesheets and an SVG icon beside every label, roughly ``kilobytes`` of
+    it here. The title and meta description are real, as a posting would have.
+    """
+    state = json.dumps({"widgets": [{"id": n, "label": f"Widget {n}"} for n in range(100)]})
+    rule = ".css-1x2y3z4{display:flex;align-items:center;margin:0 0 8px 0;color:#333}\n"
+    head = [
+        "<title>Software Engineer</title>",
+        '<meta name="description" content="Responsibilities: build things. '
+        'Qualifications: Python experience required.">',
+    ]
+    filler: list[str] = []
+    while sum(len(part) for part in filler) < kilobytes * 1024:
+        filler.append(f"<style>{rule * 40}</style>")
+        filler.append(f'<script type="application/json">{state}</script>')
+        filler.append(f"<script>window.__bundle=function(){{return {state!r};}};</script>")
+    iconed = html.replace("</label>", f"</label>{_ICON}")
+    return iconed.replace(
+        "<html><body>", "<html><head>" + "".join(head + filler) + "</head><body>", 1
+    )
+
+
+def fields(shape: str, size: int) -> list[FormField]:
+    """A scanned synthetic form, ready for ``match_form`` or ``plan_fill``."""
+    return fields_from_html(SHAPES[shape](size))
@@ -1,6 +1,6 @@
 # PyInstaller build. Run with:  pyinstaller resume-filler.spec
 #
-# Two things have to be collected explicitly or the executable builds cleanly
+# Three things have to be collected explicitly or the executable builds cleanly
 # and then fails at the moment it matters:
 #
 #   selenium   ships selenium-manager.exe, the helper that fetches the right
@@ -9,12 +9,18 @@
 #   pdfminer   carries character map data used for text extraction. Without it
 #              some PDFs come out empty or mojibake, which looks like a parser
 #              bug rather than a packaging one.
+#   packs      the matching vocabulary, shipped as JSON beside the code.
+#              Without it the executable fails as soon as it starts.
 
 from PyInstaller.utils.hooks import collect_all, collect_data_files
 
 selenium_datas, selenium_binaries, selenium_hidden = collect_all("selenium")
 
-datas = selenium_datas + collect_data_files("pdfminer")
+datas = (
+    selenium_datas
+    + collect_data_files("pdfminer")
+    + [("resume_filler/packs/*.json", "resume_filler/packs")]
+)
 binaries = selenium_binaries
 hiddenimports = selenium_hidden + [
     "pdfplumber",
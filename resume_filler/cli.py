@@ -3,7 +3,8 @@
 Three subcommands:
 
 * ``parse``   Show what the parser extracted from a resume. No browser.
-* ``inspect`` Show the fill plan for a saved HTML file or a live URL.
+* ``inspect`` Show the fill plan for a saved HTML file, a directory of them, or a
+  live URL.
 * ``apply``   Work through a list of postings. Dry run unless --submit is given.
 
 Nothing here submits anything by default. ``--submit`` is the only way to send
@@ -14,14 +15,16 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
 from .config import Settings
 from .extractors import fields_from_html
-from .field_map import plan_fill
+from .field_map import ResumeValues, plan_fill
 from .logging_setup import configure_logging
-from .models import ApplicationResult, ApplicationStatus, JobPosting, RunMode
+from .models import ApplicationResult, ApplicationStatus, JobPosting, ResumeData, RunMode
+from .plan_cache import PlanCache
 from .profile import load_profile
 from .reporting import (
     diagnose_sparse_scan,
@@ -33,6 +36,7 @@ from .reporting import (
 )
 from .resume_parser import parse_resume
 from .tracker import Tracker
+from .vendors import detect_vendor
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +84,23 @@ def build_parser() -> argparse.ArgumentParser:
     source = inspect_cmd.add_mutually_exclusive_group(required=True)
     source.add_argument("--html", help="Path to a saved HTML file. No browser needed.")
     source.add_argument("--url", help="Live URL to open in a browser.")
+    source.add_argument(
+        "--html-dir",
+        help=(
+            "Directory of saved HTML files. Plans every one and writes a JSON line "
+            "per page, then one of totals."
+        ),
+    )
     inspect_cmd.add_argument("--resume", help="Path to the resume PDF.")
+    inspect_cmd.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes to plan --html-dir with. Defaults to one per CPU.",
+    )
+    inspect_cmd.add_argument(
+        "--output", help="Write the --html-dir report here instead of to the terminal."
+    )
 
     apply_cmd = subparsers.add_parser("apply", help="Fill applications for a list of postings.")
     origin = apply_cmd.add_mutually_exclusive_group(required=True)
@@ -180,6 +200,12 @@ def _resolve_settings(args: argparse.Namespace) -> Settings:
     return settings
 
 
+def _plan_cache(settings: Settings) -> PlanCache | None:
+    if settings.plan_cache_size <= 0:
+        return None
+    return PlanCache(settings.plan_cache_path, max_plans=settings.plan_cache_size)
+
+
 def command_parse(args: argparse.Namespace, settings: Settings) -> int:
     resume_path = Path(args.resume).expanduser() if args.resume else settings.resume_path
     resume = parse_resume(resume_path)
@@ -204,20 +230,26 @@ def command_parse(args: argparse.Namespace, settings: Settings) -> int:
 def command_inspect(args: argparse.Namespace, settings: Settings) -> int:
     resume_path = Path(args.resume).expanduser() if args.resume else settings.resume_path
     resume = parse_resume(resume_path)
+    if args.html_dir:
+        return _inspect_corpus(args, settings, resume, resume_path)
     print(render_resume_summary(resume))
+    # No plan cache: inspecting is read only, and shows what the engine decides
+    # now rather than what it once decided for the template.
 
     if args.html:
         saved_page = Path(args.html).expanduser()
         html = saved_page.read_text(encoding="utf-8", errors="replace")
         # base_path lets the scan follow iframes into their saved companion
         # files, which is the whole form on an iCIMS page.
-        fields = fields_from_html(html, base_path=saved_page)
+        fields = fields_from_html(html, base_path=saved_page, parser=settings.html_parser)
         matches = plan_fill(
             fields,
             resume,
             resume_path=str(resume_path.resolve()),
             threshold=settings.confidence_threshold,
+            strategy=settings.assignment_strategy,
             profile=load_profile(settings.profile_path),
+            vendor=detect_vendor(html),
         )
         print(f"\nFill plan for {args.html}")
         print(render_plan(matches, verbose=args.verbose))
@@ -241,6 +273,7 @@ def command_inspect(args: argparse.Namespace, settings: Settings) -> int:
             resume,
             resume_path=str(resume_path.resolve()),
             threshold=settings.confidence_threshold,
+            strategy=settings.assignment_strategy,
             timeout=settings.page_timeout,
             dry_run=True,
         )
@@ -251,11 +284,53 @@ def command_inspect(args: argparse.Namespace, settings: Settings) -> int:
     return 0
 
 
-def _load_postings(args: argparse.Namespace) -> list[JobPosting]:
+def _inspect_corpus(
+    args: argparse.Namespace, settings: Settings, resume: ResumeData, resume_path: Path
+) -> int:
+    """Plan a directory of saved pages for regression checks on the engine.
+
+    The plan cache is left out: a corpus run is there to show what the engine
+    decides now, not what it decided when a template was first seen.
+    """
+    from . import corpus
+
+    directory = Path(args.html_dir).expanduser()
+    if not directory.is_dir():
+        print(f"Not a directory: {directory}", file=sys.stderr)
+        return 2
+    pages = corpus.saved_pages(directory)
+    planner = corpus.PagePlanner(
+        resume,
+        ResumeValues.build(
+            resume,
+            resume_path=str(resume_path.resolve()),
+            profile=load_profile(settings.profile_path),
+        ),
+        threshold=settings.confidence_threshold,
+        strategy=settings.assignment_strategy,
+        parser=settings.html_parser,
+    )
+    workers = args.workers or os.cpu_count() or 1
+    records = corpus.plan_pages(pages, planner, workers=min(workers, len(pages) or 1))
+    if args.output:
+        with open(Path(args.output).expanduser(), "w", encoding="utf-8") as out:
+            totals = corpus.write_corpus_report(records, out)
+    else:
+        totals = corpus.write_corpus_report(records, sys.stdout)
+    print(
+        f"Planned {totals['pages']} page(s) in {totals['seconds']}s: "
+        f"{totals['filled']} filled, {totals['gaps']} missing, "
+        f"{totals['unrecognised_required']} required unrecognised, {totals['errors']} unreadable.",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _load_postings(args: argparse.Namespace, settings: Settings) -> list[JobPosting]:
     from . import sources
 
     if getattr(args, "html", None):
-        postings = sources.from_html_file(args.html)
+        postings = sources.from_html_file(args.html, settings.html_parser)
         return sources.filter_postings(
             postings, keywords=getattr(args, "keywords", None), location=args.location
         )
@@ -283,7 +358,7 @@ def command_apply(args: argparse.Namespace, settings: Settings) -> int:
     resume = parse_resume(settings.resume_path)
     print(render_resume_summary(resume))
 
-    postings = _load_postings(args)
+    postings = _load_postings(args, settings)
     tracker = Tracker(settings.database_path)
 
     if args.skip_seen:
@@ -315,10 +390,13 @@ def command_apply(args: argparse.Namespace, settings: Settings) -> int:
             print("HEADLESS is true, so you will not see it. Set HEADLESS=false in .env.")
 
     from .browser import managed_driver
-    from .form_filler import apply_to_job
+    from .form_filler import TYPEAHEAD_LATENCY, apply_to_job
 
     results: list[ApplicationResult] = []
     cover_letter = str(settings.cover_letter_path) if settings.cover_letter_path else ""
+    plan_cache = _plan_cache(settings)
+    # Built once for the whole batch rather than once per form.
+    values = ResumeValues.build(resume, resume_path=str(settings.resume_path.resolve()))
 
     try:
         with managed_driver(
@@ -332,8 +410,12 @@ def command_apply(args: argparse.Namespace, settings: Settings) -> int:
                     resume_path=str(settings.resume_path.resolve()),
                     cover_letter_path=cover_letter,
                     threshold=settings.confidence_threshold,
+                    strategy=settings.assignment_strategy,
+                    plan_cache=plan_cache,
+                    values=values,
                     timeout=settings.page_timeout,
                     mode=mode,
+                    batch=settings.batch_fill,
                 )
                 results.append(result)
                 print(render_result(result))
@@ -355,8 +437,16 @@ def command_apply(args: argparse.Namespace, settings: Settings) -> int:
     except KeyboardInterrupt:
         print("\nInterrupted. Recording what completed so far.", file=sys.stderr)
 
+    typeahead = TYPEAHEAD_LATENCY.summary()
+    if typeahead["waits"]:
+        print(
+            f"\nTypeahead waits: {typeahead['waits']}, {typeahead['seconds_waited']:.1f}s "
+            f"in all, {typeahead['seconds_saved']:.1f}s less than a fixed wait."
+        )
     if results:
-        report_path = write_json_report(results, settings.output_dir, resume)
+        report_path = write_json_report(
+            results, settings.output_dir, resume, timings={"typeahead": typeahead}
+        )
         print(f"\nRun report: {report_path}")
 
     counts = tracker.summary()
@@ -376,7 +466,7 @@ def command_tailor(args: argparse.Namespace, settings: Settings) -> int:
     print(render_resume_summary(resume))
 
     args.urls = None  # tailor has no --urls source
-    postings = _load_postings(args)[: args.limit]
+    postings = _load_postings(args, settings)[: args.limit]
     if not postings:
         print("\nNo postings matched.")
         return 0
@@ -661,8 +751,20 @@ def command_export(args: argparse.Namespace, settings: Settings) -> int:
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.command == "inspect" and not args.html_dir:
+        # Both would be silently ignored for a single page.
+        if args.workers is not None:
+            parser.error("--workers only applies to inspect --html-dir")
+        if args.output:
+            parser.error("--output only applies to inspect --html-dir")
+    if args.command == "inspect" and args.workers is not None and args.workers < 1:
+        parser.error("--workers must be 1 or more")
     configure_logging(verbose=args.verbose)
-    settings = _resolve_settings(args)
+    try:
+        settings = _resolve_settings(args)
+    except ValueError as exc:
+        print(f"Configuration error: {exc}", file=sys.stderr)
+        return 2
 
     handlers = {
         "parse": command_parse,
@@ -12,8 +12,10 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from .field_map import DEFAULT_CONFIDENCE_THRESHOLD
+from .extractors import DEFAULT_HTML_PARSER, HTML_PARSERS
+from .field_map import DEFAULT_CONFIDENCE_THRESHOLD, AssignmentStrategy
 from .paths import default_config_dir, find_config_file, resolve_data_path
+from .plan_cache import DEFAULT_MAX_PLANS
 
 
 def _env_bool(key: str, default: bool = False) -> bool:
@@ -23,6 +25,38 @@ def _env_bool(key: str, default: bool = False) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _env_int(key: str, default: int) -> int:
+    """A whole number of zero or more. Raises ``ValueError`` naming the setting otherwise.
+
+    Not silently defaulted: a PLAN_CACHE_SIZE of "-1" meant to turn the cache
+    off would otherwise leave it on at full size, with nothing said.
+    """
+    raw = os.getenv(key, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"{key} must be a whole number, not {raw!r}.") from None
+    if value < 0:
+        raise ValueError(f"{key} must be zero or more, not {raw!r}.")
+    return value
+
+
+def _env_choice(key: str, default: str, choices: tuple[str, ...]) -> str:
+    """One of ``choices``, in any case. Raises ``ValueError`` naming the setting otherwise.
+
+    Checked here rather than before a browser run: every command reads these,
+    and a typo should stop ``inspect`` before it prints half a report.
+    """
+    raw = os.getenv(key, "").strip().lower()
+    if not raw:
+        return default
+    if raw not in choices:
+        raise ValueError(f"Unsupported {key} {raw!r}. Use {' or '.join(choices)}.")
+    return raw
+
+
 def _env_float(key: str, default: float) -> float:
     raw = os.getenv(key)
     if raw is None or not raw.strip():
@@ -43,6 +77,8 @@ class Settings:
     headless: bool = False
     page_timeout: float = 15.0
     confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD
+    assignment_strategy: str = AssignmentStrategy.GREEDY.value
+    """``greedy`` or ``optimal``, see ``AssignmentStrategy``."""
     profile_path: Path = field(default_factory=lambda: Path("profile.json"))
     attach_port: int | None = None
     """Debugging port of a browser already open, when driving that instead."""
@@ -50,6 +86,17 @@ class Settings:
     """Where the browser keeps cookies, so a login survives between runs."""
     database_path: Path = field(default_factory=lambda: Path("applications.db"))
     output_dir: Path = field(default_factory=lambda: Path("runs"))
+    plan_cache_size: int = DEFAULT_MAX_PLANS
+    """How many matched form templates to remember. Zero turns the cache off."""
+    html_parser: str = DEFAULT_HTML_PARSER
+    """Tree builder for saved pages, see ``extractors.parse_html``."""
+    batch_fill: bool = True
+    """Set plain text values with one script per frame rather than typing them."""
+
+    @property
+    def plan_cache_path(self) -> Path:
+        """The plan cache lives beside the application tracker."""
+        return self.database_path.with_name("plan_cache.db")
 
     @classmethod
     def from_env(cls, env_file: str | Path | None = None) -> Settings:
@@ -76,6 +123,11 @@ class Settings:
             headless=_env_bool("HEADLESS", False),
             page_timeout=_env_float("PAGE_TIMEOUT", 15.0),
             confidence_threshold=_env_float("CONFIDENCE_THRESHOLD", DEFAULT_CONFIDENCE_THRESHOLD),
+            assignment_strategy=_env_choice(
+                "ASSIGNMENT_STRATEGY",
+                AssignmentStrategy.GREEDY.value,
+                tuple(strategy.value for strategy in AssignmentStrategy),
+            ),
             profile_path=Path(profile_raw).expanduser()
             if (profile_raw := os.getenv("PROFILE_PATH", "").strip())
             else profile_default,
@@ -91,6 +143,9 @@ class Settings:
                 os.getenv("DATABASE_PATH", "applications.db"), config_dir
             ),
             output_dir=resolve_data_path(os.getenv("OUTPUT_DIR", "runs"), config_dir),
+            plan_cache_size=_env_int("PLAN_CACHE_SIZE", DEFAULT_MAX_PLANS),
+            html_parser=_env_choice("HTML_PARSER", DEFAULT_HTML_PARSER, HTML_PARSERS),
+            batch_fill=_env_bool("BATCH_FILL", True),
         )
 
     def validate_for_browsing(self) -> list[str]:
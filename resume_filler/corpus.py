@@ -0,0 +1,204 @@
+"""Planning a whole directory of saved application pages at once.
+
+A regression corpus of a few hundred real ATS pages is how an engine change is
+checked before it ships, and scanning it one page at a time takes minutes. Here
+every page is extracted and planned in a pool of worker processes, with only a
+few pages in flight per worker, so the pool never holds the whole corpus in
+memory. The resume is built into a ``ResumeValues`` once and handed to each
+worker when it starts.
+
+The result is one JSON line per page, in path order whatever order the workers
+finish in, so two runs can be compared with an ordinary diff.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, TextIO
+
+from .extractors import DEFAULT_HTML_PARSER, fields_from_html
+from .field_map import DEFAULT_CONFIDENCE_THRESHOLD, AssignmentStrategy, ResumeValues, plan_fill
+from .models import FieldMatch, FillStatus, ResumeData
+from .vendors import detect_vendor
+
+logger = logging.getLogger(__name__)
+
+SAVED_PAGE_SUFFIXES = {".html", ".htm"}
+
+# Pages queued per worker beyond the one it is working on. Enough that a worker
+# never waits for the next page, few enough that a corpus of large saves is not
+# read into memory all at once.
+PAGES_IN_FLIGHT_PER_WORKER = 2
+
+
+def saved_pages(directory: str | Path) -> list[Path]:
+    """Every saved page under a directory, in path order.
+
+    A browser saves a page's iframes into a companion ``<page>_files`` folder.
+    Those documents are scanned through the page that embeds them, as
+    ``fields_from_html`` follows its frames, so they are not pages of their own.
+    """
+    root = Path(directory).expanduser()
+    return sorted(
+        path
+        for path in root.rglob("*")
+        if path.suffix.lower() in SAVED_PAGE_SUFFIXES
+        and path.is_file()
+        and not any(part.endswith("_files") for part in path.relative_to(root).parts[:-1])
+    )
+
+
+def plan_record(page: Path, matches: list[FieldMatch], vendor: str) -> dict[str, Any]:
+    """One page's plan, and the counts a corpus run is compared on."""
+    return {
+        "page": str(page),
+        "vendor": vendor,
+        "controls": len(matches),
+        "filled": sum(1 for m in matches if m.status is FillStatus.FILLED),
+        "gaps": sum(1 for m in matches if m.status is FillStatus.SKIPPED_NO_VALUE),
+        "unrecognised_required": sum(
+            1 for m in matches if m.status is FillStatus.SKIPPED_NO_MATCH and m.form_field.required
+        ),
+        "fields": [
+            {
+                "field": match.form_field.describe(),
+                "name": match.form_field.name,
+                "required": match.form_field.required,
+                "canonical": match.canonical,
+                "confidence": match.confidence,
+                "status": match.status.value,
+                "value": match.value,
+            }
+            for match in matches
+        ],
+    }
+
+
+# Set once in each worker by _start_worker, so the resume is sent to a worker
+# once rather than with every page.
+_worker_plan: Callable[[Path], dict[str, Any]] | None = None
+
+
+def _start_worker(plan: Callable[[Path], dict[str, Any]]) -> None:
+    global _worker_plan
+    _worker_plan = plan
+
+
+def _plan_in_worker(page: Path) -> dict[str, Any]:
+    if _worker_plan is None:
+        raise RuntimeError("Corpus worker was started without a planner")
+    return _worker_plan(page)
+
+
+class PagePlanner:
+    """Extracts and plans one saved page. Picklable, so a pool can run it."""
+
+    def __init__(
+        self,
+        resume: ResumeData,
+        values: ResumeValues,
+        *,
+        threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        strategy: AssignmentStrategy | str = AssignmentStrategy.GREEDY,
+        parser: str = DEFAULT_HTML_PARSER,
+    ) -> None:
+        self.resume = resume
+        self.values = values
+        self.threshold = threshold
+        self.strategy = strategy
+        self.parser = parser
+
+    def __call__(self, page: Path) -> dict[str, Any]:
+        """Plan one page. Any failure is recorded against the page, never raised.
+
+        A corpus is a few hundred pages, and one that trips the engine must not
+        cost the records of all the others.
+        """
+        try:
+            return self._plan(page)
+        except Exception as exc:  # noqa: BLE001 - one bad page must not end the run
+            logger.debug("Could not plan %s", page, exc_info=True)
+            return {"page": str(page), "error": f"{type(exc).__name__}: {exc}"}
+
+    def _plan(self, page: Path) -> dict[str, Any]:
+        started = time.perf_counter()
+        html = page.read_text(encoding="utf-8", errors="replace")
+        fields = fields_from_html(html, base_path=page, parser=self.parser)
+        extracted = time.perf_counter()
+        vendor = detect_vendor(html)
+        matches = plan_fill(
+            fields,
+            self.resume,
+            threshold=self.threshold,
+            strategy=self.strategy,
+            values=self.values,
+            vendor=vendor,
+        )
+        record = plan_record(page, matches, vendor)
+        record["seconds"] = {
+            "extract": round(extracted - started, 6),
+            "plan": round(time.perf_counter() - extracted, 6),
+        }
+        return record
+
+
+def plan_pages(
+    pages: Iterable[Path],
+    planner: Callable[[Path], dict[str, Any]],
+    *,
+    workers: int = 1,
+) -> Iterator[dict[str, Any]]:
+    """Plan each page, yielding records in the order the pages were given.
+
+    With ``workers`` above one the pages go to a process pool, no more than
+    ``PAGES_IN_FLIGHT_PER_WORKER`` per worker at a time.
+    """
+    if workers <= 1:
+        yield from (planner(page) for page in pages)
+        return
+
+    limit = workers * (1 + PAGES_IN_FLIGHT_PER_WORKER)
+    pending: deque[Future[dict[str, Any]]] = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_start_worker, initargs=(planner,)
+    ) as pool:
+        for page in pages:
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_plan_in_worker, page))
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_corpus_report(records: Iterable[dict[str, Any]], out: TextIO) -> dict[str, Any]:
+    """Write each record as a JSON line, then one line of totals, and return the totals.
+
+    ``records`` is usually ``plan_pages`` itself, so the elapsed time in the
+    totals covers the planning as well as the writing.
+    """
+    started = time.perf_counter()
+    totals: dict[str, Any] = {
+        "pages": 0,
+        "errors": 0,
+        "controls": 0,
+        "filled": 0,
+        "gaps": 0,
+        "unrecognised_required": 0,
+    }
+    for record in records:
+        out.write(json.dumps(record) + "\n")
+        totals["pages"] += 1
+        if "error" in record:
+            totals["errors"] += 1
+            continue
+        for key in ("controls", "filled", "gaps", "unrecognised_required"):
+            totals[key] += record[key]
+    totals["seconds"] = round(time.perf_counter() - started, 3)
+    out.write(json.dumps({"totals": totals}) + "\n")
+    return totals
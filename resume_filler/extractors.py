@@ -5,7 +5,8 @@ Two adapters exist and they must agree with each other:
 * ``fields_from_html`` parses a static HTML string with BeautifulSoup. Tests use
   it against saved fixtures of real application forms, so the matching engine
   can be exercised without launching a browser.
-* ``fields_from_driver`` walks a live Selenium page.
+* ``fields_from_driver`` walks a live Selenium page, or in Chromium reads it
+  from one DevTools snapshot (see ``snapshot``).
 
 Keeping label resolution in one place per adapter is the point. Label discovery
 is the single most error prone part of form automation, because forms in the
@@ -14,8 +15,13 @@ wild associate labels five different ways.
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
 import logging
 import re
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import cache
 from pathlib import Path
 from typing import Any
 from urllib.parse import unquote
@@ -42,6 +48,64 @@ CONTROL_SELECTOR = (
 
 MAX_FRAME_DEPTH = 3
 
+# Tree builders a saved page can be parsed with. html.parser ships with Python
+# and is the slowest bs4 offers; lxml parses a large saved page several times
+# faster but is an optional install. Either way the result is the same soup, so
+# CONTROL_SELECTOR and label resolution run unchanged on it.
+HTML_PARSERS = ("html.parser", "lxml")
+DEFAULT_HTML_PARSER = "html.parser"
+
+
+def parse_html(html: str, parser: str = DEFAULT_HTML_PARSER) -> BeautifulSoup:
+    """Parse a document with the named tree builder.
+
+    Raises ValueError for a name outside ``HTML_PARSERS``. Asking for lxml where
+    it is not installed falls back to html.parser with a warning, since a slow
+    scan is better than none.
+    """
+    if parser not in HTML_PARSERS:
+        raise ValueError(f"Unsupported HTML parser {parser!r}. Use one of {HTML_PARSERS}.")
+    if parser != DEFAULT_HTML_PARSER and not _parser_available(parser):
+        logger.warning("%s is not installed; parsing with %s", parser, DEFAULT_HTML_PARSER)
+        parser = DEFAULT_HTML_PARSER
+    return BeautifulSoup(html, parser)
+
+
+@cache
+def _parser_available(parser: str) -> bool:
+    return importlib.util.find_spec(parser) is not None
+
+
+# Regions of a saved page that can never hold a control or a label's text:
+# comments, scripts (including the JSON state React and Workday embed as
+# <script type="application/json">), stylesheets and inline SVG icons. They are
+# most of a saved Workday page by weight. One alternation, so a "<script" inside
+# a comment is consumed with the comment rather than opening a script.
+_NON_CONTENT = re.compile(
+    r"<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>|<svg\b[^>]*>.*?</svg\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_SVG_TEXT = re.compile(r"<(?:title|text)\b", re.IGNORECASE)
+
+
+def prune_html(html: str) -> str:
+    """Strip non-content regions from a page before it is parsed.
+
+    Building a tree for hundreds of kilobytes of script only to skip it again
+    costs more than the rest of the scan. An <svg> carrying a <title> or <text>
+    stays, because its words are part of any label wrapped around it. Each
+    region becomes a space rather than nothing, so text on either side does not
+    run together into one word.
+    """
+
+    def replace(match: re.Match[str]) -> str:
+        region = match.group(0)
+        if region[:4].lower() == "<svg" and _SVG_TEXT.search(region):
+            return region
+        return " "
+
+    return _NON_CONTENT.sub(replace, html)
+
 
 def _is_decorative(aria_hidden: str, element_type: str) -> bool:
     """Whether a control exists for the widget's plumbing, not for the applicant.
@@ -63,10 +127,14 @@ def _is_decorative(aria_hidden: str, element_type: str) -> bool:
 # or "education_1_school". All three carry the same information: which group,
 # and which row within it.
 _GROUP_PATTERNS = (
-    re.compile(r"^(?P<group>[A-Za-z][A-Za-z]*)-(?P<index>\d+)--(?P<field>.+)$"),
-    re.compile(r"^(?P<group>[A-Za-z_]+)\[(?P<index>\d+)\]\[?(?P<field>[A-Za-z_]+)\]?$"),
-    re.compile(r"^(?P<group>[A-Za-z]+(?:[A-Z][a-z]+)*)_(?P<index>\d+)_(?P<field>.+)$"),
+    r"(?P<group0>[A-Za-z][A-Za-z]*)-(?P<index0>\d+)--(?P<field0>.+)",
+    r"(?P<group1>[A-Za-z_]+)\[(?P<index1>\d+)\]\[?(?P<field1>[A-Za-z_]+)\]?",
+    r"(?P<group2>[A-Za-z]+(?:[A-Z][a-z]+)*)_(?P<index2>\d+)_(?P<field2>.+)",
 )
+# One pass over the identifier instead of one per pattern. Each alternative is
+# anchored at both ends and tried in the order above, so the first pattern that
+# matches wins, as it did when they were tried one at a time.
+_GROUP_IDENTIFIER = re.compile("|".join(f"^(?:{pattern})$" for pattern in _GROUP_PATTERNS))
 
 
 def parse_group(identifier: str) -> tuple[str, int]:
@@ -77,14 +145,16 @@ def parse_group(identifier: str) -> tuple[str, int]:
     text = (identifier or "").strip()
     if not text:
         return "", -1
-    for pattern in _GROUP_PATTERNS:
-        match = pattern.match(text)
-        if match:
-            try:
-                return match.group("group"), int(match.group("index"))
-            except (ValueError, IndexError):
-                continue
-    return "", -1
+    match = _GROUP_IDENTIFIER.match(text)
+    if match is None:
+        return "", -1
+    # The last group each alternative closes is its field<n>, which says which
+    # of the patterns matched.
+    which = str(match.lastgroup)[-1]
+    try:
+        return match.group(f"group{which}"), int(match.group(f"index{which}"))
+    except ValueError:
+        return "", -1
 
 
 DATE_PART_LABELS = {"month", "year", "day"}
@@ -102,22 +172,26 @@ def normalize_fields(fields: list[FormField]) -> list[FormField]:
       two spinbuttons whose only difference is an aria-label of "Month" or
       "Year", so both otherwise arrive labelled "From" and are indistinguishable.
     """
+    # Bucketed as they are parsed, so renumbering is one pass per group rather
+    # than a rescan of the whole form for each of them.
+    members: dict[str, list[FormField]] = {}
     for field in fields:
         group, index = parse_group(field.element_id)
         if not group:
             group, index = parse_group(field.name)
         field.group, field.group_index = group, index
+        if group:
+            members.setdefault(group, []).append(field)
 
         aria = field.aria_label.strip().lower()
         if aria in DATE_PART_LABELS and field.label and aria not in field.label.lower():
             field.label = f"{field.label} {field.aria_label.strip()}"
 
-    # Renumber each group's rows to 0, 1, 2 ... in the order they appear.
-    for group_name in {f.group for f in fields if f.group}:
-        members = [f for f in fields if f.group == group_name]
-        ordering = sorted({f.group_index for f in members})
+    # Renumber each group's rows to 0, 1, 2 ... in the order of the raw index.
+    for grouped in members.values():
+        ordering = sorted({field.group_index for field in grouped})
         remap = {original: position for position, original in enumerate(ordering)}
-        for field in members:
+        for field in grouped:
             field.group_index = remap[field.group_index]
 
     return fields
@@ -138,21 +212,88 @@ def _clean(text: Any) -> str:
 # --------------------------------------------------------------------------
 
 
-def _legend_for_html(element: Tag) -> str:
+@dataclass
+class LabelIndex:
+    """Everything label resolution looks up by id, gathered in one pass.
+
+    Searching the document for ``label[for=id]`` and for each
+    ``aria-labelledby`` target walked the whole tree once per control, so label
+    resolution grew with the square of the page. A saved Workday page runs to
+    hundreds of kilobytes and a thousand controls, and spent most of its scan
+    there. Both maps keep the first match in document order, as a search would.
+    """
+
+    labels_for: dict[str, Tag]
+    by_id: dict[str, Tag]
+    legends: dict[int, str]
+    containers: dict[int, list[tuple[str, str]]]
+
+    @classmethod
+    def build(cls, soup: BeautifulSoup) -> LabelIndex:
+        labels_for: dict[str, Tag] = {}
+        by_id: dict[str, Tag] = {}
+        for tag in soup.find_all(True):
+            element_id = tag.get("id")
+            if isinstance(element_id, str):
+                by_id.setdefault(element_id, tag)
+            bound_to = tag.get("for") if tag.name == "label" else None
+            if isinstance(bound_to, str):
+                labels_for.setdefault(bound_to, tag)
+        return cls(labels_for=labels_for, by_id=by_id, legends={}, containers={})
+
+    def label_for(self, element_id: str) -> Tag | None:
+        """The first <label> whose ``for`` names this id."""
+        return self.labels_for.get(element_id)
+
+    def element(self, element_id: str) -> Tag | None:
+        """The first element carrying this id."""
+        return self.by_id.get(element_id)
+
+    def legend(self, element: Tag) -> str:
+        """Text of the <legend> for the nearest enclosing <fieldset>.
+
+        Worked out once per fieldset, since a radio group asks once per option.
+        """
+        fieldset = element.find_parent("fieldset")
+        if fieldset is None:
+            return ""
+        key = id(fieldset)
+        if key not in self.legends:
+            legend = fieldset.find("legend")
+            self.legends[key] = _clean(legend.get_text(" ")) if legend else ""
+        return self.legends[key]
+
+    def candidates(self, container: Tag) -> list[tuple[str, str]]:
+        """Label-like elements inside a container, as ``(for, text)`` pairs.
+
+        Every control sharing a container asks the same question of it. A Lever
+        page nests dozens of custom questions in one list, so selecting afresh
+        for each control rescanned the same subtree dozens of times. Which
+        candidate wins depends on the control's own id, so only the selection
+        and the text are kept here. Empty candidates never win and are dropped.
+        """
+        key = id(container)
+        if key not in self.containers:
+            found = []
+            for candidate in container.select(_LABEL_LIKE_SELECTOR):
+                text = _clean(candidate.get_text(" "))
+                if text:
+                    bound_to = candidate.get("for")
+                    found.append((str(bound_to) if bound_to else "", text))
+            self.containers[key] = found
+        return self.containers[key]
+
+
+def _legend_for_html(element: Tag, labels: LabelIndex) -> str:
     """Text of the <legend> for the nearest enclosing <fieldset>."""
-    fieldset = element.find_parent("fieldset")
-    if fieldset:
-        legend = fieldset.find("legend")
-        if legend:
-            return _clean(legend.get_text(" "))
-    return ""
+    return labels.legend(element)
 
 
-def _label_for_html(element: Tag, soup: BeautifulSoup, field_type: str = "") -> str:
+def _label_for_html(element: Tag, labels: LabelIndex, field_type: str = "") -> str:
     """Resolve the visible label for a control, trying each association in turn."""
     element_id = element.get("id")
     if element_id:
-        explicit = soup.find("label", attrs={"for": element_id})
+        explicit = labels.label_for(str(element_id))
         if explicit:
             return _clean(explicit.get_text(" "))
 
@@ -160,7 +301,7 @@ def _label_for_html(element: Tag, soup: BeautifulSoup, field_type: str = "") ->
     if labelled_by:
         parts = []
         for token in str(labelled_by).split():
-            target = soup.find(id=token)
+            target = labels.element(token)
             if target:
                 parts.append(_clean(target.get_text(" ")))
         if parts:
@@ -170,7 +311,7 @@ def _label_for_html(element: Tag, soup: BeautifulSoup, field_type: str = "") ->
     # while the <legend> holds the actual question. The question is what
     # identifies the field, so it takes priority for these controls only.
     if field_type in {"radio", "checkbox"}:
-        legend = _legend_for_html(element)
+        legend = _legend_for_html(element, labels)
         if legend:
             return legend
 
@@ -179,11 +320,11 @@ def _label_for_html(element: Tag, soup: BeautifulSoup, field_type: str = "") ->
     if ancestor:
         return _clean(ancestor.get_text(" "))
 
-    legend = _legend_for_html(element)
+    legend = _legend_for_html(element, labels)
     if legend:
         return legend
 
-    return _container_label(element)
+    return _container_label(element, labels)
 
 
 # Many ATS render a label as a styled div rather than a <label>. Lever writes
@@ -191,7 +332,7 @@ def _label_for_html(element: Tag, soup: BeautifulSoup, field_type: str = "") ->
 _LABEL_LIKE_SELECTOR = "label, legend, [class*='label']"
 
 
-def _container_label(element: Tag, max_levels: int = 4) -> str:
+def _container_label(element: Tag, labels: LabelIndex, max_levels: int = 4) -> str:
     """Find the label text inside the control's own container.
 
     Searching the whole document backwards for the nearest <label> is what a
@@ -208,14 +349,11 @@ def _container_label(element: Tag, max_levels: int = 4) -> str:
         parent = node.parent if node is not None else None
         if parent is None or not isinstance(parent, Tag):
             return ""
-        for candidate in parent.select(_LABEL_LIKE_SELECTOR):
+        for bound_to, text in labels.candidates(parent):
             # A label bound to a different control is that control's, not ours.
-            bound_to = candidate.get("for")
             if bound_to and bound_to != element.get("id"):
                 continue
-            text = _clean(candidate.get_text(" "))
-            if text:
-                return text
+            return text
         node = parent
     return ""
 
@@ -267,19 +405,123 @@ def _resolve_local_frame(base_dir: Path, src: str) -> Path | None:
         return None
 
 
+# Upper bound on the saved frame documents FrameCache keeps scans of, counted by
+# their size on disk. Far more than any one page embeds; a corpus run reuses a
+# handful of careers-site frames across hundreds of pages. Only the controls'
+# descriptors are kept, not the parsed documents, which are several times the
+# size of their source.
+FRAME_CACHE_BYTES = 64 * 1024 * 1024
+
+_FRAME_TAG = re.compile(r"<i?frame\b", re.IGNORECASE)
+
+
+class FrameCache:
+    """Scans of saved frame documents, so each distinct one is scanned once.
+
+    Careers sites embed the same frame more than once on a page, and a corpus
+    of saved pages from one site repeats the same ``_files`` documents page
+    after page. A file is read once per change on disk, and its scan is keyed by
+    a hash of its content, so a copy of the same frame in another folder is not
+    scanned again either. The folder still forms part of the key when the frame
+    has frames of its own, since those resolve against it.
+
+    A scan's frame paths are relative to the frame document. Each occurrence is
+    handed fresh copies prefixed with its own position, so the paths still line
+    up with what Selenium switches to.
+
+    The copies have no ``handle``. A saved page is only ever planned, never
+    filled, and a handle into the parse tree would keep the whole tree alive for
+    as long as the scan is cached.
+    """
+
+    def __init__(self, max_bytes: int = FRAME_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._scans: OrderedDict[tuple[str, str, int, str], tuple[int, list[FormField]]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+
+    def scan(self, document: Path, depth: int, parser: str) -> list[FormField]:
+        """Controls in a saved frame document and the frames below it, as copies."""
+        try:
+            stat = document.stat()
+            identity = (str(document.resolve()), stat.st_mtime_ns, stat.st_size)
+            digest = self._digests.get(identity)
+            html = None
+            if digest is None:
+                html = document.read_text(encoding="utf-8", errors="replace")
+                digest = hashlib.sha256(html.encode("utf-8")).hexdigest()
+                self._digests[identity] = digest
+        except OSError:
+            logger.debug("Could not read saved frame %s", document)
+            return []
+
+        folder = str(document.parent.resolve())
+        key = next(
+            (
+                k
+                for k in ((digest, "", depth, parser), (digest, folder, depth, parser))
+                if k in self._scans
+            ),
+            None,
+        )
+        if key is not None:
+            self._scans.move_to_end(key)
+            scanned = self._scans[key][1]
+        else:
+            if html is None:
+                try:
+                    html = document.read_text(encoding="utf-8", errors="replace")
+                except OSError:
+                    logger.debug("Could not read saved frame %s", document)
+                    return []
+            scanned = [
+                replace(form_field, handle=None)
+                for form_field in _collect_from_document(html, document.parent, depth, parser)
+            ]
+            nests = depth > 0 and _FRAME_TAG.search(html) is not None
+            self._remember((digest, folder if nests else "", depth, parser), stat.st_size, scanned)
+        return [replace(form_field) for form_field in scanned]
+
+    def _remember(
+        self, key: tuple[str, str, int, str], size: int, scanned: list[FormField]
+    ) -> None:
+        if size > self.max_bytes:
+            return
+        self._scans[key] = (size, scanned)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (evicted, _) = self._scans.popitem(last=False)
+            self._bytes -= evicted
+
+    def clear(self) -> None:
+        self._digests.clear()
+        self._scans.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._scans)
+
+
+FRAME_CACHE = FrameCache()
+
+
 def _collect_from_document(
     html: str,
     base_dir: Path | None,
-    path: tuple[int, ...],
-    max_depth: int,
-    out: list[FormField],
-) -> None:
-    """Scan one document, then descend into any locally saved iframes."""
-    soup = BeautifulSoup(html, "html.parser")
-    out.extend(_fields_from_soup(soup, path))
+    depth: int,
+    parser: str = DEFAULT_HTML_PARSER,
+) -> list[FormField]:
+    """Scan one document, then descend ``depth`` levels into locally saved iframes.
 
-    if base_dir is None or len(path) >= max_depth:
-        return
+    Frame paths in the result are relative to this document.
+    """
+    soup = parse_html(prune_html(html), parser)
+    fields = _fields_from_soup(soup)
+
+    if base_dir is None or depth <= 0:
+        return fields
 
     # Enumerate every frame, including ones that cannot be resolved, so the
     # indices stay aligned with the positions Selenium would switch to.
@@ -290,12 +532,10 @@ def _collect_from_document(
         child = _resolve_local_frame(base_dir, str(src))
         if child is None:
             continue
-        try:
-            child_html = child.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            logger.debug("Could not read saved frame %s", child)
-            continue
-        _collect_from_document(child_html, child.parent, (*path, index), max_depth, out)
+        for form_field in FRAME_CACHE.scan(child, depth - 1, parser):
+            form_field.frame_path = (index, *form_field.frame_path)
+            fields.append(form_field)
+    return fields
 
 
 def fields_from_html(
@@ -303,6 +543,7 @@ def fields_from_html(
     *,
     base_path: str | Path | None = None,
     max_depth: int = MAX_FRAME_DEPTH,
+    parser: str = DEFAULT_HTML_PARSER,
 ) -> list[FormField]:
     """Extract every fillable control from an HTML document.
 
@@ -314,20 +555,21 @@ def fields_from_html(
     iframes into their saved companion documents. iCIMS puts the entire
     application inside an iframe, so without this a saved iCIMS page yields
     only the site search box while the real 61-control form sits one file away.
+
+    ``parser`` picks the tree builder, see ``parse_html``.
     """
-    fields: list[FormField] = []
     base_dir: Path | None = None
     if base_path is not None:
         given = Path(base_path).expanduser()
         base_dir = given.parent if given.is_file() else given
 
-    _collect_from_document(html, base_dir, (), max_depth, fields)
-    return normalize_fields(fields)
+    return normalize_fields(_collect_from_document(html, base_dir, max_depth, parser))
 
 
 def _fields_from_soup(soup: BeautifulSoup, path: tuple[int, ...] = ()) -> list[FormField]:
     """Collect the controls in a single parsed document."""
     fields: list[FormField] = []
+    labels = LabelIndex.build(soup)
 
     # The same selector the Selenium adapter uses, so the two adapters cannot
     # drift apart on which elements count as controls.
@@ -363,7 +605,7 @@ def _fields_from_soup(soup: BeautifulSoup, path: tuple[int, ...] = ()) -> list[F
                 field_type=field_type,
                 name=_clean(element.get("name")),
                 element_id=_clean(element.get("id")),
-                label=_label_for_html(element, soup, field_type),
+                label=_label_for_html(element, labels, field_type),
                 aria_label=_clean(element.get("aria-label")),
                 placeholder=_clean(element.get("placeholder")),
                 autocomplete=_clean(element.get("autocomplete")),
@@ -383,65 +625,70 @@ def _fields_from_soup(soup: BeautifulSoup, path: tuple[int, ...] = ()) -> list[F
 # Selenium adapter
 # --------------------------------------------------------------------------
 
-_LABEL_SCRIPT = """
-const el = arguments[0];
-const clean = (s) => (s || '').replace(/\\s+/g, ' ').trim();
-// Resolve against the element's own root. For a control inside a shadow tree
-// that root is the shadow root, and querying `document` would find nothing,
-// because label associations do not cross the shadow boundary.
-const root = el.getRootNode ? el.getRootNode() : document;
-const byId = (id) => (root.getElementById
-  ? root.getElementById(id)
-  : root.querySelector(`#${CSS.escape(id)}`));
-if (el.id) {
-  const explicit = root.querySelector(`label[for="${CSS.escape(el.id)}"]`);
-  if (explicit) return clean(explicit.innerText);
-}
-const labelledBy = el.getAttribute('aria-labelledby');
-if (labelledBy) {
-  const parts = labelledBy.split(/\\s+/)
-    .map(byId)
-    .filter(Boolean)
-    .map((n) => clean(n.innerText));
-  if (parts.length) return clean(parts.join(' '));
-}
-const legendText = () => {
-  const fieldset = el.closest('fieldset');
-  if (!fieldset) return '';
-  const legend = fieldset.querySelector('legend');
-  return legend ? clean(legend.innerText) : '';
-};
-// For radios and checkboxes the wrapping label is the option text ("Yes") while
-// the legend is the question. The question identifies the field.
-const type = (el.getAttribute('type') || '').toLowerCase();
-if (type === 'radio' || type === 'checkbox') {
+# Resolves the visible label for a live control. Shared by the label lookup
+# and the bulk scan, so the two live paths cannot drift apart as well.
+_LABEL_FUNCTION = """
+const labelOf = (el) => {
+  const clean = (s) => (s || '').replace(/\\s+/g, ' ').trim();
+  // Resolve against the element's own root. For a control inside a shadow tree
+  // that root is the shadow root, and querying `document` would find nothing,
+  // because label associations do not cross the shadow boundary.
+  const root = el.getRootNode ? el.getRootNode() : document;
+  const byId = (id) => (root.getElementById
+    ? root.getElementById(id)
+    : root.querySelector(`#${CSS.escape(id)}`));
+  if (el.id) {
+    const explicit = root.querySelector(`label[for="${CSS.escape(el.id)}"]`);
+    if (explicit) return clean(explicit.innerText);
+  }
+  const labelledBy = el.getAttribute('aria-labelledby');
+  if (labelledBy) {
+    const parts = labelledBy.split(/\\s+/)
+      .map(byId)
+      .filter(Boolean)
+      .map((n) => clean(n.innerText));
+    if (parts.length) return clean(parts.join(' '));
+  }
+  const legendText = () => {
+    const fieldset = el.closest('fieldset');
+    if (!fieldset) return '';
+    const legend = fieldset.querySelector('legend');
+    return legend ? clean(legend.innerText) : '';
+  };
+  // For radios and checkboxes the wrapping label is the option text ("Yes") while
+  // the legend is the question. The question identifies the field.
+  const type = (el.getAttribute('type') || '').toLowerCase();
+  if (type === 'radio' || type === 'checkbox') {
+    const legend = legendText();
+    if (legend) return legend;
+  }
+  const ancestor = el.closest('label');
+  if (ancestor) return clean(ancestor.innerText);
   const legend = legendText();
   if (legend) return legend;
-}
-const ancestor = el.closest('label');
-if (ancestor) return clean(ancestor.innerText);
-const legend = legendText();
-if (legend) return legend;
-// Container search, mirroring _container_label in the static adapter. Many ATS
-// render a label as a styled div; Lever writes <div class="application-label">
-// for every custom question. Without this the live scan returns 14 unlabelled
-// required controls on a real Lever page while the static scan labels them all.
-let node = el;
-for (let depth = 0; depth < 4; depth++) {
-  const parent = node.parentElement;
-  if (!parent) break;
-  const candidates = parent.querySelectorAll('label, legend, [class*="label"]');
-  for (const candidate of candidates) {
-    const boundTo = candidate.getAttribute('for');
-    if (boundTo && boundTo !== el.id) continue;
-    const text = clean(candidate.innerText || candidate.textContent);
-    if (text) return text;
+  // Container search, mirroring _container_label in the static adapter. Many ATS
+  // render a label as a styled div; Lever writes <div class="application-label">
+  // for every custom question. Without this the live scan returns 14 unlabelled
+  // required controls on a real Lever page while the static scan labels them all.
+  let node = el;
+  for (let depth = 0; depth < 4; depth++) {
+    const parent = node.parentElement;
+    if (!parent) break;
+    const candidates = parent.querySelectorAll('label, legend, [class*="label"]');
+    for (const candidate of candidates) {
+      const boundTo = candidate.getAttribute('for');
+      if (boundTo && boundTo !== el.id) continue;
+      const text = clean(candidate.innerText || candidate.textContent);
+      if (text) return text;
+    }
+    node = parent;
   }
-  node = parent;
-}
-return '';
+  return '';
+};
 """
 
+_LABEL_SCRIPT = _LABEL_FUNCTION + "return labelOf(arguments[0]);\n"
+
 
 def switch_to_frame_path(driver: Any, path: tuple[int, ...]) -> None:
     """Move the driver into the browsing context identified by ``path``.
@@ -454,6 +701,68 @@ def switch_to_frame_path(driver: Any, path: tuple[int, ...]) -> None:
         driver.switch_to.frame(index)
 
 
+class FrameCursor:
+    """Moves a driver between frames by the shortest route, remembering where it is.
+
+    ``switch_to_frame_path`` goes back to the top document and down again on
+    every call, so visiting each frame of an embedded iCIMS board two or three
+    frames deep cost that many switches per frame. A cursor steps up with
+    ``parent_frame`` and down into children from wherever the driver already is,
+    or starts from the top when that is shorter.
+
+    Selenium cannot be asked which frame it is in, so a cursor only knows while
+    every switch goes through it. Make one per scan or fill; it starts out not
+    knowing and walks from the top the first time. Any failed step is retried
+    by that same walk, which raises if the frame really is gone.
+    """
+
+    def __init__(self, driver: Any) -> None:
+        self.driver = driver
+        self.path: tuple[int, ...] | None = None
+
+    def move_to(self, path: tuple[int, ...]) -> None:
+        from selenium.common.exceptions import WebDriverException
+
+        if path == self.path:
+            return
+        try:
+            self._step(path)
+        except WebDriverException:
+            logger.debug("Could not step from %s to %s, walking from the top", self.path, path)
+            self.path = None
+            switch_to_frame_path(self.driver, path)
+        self.path = path
+
+    def _step(self, path: tuple[int, ...]) -> None:
+        here = self.path
+        if here is None:
+            switch_to_frame_path(self.driver, path)
+            return
+        shared = 0
+        for mine, theirs in zip(here, path, strict=False):
+            if mine != theirs:
+                break
+            shared += 1
+        ups = len(here) - shared
+        # Stepping up costs a switch per level; the top is one switch away.
+        if ups <= shared:
+            for _ in range(ups):
+                self.driver.switch_to.parent_frame()
+            for index in path[shared:]:
+                self.driver.switch_to.frame(index)
+        else:
+            switch_to_frame_path(self.driver, path)
+
+
+def _return_to_top(driver: Any) -> None:
+    from selenium.common.exceptions import WebDriverException
+
+    try:
+        driver.switch_to.default_content()
+    except WebDriverException:
+        logger.debug("Could not return to the top document", exc_info=True)
+
+
 def _is_combobox(element: Any, tag: str) -> bool:
     """Live-page counterpart of ``_is_combobox_tag``. Keep the two in step."""
     role = (element.get_attribute("role") or "").lower()
@@ -475,30 +784,93 @@ def _is_combobox(element: Any, tag: str) -> bool:
 # one. Nothing here works around that, and no browser API allows it. A form
 # built entirely from closed components will simply report no fields, which the
 # caller surfaces rather than silently treating as an empty form.
-_SHADOW_SCAN_SCRIPT = """
-const selector = arguments[0];
-const maxDepth = arguments[1];
-const found = [];
-let tooDeep = 0;
-
-const walk = (root, depth) => {
-  if (depth > maxDepth) { tooDeep += 1; return; }
-  let matches = [];
-  try { matches = root.querySelectorAll(selector); } catch (e) { return; }
-  for (const el of matches) found.push(el);
-  let hosts = [];
-  try { hosts = root.querySelectorAll('*'); } catch (e) { return; }
-  for (const host of hosts) {
-    if (host.shadowRoot) walk(host.shadowRoot, depth + 1);
-  }
+_SHADOW_WALK_FUNCTION = """
+const collect = (selector, maxDepth) => {
+  const found = [];
+  let tooDeep = 0;
+
+  const walk = (root, depth) => {
+    if (depth > maxDepth) { tooDeep += 1; return; }
+    let matches = [];
+    try { matches = root.querySelectorAll(selector); } catch (e) { return; }
+    for (const el of matches) found.push(el);
+    let hosts = [];
+    try { hosts = root.querySelectorAll('*'); } catch (e) { return; }
+    for (const host of hosts) {
+      if (host.shadowRoot) walk(host.shadowRoot, depth + 1);
+    }
+  };
+
+  walk(document, 0);
+  return [found, tooDeep];
 };
-
-walk(document, 0);
-return [found, tooDeep];
 """
 
+_SHADOW_SCAN_SCRIPT = _SHADOW_WALK_FUNCTION + "return collect(arguments[0], arguments[1]);\n"
+
 SHADOW_MAX_DEPTH = 5
 
+# Everything the scan reads from every control, in one round trip per browsing
+# context. Asking the driver instead costs a dozen calls per control: the tag,
+# nine attributes, visibility, the label script, then every <option> of a
+# select, so a 60-control iCIMS form took several hundred before planning could
+# start. The script only reports. Deciding what counts as a fillable control
+# stays in Python, where the fallback shares it.
+_DESCRIBE_FUNCTION = """
+const attr = (el, name) => el.getAttribute(name) || '';
+// Mirrors _is_combobox.
+const isCombobox = (el, tag) => {
+  const role = attr(el, 'role').toLowerCase();
+  if (role === 'combobox' || role === 'listbox') return true;
+  if (attr(el, 'aria-autocomplete').toLowerCase() === 'list') return true;
+  if (tag === 'input' || tag === 'select' || tag === 'textarea') return false;
+  return attr(el, 'aria-haspopup').toLowerCase() === 'listbox';
+};
+// The parts of WebDriver's is_displayed that decide anything on a form: not
+// rendered, hidden or transparent through CSS, or taking up no space at all.
+const shown = (el) => {
+  if (el.checkVisibility
+      && !el.checkVisibility({checkOpacity: true, checkVisibilityCSS: true})) {
+    return false;
+  }
+  const style = getComputedStyle(el);
+  if (style.display === 'none' || style.visibility === 'hidden') return false;
+  if (style.opacity === '0') return false;
+  const rect = el.getBoundingClientRect();
+  return rect.width > 0 && rect.height > 0;
+};
+const describe = (el) => {
+  const tag = el.tagName.toLowerCase();
+  return {
+    tag,
+    type: String(el.type || attr(el, 'type') || 'text').toLowerCase(),
+    name: attr(el, 'name'),
+    id: el.id || '',
+    ariaLabel: attr(el, 'aria-label'),
+    placeholder: attr(el, 'placeholder'),
+    autocomplete: attr(el, 'autocomplete'),
+    accept: attr(el, 'accept'),
+    required: el.hasAttribute('required')
+      || attr(el, 'aria-required').toLowerCase() === 'true',
+    ariaHidden: attr(el, 'aria-hidden'),
+    displayed: shown(el),
+    combobox: isCombobox(el, tag),
+    label: labelOf(el),
+    options: tag === 'select' ? Array.from(el.options, (option) => option.text) : [],
+  };
+};
+"""
+
+_BULK_SCAN_SCRIPT = (
+    _SHADOW_WALK_FUNCTION
+    + _LABEL_FUNCTION
+    + _DESCRIBE_FUNCTION
+    + """
+const [found, tooDeep] = collect(arguments[0], arguments[1]);
+return [found, found.map(describe), tooDeep];
+"""
+)
+
 
 def _elements_in_context(driver: Any, selector: str) -> list[Any]:
     """Find controls in this context, including inside open shadow roots.
@@ -515,15 +887,97 @@ def _elements_in_context(driver: Any, selector: str) -> list[Any]:
         logger.debug("Shadow-aware scan failed, falling back to a flat query", exc_info=True)
         return list(driver.find_elements(By.CSS_SELECTOR, selector))
 
+    _report_too_deep(too_deep)
+    return list(found or [])
+
+
+def _report_too_deep(too_deep: int) -> None:
     if too_deep:
         logger.info(
             "Stopped descending at %d shadow root(s) beyond depth %d", too_deep, SHADOW_MAX_DEPTH
         )
-    return list(found or [])
 
 
-def _scan_context(driver: Any, path: tuple[int, ...]) -> list[FormField]:
-    """Collect controls in the browsing context the driver is currently in."""
+def _describe_controls(driver: Any, selector: str) -> list[tuple[Any, dict[str, Any]]] | None:
+    """Every control in this context paired with its descriptor, from one script.
+
+    None when the script cannot run or returns something unexpected, which
+    tells the caller to ask the driver about each element instead.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    try:
+        found, described, too_deep = driver.execute_script(
+            _BULK_SCAN_SCRIPT, selector, SHADOW_MAX_DEPTH
+        )
+    except (WebDriverException, ValueError, TypeError):
+        logger.debug("Bulk scan failed, describing each control separately", exc_info=True)
+        return None
+    if not isinstance(found, list) or not isinstance(described, list):
+        logger.debug("Bulk scan returned an unexpected shape, describing each control separately")
+        return None
+    if len(found) != len(described):
+        logger.debug("Bulk scan paired %d controls with %d descriptors", len(found), len(described))
+        return None
+    _report_too_deep(too_deep)
+    return list(zip(found, described, strict=True))
+
+
+def _scan_context(
+    driver: Any,
+    path: tuple[int, ...],
+    described: list[tuple[Any, dict[str, Any]]] | None = None,
+) -> list[FormField]:
+    """Collect controls in the browsing context the driver is currently in.
+
+    One script describes every control at once. Only a page that will not run
+    it is scanned an element at a time. The CDP snapshot scan passes in
+    descriptors it built without a script, for the same filtering.
+    """
+    if described is None:
+        described = _describe_controls(driver, CONTROL_SELECTOR)
+    if described is None:
+        return _scan_each_element(driver, path)
+
+    fields: list[FormField] = []
+    for element, control in described:
+        tag = _clean(control.get("tag")).lower()
+        field_type = (_clean(control.get("type")) or "text").lower()
+        if tag == "input" and field_type in IGNORED_INPUT_TYPES:
+            continue
+        if _is_decorative(_clean(control.get("ariaHidden")), field_type):
+            continue
+        # File inputs are routinely hidden behind a styled button, so they are
+        # the one control we accept while not displayed.
+        if not control.get("displayed") and field_type != "file":
+            continue
+        combobox = bool(control.get("combobox"))
+        if tag not in {"input", "select", "textarea"} and not combobox:
+            continue
+
+        fields.append(
+            FormField(
+                tag=tag,
+                field_type=field_type if tag == "input" else tag,
+                name=_clean(control.get("name")),
+                element_id=_clean(control.get("id")),
+                label=_clean(control.get("label")),
+                aria_label=_clean(control.get("ariaLabel")),
+                placeholder=_clean(control.get("placeholder")),
+                autocomplete=_clean(control.get("autocomplete")),
+                accept=_clean(control.get("accept")),
+                required=bool(control.get("required")),
+                options=[_clean(option) for option in control.get("options") or []],
+                frame_path=path,
+                widget="combobox" if combobox else "native",
+                handle=element,
+            )
+        )
+    return fields
+
+
+def _scan_each_element(driver: Any, path: tuple[int, ...]) -> list[FormField]:
+    """``_scan_context`` for a page that blocks scripts, a dozen calls per control."""
     from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
     from selenium.webdriver.common.by import By
 
@@ -583,6 +1037,37 @@ def _scan_context(driver: Any, path: tuple[int, ...]) -> list[FormField]:
     return fields
 
 
+def _walk_frames(
+    driver: Any,
+    path: tuple[int, ...],
+    max_depth: int,
+    fields: list[FormField],
+    cursor: FrameCursor,
+) -> None:
+    """Scan the context the driver is in, at ``path``, then every frame below it.
+
+    Frames are entered by index through ``cursor``, which must be at ``path``.
+    """
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.common.by import By
+
+    fields.extend(_scan_context(driver, path))
+    if len(path) >= max_depth:
+        return
+    frame_count = len(driver.find_elements(By.CSS_SELECTOR, "iframe, frame"))
+    for index in range(frame_count):
+        try:
+            cursor.move_to((*path, index))
+        except WebDriverException:
+            logger.debug("Could not enter frame %d at path %s", index, path)
+            continue
+        try:
+            _walk_frames(driver, (*path, index), max_depth, fields, cursor)
+        except WebDriverException:
+            # A cross-origin frame denies access. That is expected, not fatal.
+            logger.debug("Skipped inaccessible frame %d at path %s", index, path)
+
+
 def fields_from_driver(driver: Any, max_depth: int = MAX_FRAME_DEPTH) -> list[FormField]:
     """Extract every visible fillable control, descending into nested iframes.
 
@@ -590,39 +1075,23 @@ def fields_from_driver(driver: Any, max_depth: int = MAX_FRAME_DEPTH) -> list[Fo
     either, and attempting to do so is a reliable way to raise
     ``ElementNotInteractableException``.
 
+    Chrome and Edge are read from one DevTools snapshot of the whole page (see
+    ``snapshot``); Firefox, or a snapshot that cannot be read, gets the walk
+    through each frame.
+
     The driver is left in the top document when this returns.
     """
-    from selenium.common.exceptions import WebDriverException
-    from selenium.webdriver.common.by import By
-
-    fields: list[FormField] = []
-
-    def scan(path: tuple[int, ...]) -> None:
-        fields.extend(_scan_context(driver, path))
-        if len(path) >= max_depth:
-            return
-        frame_count = len(driver.find_elements(By.CSS_SELECTOR, "iframe, frame"))
-        for index in range(frame_count):
-            try:
-                switch_to_frame_path(driver, path)
-                driver.switch_to.frame(index)
-            except WebDriverException:
-                logger.debug("Could not enter frame %d at path %s", index, path)
-                continue
-            try:
-                scan((*path, index))
-            except WebDriverException:
-                # A cross-origin frame denies access. That is expected, not fatal.
-                logger.debug("Skipped inaccessible frame %d at path %s", index, path)
+    from .snapshot import fields_from_snapshot
 
+    cursor = FrameCursor(driver)
     try:
-        switch_to_frame_path(driver, ())
-        scan(())
+        cursor.move_to(())
+        fields = fields_from_snapshot(driver, max_depth, cursor)
+        if fields is None:
+            fields = []
+            _walk_frames(driver, (), max_depth, fields, cursor)
     finally:
-        try:
-            driver.switch_to.default_content()
-        except WebDriverException:
-            logger.debug("Could not return to the top document", exc_info=True)
+        _return_to_top(driver)
 
     normalize_fields(fields)
     groups = {f.group for f in fields if f.group}
@@ -633,3 +1102,260 @@ def fields_from_driver(driver: Any, max_depth: int = MAX_FRAME_DEPTH) -> list[Fo
         f", repeating groups: {sorted(groups)}" if groups else "",
     )
     return fields
+
+
+# Watches a browsing context for controls coming and going after a scan. A
+# wizard step or a conditional question usually swaps a small part of the page,
+# so the filler can read just those controls rather than scan everything again.
+#
+# Anything that adds, removes or restyles a node marks it. The marks are only
+# searched for controls when the filler asks, so a page busy re-rendering pays
+# for a set insertion per mutation and nothing more. A control counts as known
+# once it has been reported while visible, which is what lets a hidden
+# conditional question be reported when it is finally shown. Open shadow roots
+# are observed as they are found, since an observer on the document does not
+# see inside them. A frame being added or removed cannot be followed from here
+# at all and is reported, so the caller scans the page again.
+#
+# A known control is remembered with the parts of its description the planner
+# reads. React keeps the same <input> from one wizard step to the next and only
+# changes its name, id or label, so a control whose description has changed is
+# reported as removed and added again. Its own attributes mark it directly;
+# text changing anywhere, which is how a label is rewritten, has every known
+# control described again when the changes are read.
+_WATCH_FUNCTION = """
+const controlsUnder = (node, selector, maxDepth, observe) => {
+  const found = [];
+  const visit = (root, depth) => {
+    if (depth > maxDepth) return;
+    if (root.matches && root.matches(selector)) found.push(root);
+    let matches = [];
+    let hosts = [];
+    try {
+      matches = root.querySelectorAll(selector);
+      hosts = root.querySelectorAll('*');
+    } catch (e) { return; }
+    for (const el of matches) found.push(el);
+    const roots = [...hosts, root].filter((host) => host.shadowRoot);
+    for (const host of roots) {
+      observe(host.shadowRoot);
+      visit(host.shadowRoot, depth + 1);
+    }
+  };
+  visit(node, 0);
+  return found;
+};
+const worthReporting = (el) => shown(el) || el.type === 'file';
+const signature = (d) => JSON.stringify([
+  d.tag, d.type, d.name, d.id, d.ariaLabel, d.placeholder, d.autocomplete, d.accept,
+  d.required, d.combobox, d.label, d.options,
+]);
+"""
+
+_WATCH_SCRIPT = (
+    _LABEL_FUNCTION
+    + _DESCRIBE_FUNCTION
+    + _WATCH_FUNCTION
+    + """
+const [selector, maxDepth] = arguments;
+if (window.__resumeFillerWatch) window.__resumeFillerWatch.observer.disconnect();
+const hasFrame = (node) => node.nodeType === 1
+  && (node.matches('iframe, frame') || node.querySelector('iframe, frame') !== null);
+const hasText = (node) => node.nodeType === 3 || (node.textContent || '').trim() !== '';
+const state = {
+  known: new Map(),
+  touched: new Set(),
+  roots: new WeakSet(),
+  framesChanged: false,
+  textChanged: false,
+};
+state.observer = new MutationObserver((records) => {
+  for (const record of records) {
+    if (record.type === 'characterData') {
+      state.textChanged = true;
+      continue;
+    }
+    if (record.type === 'attributes') {
+      state.touched.add(record.target);
+      // Relabels whatever control the element names, wherever that is.
+      if (record.attributeName === 'for' || record.attributeName === 'id') {
+        state.textChanged = true;
+      }
+      continue;
+    }
+    for (const node of record.addedNodes) {
+      if (hasText(node)) state.textChanged = true;
+      if (node.nodeType !== 1) continue;
+      state.touched.add(node);
+      if (hasFrame(node)) state.framesChanged = true;
+    }
+    for (const node of record.removedNodes) {
+      if (hasText(node)) state.textChanged = true;
+      if (hasFrame(node)) state.framesChanged = true;
+    }
+  }
+});
+state.observe = (root) => {
+  if (state.roots.has(root)) return;
+  state.roots.add(root);
+  state.observer.observe(root, {
+    childList: true,
+    subtree: true,
+    characterData: true,
+    attributes: true,
+    attributeFilter: [
+      'style', 'class', 'hidden', 'aria-hidden', 'type', 'id', 'name', 'for', 'role',
+      'aria-label', 'aria-labelledby', 'placeholder', 'required', 'aria-required',
+    ],
+  });
+};
+state.observe(document);
+for (const el of controlsUnder(document, selector, maxDepth, state.observe)) {
+  if (worthReporting(el)) state.known.set(el, signature(describe(el)));
+}
+window.__resumeFillerWatch = state;
+return true;
+"""
+)
+
+_CHANGES_SCRIPT = (
+    _LABEL_FUNCTION
+    + _DESCRIBE_FUNCTION
+    + _WATCH_FUNCTION
+    + """
+const [selector, maxDepth] = arguments;
+const state = window.__resumeFillerWatch;
+if (!state) return null;
+const candidates = new Set();
+for (const node of state.touched) {
+  if (!node.isConnected) continue;
+  for (const el of controlsUnder(node, selector, maxDepth, state.observe)) candidates.add(el);
+}
+state.touched.clear();
+if (state.textChanged) for (const el of state.known.keys()) candidates.add(el);
+state.textChanged = false;
+const removed = [...state.known.keys()].filter((el) => !el.isConnected);
+for (const el of removed) state.known.delete(el);
+const reported = [];
+const descriptions = new Map();
+for (const el of candidates) {
+  if (!el.isConnected || !worthReporting(el)) continue;
+  const description = describe(el);
+  const now = signature(description);
+  const before = state.known.get(el);
+  if (before === now) continue;
+  // Described anew: the old control is gone and this one takes its place.
+  if (before !== undefined) removed.push(el);
+  state.known.set(el, now);
+  descriptions.set(el, description);
+  reported.push(el);
+}
+reported.sort(
+  (a, b) => (a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1)
+);
+const framesChanged = state.framesChanged;
+state.framesChanged = false;
+return [reported, reported.map((el) => descriptions.get(el)), removed, framesChanged];
+"""
+)
+
+
+@dataclass
+class FormChanges:
+    """Controls that appeared on, or left, a watched form since it was last read.
+
+    A control the page kept but renamed or relabelled is in both: removed as it
+    was, and added as it is now.
+    """
+
+    added: list[FormField]
+    removed: list[FormField]
+
+
+class FormWatch:
+    """A live form kept up to date from MutationObservers, one per browsing context.
+
+    ``fields`` is the form as it stands after the last read: the scanned
+    controls, less those since removed, plus those since added, with repeating
+    groups numbered across all of them. A row added to a Workday section is
+    only the third experience entry when read alongside the first two.
+
+    Once a context cannot be read, because the page navigated, a frame came or
+    went, or a script failed, the watch is lost for good and ``changes``
+    returns None from then on. The caller scans the page again.
+    """
+
+    def __init__(self, fields: list[FormField], paths: list[tuple[int, ...]]) -> None:
+        self.fields = fields
+        self.paths = paths
+        self.lost = False
+
+    @classmethod
+    def start(cls, driver: Any, fields: list[FormField]) -> FormWatch | None:
+        """Watch the page ``fields`` were just scanned from, or None if it cannot be.
+
+        Every field gets its live element first, because a removed control is
+        recognised by its element.
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        from .snapshot import attach_handles
+
+        paths = sorted({(), *(form_field.frame_path for form_field in fields)})
+        cursor = FrameCursor(driver)
+        try:
+            for path in paths:
+                cursor.move_to(path)
+                attach_handles(driver, [f for f in fields if f.frame_path == path])
+                if (
+                    driver.execute_script(_WATCH_SCRIPT, CONTROL_SELECTOR, SHADOW_MAX_DEPTH)
+                    is not True
+                ):
+                    logger.debug("Could not watch the form at frame path %s", path)
+                    return None
+        except WebDriverException:
+            logger.debug("Could not watch the form", exc_info=True)
+            return None
+        finally:
+            _return_to_top(driver)
+        return cls(list(fields), paths)
+
+    def changes(self, driver: Any) -> FormChanges | None:
+        """What changed since the last read, or None when the page must be scanned again."""
+        from selenium.common.exceptions import WebDriverException
+
+        if self.lost:
+            return None
+        added: list[FormField] = []
+        removed: list[FormField] = []
+        cursor = FrameCursor(driver)
+        try:
+            for path in self.paths:
+                cursor.move_to(path)
+                result = driver.execute_script(_CHANGES_SCRIPT, CONTROL_SELECTOR, SHADOW_MAX_DEPTH)
+                if not isinstance(result, list) or len(result) != 4:
+                    logger.debug("The watch on frame path %s is gone", path)
+                    self.lost = True
+                    return None
+                elements, described, gone, frames_changed = result
+                if frames_changed:
+                    logger.debug("Frames changed at frame path %s", path)
+                    self.lost = True
+                    return None
+                added.extend(
+                    _scan_context(driver, path, list(zip(elements, described, strict=True)))
+                )
+                removed.extend(f for f in self.fields if f.frame_path == path and f.handle in gone)
+        except (WebDriverException, ValueError, TypeError):
+            logger.debug("Could not read changes to the form", exc_info=True)
+            self.lost = True
+            return None
+        finally:
+            _return_to_top(driver)
+
+        gone_ids = {id(form_field) for form_field in removed}
+        self.fields = [f for f in self.fields if id(f) not in gone_ids] + added
+        normalize_fields(self.fields)
+        if added or removed:
+            logger.info("Form changed: %d control(s) added, %d removed", len(added), len(removed))
+        return FormChanges(added, removed)
@@ -16,18 +16,30 @@ The scoring model is deliberately simple and inspectable:
 3. Disqualify a candidate outright if a negative pattern fires. This is what
    stops "Confirm Email" from being treated as "Email" and what stops
    "Company Name" from being treated as "Name".
-4. Resolve the whole form at once with a greedy one to one assignment so two
-   controls can never claim the same piece of data.
+4. Resolve the whole form at once with a one to one assignment so two controls
+   can never claim the same piece of data. Greedy by default; an optimal
+   assignment is available as an ``AssignmentStrategy``.
 """
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
 import re
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
 from enum import Enum
+from functools import cache, cached_property, lru_cache, partial
+from typing import TYPE_CHECKING, Any
 
-from .models import FieldMatch, FillStatus, FormField, ResumeData
+from . import __version__
+from .models import Education, FieldMatch, FillStatus, FormField, Position, ResumeData
 from .profile import Profile
+from .vendors import BASE_PACK, load_pack, packs_digest
+
+if TYPE_CHECKING:
+    from .plan_cache import PlanCache
 
 # How much to trust each descriptive attribute. A visible <label> is what the
 # human applicant reads, so it outranks internal identifiers.
@@ -75,6 +87,22 @@ class FillPolicy(str, Enum):
     that the applicant must make themselves."""
 
 
+class AssignmentStrategy(str, Enum):
+    """How each scope's confidence matrix is turned into a one to one assignment."""
+
+    GREEDY = "greedy"
+    """Strongest pairing first. Predictable, and right on nearly every form."""
+
+    OPTIMAL = "optimal"
+    """The assignment with the highest total confidence across the scope.
+
+    Greedy can lose twice to win once. A "City / State" control scoring 0.95
+    for city and 0.90 for state takes city from a "Town" control that could
+    only ever be city, and "Town" is left blank. The optimal solver gives up
+    0.05 to fill both.
+    """
+
+
 @dataclass(frozen=True)
 class CanonicalField:
     """One piece of candidate data the engine knows how to recognise."""
@@ -90,461 +118,154 @@ class CanonicalField:
         """Highest strength among patterns matching ``text``, or zero."""
         if not text:
             return 0.0
-        for negative in self.negatives:
-            if re.search(negative, text):
-                return 0.0
-        best = 0.0
-        for pattern, strength in self.patterns:
-            if re.search(pattern, text) and strength > best:
-                best = strength
-        return best
-
-
-# Applied to every canonical field. "email address" must not read as a street
-# address, and a file input's own filename must not read as a person's name.
-_ADDRESS_NEGATIVES = (r"\bemail\b", r"\be-mail\b", r"\bip\b", r"\bweb\b")
-_NAME_NEGATIVES = (
-    r"\bcompany\b",
-    r"\bemployer\b",
-    r"\bschool\b",
-    r"\buniversity\b",
-    r"\bfile\b",
-    r"\buser\s*name\b",
-    r"\breference\b",
-    r"\bmanager\b",
-)
+        return self.compiled.score(text)
 
-CANONICAL_FIELDS: tuple[CanonicalField, ...] = (
-    CanonicalField(
-        name="first_name",
-        patterns=(
-            (r"\bfirst\s*name\b", 1.0),
-            (r"\bgiven\s*name\b", 1.0),
-            (r"\bforename\b", 0.95),
-            (r"\bfname\b", 0.95),
-            (r"^first$", 0.85),
-        ),
-        negatives=_NAME_NEGATIVES,
-    ),
-    CanonicalField(
-        name="last_name",
-        patterns=(
-            (r"\blast\s*name\b", 1.0),
-            (r"\bfamily\s*name\b", 1.0),
-            (r"\bsurname\b", 0.95),
-            (r"\blname\b", 0.95),
-            (r"^last$", 0.85),
-        ),
-        negatives=_NAME_NEGATIVES,
-    ),
-    CanonicalField(
-        name="full_name",
-        patterns=(
-            (r"\bfull\s*name\b", 1.0),
-            (r"\blegal\s*name\b", 0.95),
-            (r"\bcandidate\s*name\b", 0.95),
-            (r"\byour\s*name\b", 0.90),
-            (r"^name$", 0.80),
-            (r"^applicant$", 0.75),
-        ),
-        negatives=_NAME_NEGATIVES
-        + (r"\bfirst\b", r"\blast\b", r"\bmiddle\b", r"\bpreferred\b", r"\bmaiden\b"),
-    ),
-    CanonicalField(
-        name="email",
-        patterns=(
-            (r"\be-?mail\b", 1.0),
-            (r"^email\s*address$", 1.0),
-        ),
-        negatives=(r"\bconfirm\b", r"\bverify\b", r"\bre-?enter\b", r"\brepeat\b", r"\bagain\b"),
-    ),
-    CanonicalField(
-        name="confirm_email",
-        patterns=(
-            (r"(confirm|verify|re-?enter|repeat)\w*\s*e-?mail", 1.0),
-            (r"e-?mail\s*(confirmation|again|verification)", 1.0),
-        ),
-    ),
-    CanonicalField(
-        name="phone",
-        patterns=(
-            (r"\bphone\b", 1.0),
-            (r"\bmobile\b", 0.95),
-            (r"\bcell\b", 0.95),
-            (r"\btelephone\b", 1.0),
-            (r"^tel$", 0.90),
-            (r"\bcontact\s*number\b", 0.90),
-        ),
-        negatives=(r"\bcountry\s*code\b", r"\bextension\b", r"\bext\b", r"\btype\b"),
-    ),
-    CanonicalField(
-        name="address_line1",
-        patterns=(
-            (r"\baddress\s*line\s*1\b", 1.0),
-            (r"\bstreet\s*address\b", 1.0),
-            (r"\bstreet\b", 0.90),
-            (r"^address$", 0.85),
-        ),
-        negatives=_ADDRESS_NEGATIVES + (r"\bline\s*2\b", r"\bapt\b", r"\bsuite\b"),
-    ),
-    CanonicalField(
-        name="city",
-        patterns=(
-            (r"\bcity\b", 1.0),
-            (r"\btown\b", 0.90),
-            (r"\blocality\b", 0.85),
-        ),
-    ),
-    CanonicalField(
-        name="state",
-        patterns=(
-            (r"\bstate\b", 1.0),
-            (r"\bprovince\b", 1.0),
-            (r"\bregion\b", 0.85),
-        ),
-        # "Search by country/region or code" is a phone dialling-code picker.
-        # Matching it on "region" typed the applicant's state into it.
-        negatives=(
-            r"\bunited\s*states\b",
-            r"\bstatement\b",
-            r"\bcountry\b",
-            r"\bcode\b",
-            r"\bphone\b",
-            r"\bdial\b",
-        ),
-    ),
-    CanonicalField(
-        name="postal_code",
-        patterns=(
-            (r"\bzip\b", 1.0),
-            (r"\bpostal\s*code\b", 1.0),
-            (r"\bpost\s*code\b", 1.0),
-        ),
-    ),
-    CanonicalField(
-        name="country",
-        patterns=((r"\bcountry\b", 1.0),),
-        negatives=(r"\bcode\b",),
-    ),
-    CanonicalField(
-        name="linkedin_url",
-        patterns=(
-            (r"\blinked\s*in\b", 1.0),
-            (r"\blinkedin\s*(profile|url)\b", 1.0),
-        ),
-    ),
-    CanonicalField(
-        name="github_url",
-        patterns=(
-            (r"\bgit\s*hub\b", 1.0),
-            (r"\bgitlab\b", 0.80),
-        ),
-    ),
-    CanonicalField(
-        name="portfolio_url",
-        patterns=(
-            (r"\bportfolio\b", 1.0),
-            (r"\bpersonal\s*(site|website)\b", 1.0),
-            (r"\bwebsite\b", 0.85),
-            (r"\bblog\b", 0.80),
-        ),
-        negatives=(r"\bcompany\b", r"\bemployer\b"),
-    ),
-    CanonicalField(
-        name="resume_file",
-        patterns=(
-            (r"\bresume\b", 1.0),
-            (r"\bcurriculum\s*vitae\b", 1.0),
-            (r"\bcv\b", 0.90),
-            (r"\bupload\b", 0.70),
-            (r"\battach\b", 0.70),
-        ),
-        # Never the avatar control. SmartRecruiters labels it "Upload profile
-        # image", which the generic "upload" pattern otherwise matches.
-        negatives=(
-            r"\bcover\s*letter\b",
-            r"\btranscript\b",
-            r"\bportfolio\b",
-            r"\bphoto\b",
-            r"\bimage\b",
-            r"\bpicture\b",
-            r"\bavatar\b",
-            r"\bheadshot\b",
-            r"\blogo\b",
-        ),
-    ),
-    CanonicalField(
-        name="cover_letter",
-        patterns=(
-            (r"\bcover\s*letter\b", 1.0),
-            (r"\bletter\s*of\s*interest\b", 0.95),
-        ),
-    ),
-    CanonicalField(
-        name="current_company",
-        patterns=(
-            (r"\bcurrent\s*(employer|company)\b", 1.0),
-            (r"\bmost\s*recent\s*(employer|company)\b", 1.0),
-            (r"\bemployer\b", 0.90),
-            (r"\bcompany\b", 0.85),
-            (r"\borganization\b", 0.80),
-        ),
-        negatives=(r"\bapply\b", r"\bposition\b", r"\bwhy\b"),
-    ),
-    CanonicalField(
-        name="current_title",
-        patterns=(
-            (r"\bcurrent\s*(title|role|position)\b", 1.0),
-            (r"\bjob\s*title\b", 1.0),
-            (r"\bmost\s*recent\s*title\b", 1.0),
-            (r"\boccupation\b", 0.90),
-            (r"^title$", 0.80),
-        ),
-        negatives=(r"\bmr\b", r"\bms\b", r"\bsalutation\b", r"\bprefix\b"),
-    ),
-    CanonicalField(
-        name="years_experience",
-        patterns=(
-            (r"\byears?\s*(of\s*)?experience\b", 1.0),
-            (r"\byears?\s*in\s*(the\s*)?(field|industry|role)\b", 0.90),
-        ),
-    ),
-    CanonicalField(
-        name="school",
-        patterns=(
-            (r"\bschool\b", 1.0),
-            (r"\buniversity\b", 1.0),
-            (r"\bcollege\b", 0.95),
-            (r"\binstitution\b", 0.90),
-        ),
-        negatives=(r"\bhigh\s*school\s*only\b",),
-    ),
-    CanonicalField(
-        name="degree",
-        patterns=(
-            (r"\bdegree\b", 1.0),
-            (r"\bqualification\b", 0.85),
-            (r"\beducation\s*level\b", 0.90),
-        ),
-    ),
-    CanonicalField(
-        name="major",
-        patterns=(
-            (r"\bmajor\b", 1.0),
-            (r"\bfield\s*of\s*study\b", 1.0),
-            (r"\bdiscipline\b", 0.90),
-            (r"\bconcentration\b", 0.85),
-        ),
-    ),
-    CanonicalField(
-        name="graduation_year",
-        patterns=(
-            (r"\bgraduation\s*(year|date)\b", 1.0),
-            (r"\bgrad\s*year\b", 1.0),
-            (r"\byear\s*of\s*graduation\b", 1.0),
-        ),
-    ),
-    # Everything below is recognised so it can be reported as a gap, but is
-    # never answered automatically.
-    CanonicalField(
-        name="desired_salary",
-        patterns=(
-            (r"\b(desired|expected|requested)\s*(salary|compensation|pay|rate)\b", 1.0),
-            (r"\bsalary\s*(expectation|requirement)s?\b", 1.0),
-            (r"\bcompensation\b", 0.80),
-        ),
-        policy=FillPolicy.REVIEW_ONLY,
-        note="Negotiation decision. Answer this yourself.",
-    ),
-    CanonicalField(
-        name="work_authorization",
-        patterns=(
-            (r"\b(legally\s*)?authoriz\w*\s*to\s*work\b", 1.0),
-            (r"\bwork\s*authoriz\w*\b", 1.0),
-            (r"\bright\s*to\s*work\b", 1.0),
-            (r"\bvisa\s*status\b", 0.95),
-        ),
-        policy=FillPolicy.REVIEW_ONLY,
-        allow_multiple=True,
-        note="Legal declaration. Answer this yourself.",
-    ),
-    CanonicalField(
-        name="sponsorship",
-        patterns=(
-            (r"\bsponsorship\b", 1.0),
-            (r"\brequire\s*sponsor\w*\b", 1.0),
-        ),
-        policy=FillPolicy.REVIEW_ONLY,
-        allow_multiple=True,
-        note="Legal declaration. Answer this yourself.",
-    ),
-    CanonicalField(
-        name="demographic",
-        patterns=(
-            (r"\bgender\b", 1.0),
-            (r"\brace\b", 1.0),
-            (r"\bethnicity\b", 1.0),
-            (r"\bveteran\b", 1.0),
-            (r"\bdisability\b", 1.0),
-            (r"\bhispanic\b", 1.0),
-            (r"\bpronouns\b", 0.90),
-            (r"\bsexual\s*orientation\b", 1.0),
-        ),
-        policy=FillPolicy.REVIEW_ONLY,
-        allow_multiple=True,
-        note="Voluntary self identification. Left blank by design.",
-    ),
-    CanonicalField(
-        name="how_did_you_hear",
-        patterns=(
-            (r"\bhow\s*did\s*you\s*hear\b", 1.0),
-            (r"\breferral\s*source\b", 0.95),
-            (r"\bsource\b", 0.70),
-        ),
-        policy=FillPolicy.REVIEW_ONLY,
-        note="Site specific dropdown. Answer this yourself.",
-    ),
-    CanonicalField(
-        name="free_text_question",
-        patterns=(
-            (r"\bwhy\s*(do\s*you\s*want|are\s*you\s*interested)\b", 1.0),
-            (r"\btell\s*(us|me)\s*about\b", 0.95),
-            (r"\badditional\s*information\b", 0.85),
-            # Ashby's prompts open with these and matched nothing before.
-            (r"\bdescribe\s+(a|an|your|the)\b", 1.0),
-            (r"\bwhat.?s\s+something\b", 1.0),
-            (r"\bwalk\s+(us|me)\s+through\b", 0.95),
-            (r"\bgive\s+(us|me)\s+an\s+example\b", 0.95),
-            (r"\bhow\s+(would|did)\s+you\b", 0.90),
-        ),
-        policy=FillPolicy.REVIEW_ONLY,
-        allow_multiple=True,
-        note="Custom essay question. Answer this yourself.",
-    ),
-    # Self-identification questions are often rendered as a bare list of radios
-    # with no group label at all, so the only text available is the option
-    # itself: "Man", "Woman", "Under 30". Matching the question text alone left
-    # every one of those merely unrecognised, which loses the reason it must not
-    # be answered automatically. Restricted to choice controls, where these
-    # phrasings are unambiguous.
-    CanonicalField(
-        name="demographic_option",
-        patterns=(
-            (r"^(man|woman)$", 1.0),
-            (r"\bnon.?binary\b", 1.0),
-            (r"\bgender\s*identity\b", 1.0),
-            (r"\btransgender\b", 1.0),
-            (r"^under\s*\d+$", 1.0),
-            # Normalisation strips punctuation, so "30-39" arrives as "30 39".
-            (r"^\d{2}\s*-?\s*\d{2}$", 0.95),
-            (r"^\d+\s*or\s*(older|over|above)$", 1.0),
-            (r"\bprefer\s*not\s*to\s*(answer|say|disclose)\b", 1.0),
-            (r"\bdecline\s*to\s*(self.?identify|answer|state)\b", 1.0),
-            (r"\bhispanic\s*or\s*latino\b", 1.0),
-            (r"\bblack\s*or\s*african\s*american\b", 1.0),
-            (r"\bamerican\s*indian\b", 1.0),
-            (r"\bnative\s*hawaiian\b", 1.0),
-            (r"\btwo\s*or\s*more\s*races\b", 1.0),
-            (r"\bprotected\s*veteran\b", 1.0),
-            (r"\byes,?\s*i\s*have\s*a\s*disability\b", 1.0),
+    @cached_property
+    def compiled(self) -> CompiledPatterns:
+        """The patterns folded into a few alternations, built on first use."""
+        return CompiledPatterns.build(self)
+
+
+@dataclass(frozen=True)
+class CompiledPatterns:
+    """A canonical field's patterns, compiled for a single pass over a text.
+
+    Scoring used to run ``re.search`` once per raw pattern string, for every
+    attribute of every control against every field, and most of that time went
+    on the regex module's cache lookup rather than on matching. Here all the
+    negatives become one alternation, since any one of them firing is enough,
+    and the positives are grouped by strength into one alternation per tier.
+    Trying the tiers strongest first means the first tier that matches is the
+    best score, which is exactly what the per-pattern loop computed.
+
+    Almost every text matches almost no field, so one alternation over all the
+    positives is tried before anything else and settles most texts in a single
+    search.
+
+    ``triggers`` are words, or pieces of words, that some positive pattern needs
+    in order to match at all. A text containing none of them cannot score, so
+    the vocabulary's token index never offers it this field. None means some
+    pattern needs no particular word, like ``^\\d{2}$``, and the field is always
+    a candidate.
+    """
+
+    positive: re.Pattern[str] | None
+    negative: re.Pattern[str] | None
+    tiers: tuple[tuple[float, re.Pattern[str]], ...]
+    triggers: frozenset[str] | None = None
+
+    def score(self, text: str) -> float:
+        """Highest strength among patterns matching ``text``, or zero."""
+        if self.positive is None or not self.positive.search(text):
+            return 0.0
+        if self.negative is not None and self.negative.search(text):
+            return 0.0
+        for strength, tier in self.tiers:
+            if tier.search(text):
+                return strength
+        return 0.0
+
+    @classmethod
+    def build(cls, canonical: CanonicalField) -> CompiledPatterns:
+        by_strength: dict[float, list[str]] = {}
+        for pattern, strength in canonical.patterns:
+            if strength > 0:
+                by_strength.setdefault(strength, []).append(pattern)
+        tiers = tuple(
+            (strength, _alternation(by_strength[strength]))
+            for strength in sorted(by_strength, reverse=True)
+        )
+        positives = [pattern for strength in by_strength for pattern in by_strength[strength]]
+        return cls(
+            positive=_alternation(positives) if positives else None,
+            negative=_alternation(canonical.negatives) if canonical.negatives else None,
+            tiers=tiers,
+            triggers=_triggers(canonical),
+        )
+
+
+def _triggers(canonical: CanonicalField) -> frozenset[str] | None:
+    """``CompiledPatterns.triggers`` for a field, worked out without compiling anything."""
+    literals = [
+        _required_literal(pattern) for pattern, strength in canonical.patterns if strength > 0
+    ]
+    return frozenset(literals) if all(literals) else None
+
+
+def _alternation(patterns: Iterable[str]) -> re.Pattern[str]:
+    """One regex that matches wherever any of ``patterns`` would."""
+    unique = dict.fromkeys(patterns)
+    return re.compile("|".join(f"(?:{pattern})" for pattern in unique))
+
+
+_QUANTIFIERS = frozenset("?*{")
+
+
+def _required_literal(pattern: str) -> str:
+    """The longest run of letters and digits that every match of ``pattern`` contains.
+
+    Deliberately conservative. An escape, a class, a group or any other
+    punctuation ends a run instead of being reasoned about, a character made
+    optional by a quantifier is dropped, and a top level ``|`` means no one
+    literal is required. Empty when nothing of two characters or more is left.
+    """
+    runs: list[str] = []
+    run = ""
+    depth = 0
+    position = 0
+    while position < len(pattern):
+        char = pattern[position]
+        position += 1
+        if char == "\\":
+            position += 1
+        elif char == "[":
+            position = pattern.index("]", position + 1) + 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and not depth:
+            return ""
+        elif char in _QUANTIFIERS:
+            run = run[:-1]
+            if char == "{":
+                position = pattern.index("}", position) + 1
+        elif not depth and char.isascii() and char.isalnum():
+            run += char
+            continue
+        elif depth:
+            continue
+        runs.append(run)
+        run = ""
+    runs.append(run)
+    longest = max(runs, key=len)
+    return longest if len(longest) >= 2 else ""
+
+
+def _canonical_field(entry: dict[str, Any]) -> CanonicalField:
+    """A field as a pack file writes it. ``about`` is for the reader only."""
+    return CanonicalField(
+        name=entry["name"],
+        patterns=tuple(
+            (str(pattern), float(strength)) for pattern, strength in entry.get("patterns", ())
         ),
-        policy=FillPolicy.REVIEW_ONLY,
-        allow_multiple=True,
-        note="Voluntary self identification. Left blank by design.",
-    ),
+        negatives=tuple(entry.get("negatives", ())),
+        policy=FillPolicy(entry.get("policy", FillPolicy.AUTO.value)),
+        allow_multiple=bool(entry.get("allow_multiple", False)),
+        note=entry.get("note", ""),
+    )
+
+
+# The vocabulary lives in resume_filler/packs/base.json, where the reason for
+# each pattern and negative is written down beside it.
+CANONICAL_FIELDS: tuple[CanonicalField, ...] = tuple(
+    _canonical_field(entry) for entry in load_pack(BASE_PACK)["canonical"]
 )
 
-# Fields that only exist inside a repeating section. Workday's work history is
-# ten identical rows, so "Job Title" in row three means the third job, not a
-# duplicate of the first. These are matched only against grouped controls, which
-# keeps them from competing with the flat-form canonicals above.
-ENTRY_FIELDS: tuple[CanonicalField, ...] = (
-    CanonicalField(
-        name="entry_title",
-        patterns=(
-            (r"\bjob\s*title\b", 1.0),
-            (r"\bposition\s*title\b", 1.0),
-            (r"^title$", 0.90),
-            (r"\brole\b", 0.85),
-        ),
-        negatives=(r"\bsalutation\b", r"\bprefix\b"),
-    ),
-    CanonicalField(
-        name="entry_company",
-        patterns=(
-            (r"\bcompany\s*name\b", 1.0),
-            (r"\bemployer\b", 1.0),
-            (r"^company$", 0.95),
-            (r"\borganization\b", 0.85),
-        ),
-    ),
-    CanonicalField(
-        name="entry_location",
-        patterns=(
-            (r"^location$", 1.0),
-            (r"\bcity\b", 0.85),
-        ),
-    ),
-    CanonicalField(
-        name="entry_description",
-        patterns=(
-            (r"\brole\s*description\b", 1.0),
-            (r"\bdescription\b", 0.90),
-            (r"\bresponsibilities\b", 0.90),
-        ),
-    ),
-    CanonicalField(
-        name="entry_start_month",
-        patterns=((r"\bfrom\s*month\b", 1.0), (r"\bstart\s*date\s*month\b", 1.0)),
-    ),
-    CanonicalField(
-        name="entry_start_year",
-        patterns=((r"\bfrom\s*year\b", 1.0), (r"\bstart\s*date\s*year\b", 1.0)),
-    ),
-    CanonicalField(
-        name="entry_end_month",
-        patterns=((r"\bto\s*month\b", 1.0), (r"\bend\s*date\s*month\b", 1.0)),
-    ),
-    CanonicalField(
-        name="entry_end_year",
-        patterns=((r"\bto\s*year\b", 1.0), (r"\bend\s*date\s*year\b", 1.0)),
-    ),
-    CanonicalField(
-        name="entry_currently_here",
-        patterns=(
-            (r"\bcurrently\s*work\s*here\b", 1.0),
-            (r"\bi\s*currently\s*work\b", 1.0),
-            (r"\bpresent\b", 0.80),
-        ),
-    ),
-    CanonicalField(
-        name="entry_school",
-        patterns=(
-            (r"\bschool\s*name\b", 1.0),
-            (r"\bschool\b", 0.95),
-            (r"\buniversity\b", 0.95),
-            (r"\bcollege\b", 0.90),
-            (r"\binstitution\b", 0.90),
-        ),
-    ),
-    CanonicalField(
-        name="entry_degree",
-        patterns=((r"\bdegree\b", 1.0), (r"\bqualification\b", 0.85)),
-    ),
-    CanonicalField(
-        name="entry_field_of_study",
-        patterns=(
-            (r"\bfield\s*of\s*study\b", 1.0),
-            (r"\bmajor\b", 0.95),
-            (r"\bdiscipline\b", 0.90),
-        ),
-    ),
-    CanonicalField(
-        name="entry_gpa",
-        patterns=((r"\bgrade\s*average\b", 1.0), (r"\bgpa\b", 1.0)),
-        policy=FillPolicy.REVIEW_ONLY,
-        note="Verify against your transcript before entering.",
-    ),
+# Fields that only exist inside a repeating section, matched only against
+# grouped controls. See the pack for why they are kept apart.
+ENTRY_FIELDS: tuple[CanonicalField, ...] = tuple(
+    _canonical_field(entry) for entry in load_pack(BASE_PACK)["entry"]
 )
 
 # Group names mapped to the resume collection their rows draw from.
@@ -554,6 +275,7 @@ GROUP_SOURCES: tuple[tuple[tuple[str, ...], str], ...] = (
 )
 
 
+@lru_cache(maxsize=256)
 def group_source(group_name: str) -> str:
     """Which resume collection a repeating section should be filled from."""
     lowered = normalize(group_name)
@@ -565,12 +287,64 @@ def group_source(group_name: str) -> str:
 
 _BY_NAME: dict[str, CanonicalField] = {f.name: f for f in (*CANONICAL_FIELDS, *ENTRY_FIELDS)}
 
+# Flat controls are matched against one vocabulary and repeating rows against
+# the other, so each is compiled and cached under its own key.
+VOCABULARIES: dict[str, tuple[CanonicalField, ...]] = {
+    "canonical": CANONICAL_FIELDS,
+    "entry": ENTRY_FIELDS,
+}
+_VOCABULARY_OF: dict[str, str] = {
+    canonical.name: key for key, fields in VOCABULARIES.items() for canonical in fields
+}
+
+
+@cache
+def vendor_vocabulary(kind: str, vendor: str = "") -> tuple[CanonicalField, ...]:
+    """The "canonical" or "entry" vocabulary with a vendor's pack applied.
+
+    Each field the pack extends is rebuilt with the pack's patterns and
+    negatives added to its own. Every other field is the base field itself, so
+    its compiled patterns are shared rather than built twice. The result is
+    registered in ``VOCABULARIES`` under a key of its own, which gives it its
+    own token index and score cache and leaves the base vocabulary, and every
+    other vendor's form, exactly as it was. No vendor, or a pack with nothing
+    for this kind, gives back the base vocabulary.
+    """
+    base = VOCABULARIES[kind]
+    extensions = (
+        {entry["name"]: entry for entry in load_pack(vendor).get(kind, ())} if vendor else {}
+    )
+    if not extensions:
+        return base
+    unknown = sorted(set(extensions) - {canonical.name for canonical in base})
+    if unknown:
+        raise ValueError(f"The {vendor} pack extends unknown {kind} fields: {', '.join(unknown)}")
+
+    def extended(canonical: CanonicalField) -> CanonicalField:
+        if canonical.name not in extensions:
+            return canonical
+        extra = _canonical_field(extensions[canonical.name])
+        return replace(
+            canonical,
+            patterns=canonical.patterns + extra.patterns,
+            negatives=canonical.negatives + extra.negatives,
+        )
+
+    vocabulary = tuple(extended(canonical) for canonical in base)
+    VOCABULARIES[f"{kind}:{vendor}"] = vocabulary
+    return vocabulary
 
+
+NORMALIZE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize(text: str) -> str:
     """Lowercase, strip punctuation, and collapse whitespace.
 
     Also splits camelCase and snake_case identifiers so that a control named
-    ``firstName`` or ``first_name`` normalises to ``first name``.
+    ``firstName`` or ``first_name`` normalises to ``first name``. Cached,
+    because a form repeats its labels and names far more than it varies them.
     """
     if not text:
         return ""
@@ -579,12 +353,67 @@ def normalize(text: str) -> str:
     return re.sub(r"\s+", " ", lowered).strip()
 
 
+def normalized_attribute(form_field: FormField, attribute: str) -> str:
+    """``normalize`` of one of the control's attributes, worked out once per control.
+
+    Scoring, duplicate detection and fingerprinting all read the same few
+    attributes, so each is normalised on first use and kept on the control.
+    """
+    raw = getattr(form_field, attribute, "")
+    cached = form_field.normalized_attributes.get(attribute)
+    if cached is not None and cached[0] == raw:
+        return cached[1]
+    text = normalize(raw)
+    form_field.normalized_attributes[attribute] = (raw, text)
+    return text
+
+
 def score_field(form_field: FormField, canonical: CanonicalField) -> float:
     """Confidence in the range 0.0 to 1.0 that ``form_field`` holds ``canonical``."""
-    autocomplete = normalize(form_field.autocomplete).replace(" ", "-")
-    if autocomplete and AUTOCOMPLETE_TOKENS.get(autocomplete) == canonical.name:
+    if _autocomplete_field(form_field) == canonical.name:
         return 1.0
+    return _adjust_for_shape(form_field, canonical, _best_attribute_score(form_field, canonical))
+
+
+def score_control(
+    form_field: FormField,
+    vocabulary: tuple[CanonicalField, ...],
+    *,
+    only: Iterable[CanonicalField] | None = None,
+) -> dict[str, float]:
+    """``score_field`` for every field in ``vocabulary`` at once.
+
+    Each descriptive attribute is normalised and scanned once for the whole
+    vocabulary, rather than once per canonical field, and only against the
+    fields the token index shortlists for it. ``only`` narrows the result to
+    some of the vocabulary's fields.
+    """
+    key = _vocabulary_key(vocabulary)
+    weighted = _weighted_pattern_scores(form_field, key) if key else None
+    autocomplete = _autocomplete_field(form_field)
+    scores: dict[str, float] = {}
+    for canonical in vocabulary if only is None else only:
+        if canonical.name == autocomplete:
+            scores[canonical.name] = 1.0
+            continue
+        if weighted is not None:
+            attribute_score = weighted.get(canonical.name, 0.0)
+        else:
+            attribute_score = _best_attribute_score(form_field, canonical)
+        scores[canonical.name] = _adjust_for_shape(form_field, canonical, attribute_score)
+    return scores
+
+
+def _autocomplete_field(form_field: FormField) -> str:
+    """The canonical field named by the control's autocomplete token, if any."""
+    token = normalized_attribute(form_field, "autocomplete").replace(" ", "-")
+    return AUTOCOMPLETE_TOKENS.get(token, "") if token else ""
+
 
+def _adjust_for_shape(
+    form_field: FormField, canonical: CanonicalField, attribute_score: float
+) -> float:
+    """Raise a pattern score where the control's shape alone is decisive."""
     # A file input that takes documents is a resume upload even with no label
     # at all, which is exactly how SmartRecruiters ships it.
     if (
@@ -592,7 +421,7 @@ def score_field(form_field: FormField, canonical: CanonicalField) -> float:
         and form_field.is_file_input
         and accept_kind(form_field.accept) == "document"
     ):
-        return max(DOCUMENT_UPLOAD_CONFIDENCE, _best_attribute_score(form_field, canonical))
+        return max(DOCUMENT_UPLOAD_CONFIDENCE, attribute_score)
 
     # A textarea with a long or interrogative label is an essay prompt whatever
     # its exact wording. Employers phrase these however they like, so a pattern
@@ -604,9 +433,9 @@ def score_field(form_field: FormField, canonical: CanonicalField) -> float:
         and form_field.tag == "textarea"
         and _looks_like_a_prompt(form_field.label or form_field.aria_label)
     ):
-        return max(ESSAY_PROMPT_CONFIDENCE, _best_attribute_score(form_field, canonical))
+        return max(ESSAY_PROMPT_CONFIDENCE, attribute_score)
 
-    return _best_attribute_score(form_field, canonical)
+    return attribute_score
 
 
 ESSAY_PROMPT_CONFIDENCE = 0.70
@@ -620,15 +449,114 @@ def _looks_like_a_prompt(label: str) -> bool:
 
 def _best_attribute_score(form_field: FormField, canonical: CanonicalField) -> float:
     """Highest weighted pattern match across the control's descriptive attributes."""
+    # A field defined outside the built-in vocabulary is scored on its own.
+    vocabulary = _VOCABULARY_OF.get(canonical.name, "")
+    if _BY_NAME.get(canonical.name) is not canonical:
+        vocabulary = ""
     best = 0.0
     for attribute, weight in ATTRIBUTE_WEIGHTS.items():
-        text = normalize(getattr(form_field, attribute, ""))
-        strength = canonical.best_pattern_score(text)
+        text = normalized_attribute(form_field, attribute)
+        if vocabulary:
+            strength = pattern_scores(text, vocabulary).get(canonical.name, 0.0)
+        else:
+            strength = canonical.best_pattern_score(text)
         if strength:
             best = max(best, strength * weight)
     return round(best, 4)
 
 
+def _weighted_pattern_scores(form_field: FormField, vocabulary: str) -> dict[str, float]:
+    """``_best_attribute_score`` for every field of a registered vocabulary."""
+    best: dict[str, float] = {}
+    for attribute, weight in ATTRIBUTE_WEIGHTS.items():
+        text = normalized_attribute(form_field, attribute)
+        for name, strength in pattern_scores(text, vocabulary).items():
+            if strength * weight > best.get(name, 0.0):
+                best[name] = strength * weight
+    return {name: round(score, 4) for name, score in best.items()}
+
+
+def _vocabulary_key(vocabulary: tuple[CanonicalField, ...]) -> str:
+    """The ``VOCABULARIES`` key for a vocabulary, or empty for an ad hoc one."""
+    for key, fields in VOCABULARIES.items():
+        if fields is vocabulary:
+            return key
+    return ""
+
+
+PATTERN_SCORE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PATTERN_SCORE_CACHE_SIZE)
+def pattern_scores(text: str, vocabulary: str = "canonical") -> dict[str, float]:
+    """Every field's pattern strength for one normalised text, in one pass.
+
+    ``vocabulary`` is a key of ``VOCABULARIES``. Fields scoring zero, including
+    those a negative pattern disqualified, are absent. Cached because the same
+    few labels recur across a form: Workday's ten work-history rows all read
+    "Job Title", "Company" and "Location". The returned dict is shared between
+    callers and must not be modified.
+    """
+    scores: dict[str, float] = {}
+    if not text:
+        return scores
+    candidates = candidate_fields(text, vocabulary)
+    for canonical in VOCABULARIES[vocabulary]:
+        # Only a shortlisted field is compiled, so a field no label on the page
+        # could match never costs the regex compiler anything.
+        if canonical.name not in candidates:
+            continue
+        strength = canonical.compiled.score(text)
+        if strength:
+            scores[canonical.name] = strength
+    return scores
+
+
+def candidate_fields(text: str, vocabulary: str = "canonical") -> frozenset[str]:
+    """The fields of a vocabulary that could possibly match one normalised text.
+
+    A shortlist, not a verdict: every field whose patterns could match is in it,
+    and usually a few that will not. A label like "Job Title" shares no word
+    with forty of the forty-three fields, and scoring it against them was most
+    of the regex work on a large form.
+    """
+    candidates = _trigger_index(vocabulary)[1]
+    for token in set(text.split()):
+        candidates |= _token_candidates(token, vocabulary)
+    return candidates
+
+
+TOKEN_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _token_candidates(token: str, vocabulary: str) -> frozenset[str]:
+    """Fields with a trigger inside ``token``, so "firstname" still offers first name."""
+    triggers = _trigger_index(vocabulary)[0]
+    return frozenset(name for trigger, names in triggers if trigger in token for name in names)
+
+
+@cache
+def _trigger_index(
+    vocabulary: str,
+) -> tuple[tuple[tuple[str, tuple[str, ...]], ...], frozenset[str]]:
+    """Each trigger with the fields it offers, and the fields offered unconditionally.
+
+    Read off the pattern text alone, so building it compiles nothing.
+    """
+    by_trigger: dict[str, list[str]] = {}
+    unconditional: set[str] = set()
+    for canonical in VOCABULARIES[vocabulary]:
+        triggers = _triggers(canonical)
+        if triggers is None:
+            unconditional.add(canonical.name)
+            continue
+        for trigger in sorted(triggers):
+            by_trigger.setdefault(trigger, []).append(canonical.name)
+    index = tuple((trigger, tuple(names)) for trigger, names in sorted(by_trigger.items()))
+    return index, frozenset(unconditional)
+
+
 IMAGE_EXTENSIONS = frozenset(
     [
         ".png",
@@ -714,6 +642,9 @@ def _is_type_compatible(form_field: FormField, canonical_name: str) -> bool:
 def match_form(
     fields: list[FormField],
     threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+    strategy: AssignmentStrategy | str = AssignmentStrategy.GREEDY,
+    plan_cache: PlanCache | None = None,
+    vendor: str = "",
 ) -> list[FieldMatch]:
     """Assign canonical fields to form controls.
 
@@ -726,8 +657,21 @@ def match_form(
     highest first, so a strong "First Name" match claims that control before a
     weaker generic "Name" match can. Fields flagged ``allow_multiple`` may be
     assigned more than once, because forms routinely ask several demographic
-    questions.
+    questions. ``AssignmentStrategy.OPTIMAL`` maximises the total confidence of
+    each scope instead, under the same rules.
+
+    ``vendor``, as ``detect_vendor`` names it, adds that vendor's vocabulary
+    pack to the base one.
+
+    With a ``plan_cache``, a form whose fingerprint was matched before under the
+    same vocabulary, threshold and strategy is answered from the cache.
     """
+    strategy = AssignmentStrategy(strategy)
+    if plan_cache is not None:
+        cached = plan_cache.get(fields, threshold, strategy, vendor)
+        if cached is not None:
+            return _cached_matches(fields, cached)
+
     scopes: dict[tuple[str, int], list[int]] = {}
     for index, form_field in enumerate(fields):
         key = (form_field.group, form_field.group_index) if form_field.is_grouped else ("", -1)
@@ -735,11 +679,77 @@ def match_form(
 
     matches_by_index: dict[int, FieldMatch] = {}
     for (group_name, _row), member_indexes in scopes.items():
-        vocabulary = ENTRY_FIELDS if group_name else CANONICAL_FIELDS
-        for index, match in _match_scope(fields, member_indexes, vocabulary, threshold).items():
+        vocabulary = vendor_vocabulary("entry" if group_name else "canonical", vendor)
+        scope = _match_scope(fields, member_indexes, vocabulary, threshold, strategy)
+        for index, match in scope.items():
             matches_by_index[index] = match
 
-    return [matches_by_index[index] for index in range(len(fields))]
+    matches = [matches_by_index[index] for index in range(len(fields))]
+    if plan_cache is not None:
+        plan_cache.put(fields, threshold, strategy, matches, vendor)
+    return matches
+
+
+def _cached_matches(fields: list[FormField], cached: list[tuple[str, float]]) -> list[FieldMatch]:
+    """Rebuild the matches for ``fields`` from what ``PlanCache.get`` returned."""
+    return [
+        _field_match(form_field, canonical_name, confidence)
+        for form_field, (canonical_name, confidence) in zip(fields, cached, strict=True)
+    ]
+
+
+def form_fingerprint(fields: list[FormField]) -> str:
+    """Identify a form by everything the matching engine reads from it, in order.
+
+    Greenhouse serves one application template for every posting on a board,
+    and a Workday tenant reuses its own, so two scans with the same fingerprint
+    always plan the same way. Each control contributes its descriptor signature
+    and widget, then the normalised attributes and shape that scoring uses.
+    Posting specific text such as the job title in the page heading never
+    reaches a control, so it does not break the match.
+    """
+    controls = [
+        (
+            _descriptor_signature(form_field),
+            form_field.widget,
+            form_field.tag,
+            form_field.field_type,
+            [normalized_attribute(form_field, attribute) for attribute in ATTRIBUTE_WEIGHTS],
+            _autocomplete_field(form_field),
+            accept_kind(form_field.accept),
+            form_field.tag == "textarea"
+            and _looks_like_a_prompt(form_field.label or form_field.aria_label),
+            form_field.group,
+            form_field.group_index,
+        )
+        for form_field in fields
+    ]
+    encoded = json.dumps(controls, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@cache
+def vocabulary_version() -> str:
+    """Changes whenever anything that decides a match does.
+
+    Covers the field definitions, every vendor pack, the attribute weights, the
+    autocomplete table, every confidence constant and the package version, so a
+    cached plan made by an older engine is never served by a newer one.
+    """
+    parts = (
+        __version__,
+        packs_digest(),
+        CANONICAL_FIELDS,
+        ENTRY_FIELDS,
+        ATTRIBUTE_WEIGHTS,
+        AUTOCOMPLETE_TOKENS,
+        DEFAULT_CONFIDENCE_THRESHOLD,
+        DUPLICATE_MIN_CONFIDENCE,
+        DOCUMENT_UPLOAD_CONFIDENCE,
+        ESSAY_PROMPT_CONFIDENCE,
+        MIN_PROMPT_LENGTH,
+    )
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:16]
 
 
 DUPLICATE_MIN_CONFIDENCE = 0.80
@@ -752,7 +762,7 @@ def _descriptor_signature(form_field: FormField) -> str:
     different questions that happen to look alike.
     """
     for attribute in ("label", "aria_label", "name", "element_id"):
-        text = normalize(getattr(form_field, attribute, ""))
+        text = normalized_attribute(form_field, attribute)
         if text:
             return text
     return ""
@@ -775,81 +785,274 @@ def _assign_duplicate_controls(
     document to two file inputs is a different decision, since the second is
     usually a cover letter rather than a duplicate.
     """
+    signatures = {
+        index: _descriptor_signature(fields[index])
+        for index in member_indexes
+        if not fields[index].is_file_input
+    }
     claimed_by_signature: dict[str, tuple[str, float]] = {}
     for index, (canonical_name, confidence) in assignment.items():
-        if confidence < DUPLICATE_MIN_CONFIDENCE or fields[index].is_file_input:
-            continue
-        signature = _descriptor_signature(fields[index])
-        if signature:
+        signature = signatures.get(index, "")
+        if confidence >= DUPLICATE_MIN_CONFIDENCE and signature:
             claimed_by_signature.setdefault(signature, (canonical_name, confidence))
 
-    for index in member_indexes:
-        if index in assignment or fields[index].is_file_input:
+    if not claimed_by_signature:
+        return
+    for index, signature in signatures.items():
+        if index in assignment or not signature:
             continue
-        signature = _descriptor_signature(fields[index])
-        duplicate = claimed_by_signature.get(signature) if signature else None
+        duplicate = claimed_by_signature.get(signature)
         if duplicate:
             assignment[index] = duplicate
 
 
+@dataclass
+class ConfidenceMatrix:
+    """Every control in one scope scored against every field of its vocabulary.
+
+    Row ``r`` is ``fields[indexes[r]]`` and column ``c`` is ``vocabulary[c]``.
+    ``eligible[r]`` lists the columns that row may take, meaning type compatible
+    and at or above the threshold, strongest first and then by name. Built in
+    one pass, so an assignment strategy never has to score anything again.
+
+    Pairings that fail ``_is_type_compatible`` are ruled out before scoring and
+    left at zero, so a file input is only ever scored as an upload.
+    """
+
+    indexes: list[int]
+    vocabulary: tuple[CanonicalField, ...]
+    confidences: list[list[float]]
+    eligible: list[list[int]]
+
+    @classmethod
+    def score(
+        cls,
+        fields: list[FormField],
+        member_indexes: list[int],
+        vocabulary: tuple[CanonicalField, ...],
+        threshold: float,
+    ) -> ConfidenceMatrix:
+        confidences: list[list[float]] = []
+        eligible: list[list[int]] = []
+        for index in member_indexes:
+            form_field = fields[index]
+            compatible = [
+                column
+                for column, canonical in enumerate(vocabulary)
+                if _is_type_compatible(form_field, canonical.name)
+            ]
+            scores = score_control(
+                form_field, vocabulary, only=(vocabulary[column] for column in compatible)
+            )
+            row = [scores.get(canonical.name, 0.0) for canonical in vocabulary]
+            columns = [column for column in compatible if row[column] >= threshold]
+            columns.sort(key=lambda column: (-row[column], vocabulary[column].name))
+            confidences.append(row)
+            eligible.append(columns)
+        return cls(list(member_indexes), vocabulary, confidences, eligible)
+
+
+def _claim_greedily(matrix: ConfidenceMatrix) -> dict[int, tuple[str, float]]:
+    """Consume pairings highest confidence first, each control at most once.
+
+    Equivalent to sorting every eligible pairing by confidence, then field
+    order, then name, and walking the list. Each row instead offers only its
+    best column still unclaimed, from a heap, and offers its next one when that
+    column is taken first. On a form with thousands of controls that avoids
+    building and sorting every pairing up front.
+    """
+    vocabulary = matrix.vocabulary
+    cursors = [0] * len(matrix.indexes)
+    claimed_columns: set[int] = set()
+
+    def best_offer(row: int) -> tuple[float, int, str, int, int] | None:
+        columns = matrix.eligible[row]
+        while cursors[row] < len(columns):
+            column = columns[cursors[row]]
+            if column not in claimed_columns:
+                confidence = matrix.confidences[row][column]
+                return (-confidence, matrix.indexes[row], vocabulary[column].name, row, column)
+            cursors[row] += 1
+        return None
+
+    heap = [offer for row in range(len(matrix.indexes)) if (offer := best_offer(row))]
+    heapq.heapify(heap)
+
+    assignment: dict[int, tuple[str, float]] = {}
+    while heap:
+        negative, index, name, row, column = heapq.heappop(heap)
+        if column in claimed_columns:
+            offer = best_offer(row)
+            if offer:
+                heapq.heappush(heap, offer)
+            continue
+        assignment[index] = (name, -negative)
+        if not vocabulary[column].allow_multiple:
+            claimed_columns.add(column)
+    return assignment
+
+
+# Confidences are rounded to four places, so gains scaled by this are exact
+# integers and the solver never compares two floats that ought to be equal.
+_GAIN_SCALE = 10_000
+
+
+def _claim_optimally(matrix: ConfidenceMatrix) -> dict[int, tuple[str, float]]:
+    """Choose the assignment with the highest total confidence.
+
+    Fields that allow several controls never compete, so each row simply keeps
+    its best one of those as a fallback. What is left is a one to one problem
+    between rows and the exclusive columns, where a pairing is worth what it
+    gains over that fallback. Only pairings with a real gain are considered,
+    and only each column's strongest few rows, since a column can never need
+    more candidates than there are columns to block them. That keeps the solve
+    bounded by the vocabulary, not the page, however many controls a scope has.
+
+    Ties resolve by row and column order, so the same form always plans the
+    same way.
+    """
+    vocabulary = matrix.vocabulary
+    fallbacks: list[int | None] = [
+        next((column for column in columns if vocabulary[column].allow_multiple), None)
+        for columns in matrix.eligible
+    ]
+
+    offers: dict[int, list[tuple[int, int]]] = {}
+    for row, columns in enumerate(matrix.eligible):
+        fallback = fallbacks[row]
+        floor = matrix.confidences[row][fallback] if fallback is not None else 0.0
+        for column in columns:
+            if vocabulary[column].allow_multiple:
+                continue
+            gain = round((matrix.confidences[row][column] - floor) * _GAIN_SCALE)
+            if gain > 0:
+                offers.setdefault(column, []).append((-gain, row))
+
+    exclusive = sorted(offers)
+    rows = sorted(
+        {
+            row
+            for column in exclusive
+            for _gain, row in heapq.nsmallest(len(exclusive), offers[column])
+        }
+    )
+    position = {row: slot for slot, row in enumerate(rows)}
+    costs = [[0] * max(len(rows), len(exclusive)) for _ in exclusive]
+    for slot, column in enumerate(exclusive):
+        for negative_gain, row in offers[column]:
+            if row in position:
+                costs[slot][position[row]] = negative_gain
+
+    chosen: dict[int, int] = {}
+    for slot, taken in enumerate(_solve_assignment(costs)):
+        if taken < len(rows) and costs[slot][taken] < 0:
+            chosen[rows[taken]] = exclusive[slot]
+
+    pairs: list[tuple[float, int, int, int]] = []
+    for row, index in enumerate(matrix.indexes):
+        picked = chosen.get(row, fallbacks[row])
+        if picked is not None:
+            pairs.append((-matrix.confidences[row][picked], index, row, picked))
+    # Strongest first, as greedy claims them, so a duplicate control copies the
+    # most confident of the controls it repeats.
+    pairs.sort()
+    return {index: (vocabulary[column].name, -negative) for negative, index, _row, column in pairs}
+
+
+def _solve_assignment(costs: list[list[int]]) -> list[int]:
+    """Minimum cost assignment of every row to a distinct column.
+
+    The Hungarian method with shortest augmenting paths, O(rows² × columns).
+    ``costs`` must have at least as many columns as rows. Returns the column
+    given to each row.
+    """
+    if not costs:
+        return []
+    row_count, column_count = len(costs), len(costs[0])
+    row_potential: list[float] = [0] * (row_count + 1)
+    column_potential: list[float] = [0] * (column_count + 1)
+    owner = [0] * (column_count + 1)
+    via = [0] * (column_count + 1)
+    for row in range(1, row_count + 1):
+        owner[0] = row
+        current = 0
+        slack = [float("inf")] * (column_count + 1)
+        visited = [False] * (column_count + 1)
+        while owner[current]:
+            visited[current] = True
+            source = owner[current]
+            delta, following = float("inf"), 0
+            for column in range(1, column_count + 1):
+                if visited[column]:
+                    continue
+                reduced = (
+                    costs[source - 1][column - 1] - row_potential[source] - column_potential[column]
+                )
+                if reduced < slack[column]:
+                    slack[column], via[column] = reduced, current
+                if slack[column] < delta:
+                    delta, following = slack[column], column
+            for column in range(column_count + 1):
+                if visited[column]:
+                    row_potential[owner[column]] += delta
+                    column_potential[column] -= delta
+                else:
+                    slack[column] -= delta
+            current = following
+        while current:
+            previous = via[current]
+            owner[current] = owner[previous]
+            current = previous
+
+    taken = [0] * row_count
+    for column in range(1, column_count + 1):
+        if owner[column]:
+            taken[owner[column] - 1] = column - 1
+    return taken
+
+
+_STRATEGIES = {
+    AssignmentStrategy.GREEDY: _claim_greedily,
+    AssignmentStrategy.OPTIMAL: _claim_optimally,
+}
+
+
 def _match_scope(
     fields: list[FormField],
     member_indexes: list[int],
     vocabulary: tuple[CanonicalField, ...],
     threshold: float,
+    strategy: AssignmentStrategy = AssignmentStrategy.GREEDY,
 ) -> dict[int, FieldMatch]:
-    """Run the greedy assignment across one independent scope."""
-    candidates: list[tuple[float, int, str]] = []
-    for index in member_indexes:
-        form_field = fields[index]
-        for canonical in vocabulary:
-            if not _is_type_compatible(form_field, canonical.name):
-                continue
-            confidence = score_field(form_field, canonical)
-            if confidence >= threshold:
-                candidates.append((confidence, index, canonical.name))
-
-    # Sort by confidence descending, then by field order for determinism.
-    candidates.sort(key=lambda item: (-item[0], item[1], item[2]))
-
-    claimed_fields: set[int] = set()
-    claimed_canonicals: set[str] = set()
-    assignment: dict[int, tuple[str, float]] = {}
+    """Run one assignment strategy across one independent scope."""
+    matrix = ConfidenceMatrix.score(fields, member_indexes, vocabulary, threshold)
+    assignment = _STRATEGIES[strategy](matrix)
+    _assign_duplicate_controls(fields, member_indexes, assignment)
 
-    for confidence, index, canonical_name in candidates:
-        if index in claimed_fields:
-            continue
-        canonical = _BY_NAME[canonical_name]
-        if canonical_name in claimed_canonicals and not canonical.allow_multiple:
-            continue
-        assignment[index] = (canonical_name, confidence)
-        claimed_fields.add(index)
-        claimed_canonicals.add(canonical_name)
+    return {
+        index: _field_match(fields[index], *assignment.get(index, ("", 0.0)))
+        for index in member_indexes
+    }
 
-    _assign_duplicate_controls(fields, member_indexes, assignment)
 
-    matches: dict[int, FieldMatch] = {}
-    for index in member_indexes:
-        form_field = fields[index]
-        if index not in assignment:
-            matches[index] = FieldMatch(
-                form_field=form_field,
-                status=FillStatus.SKIPPED_NO_MATCH,
-                reason="No canonical field scored above the confidence threshold.",
-            )
-            continue
-        canonical_name, confidence = assignment[index]
-        canonical = _BY_NAME[canonical_name]
-        matches[index] = FieldMatch(
+def _field_match(form_field: FormField, canonical_name: str, confidence: float) -> FieldMatch:
+    """The unfilled match for one control, before any value is attached."""
+    if not canonical_name:
+        return FieldMatch(
             form_field=form_field,
-            canonical=canonical_name,
-            confidence=confidence,
-            status=FillStatus.SKIPPED_BY_POLICY
-            if canonical.policy is FillPolicy.REVIEW_ONLY
-            else FillStatus.SKIPPED_NO_VALUE,
-            reason=canonical.note if canonical.policy is FillPolicy.REVIEW_ONLY else "",
+            status=FillStatus.SKIPPED_NO_MATCH,
+            reason="No canonical field scored above the confidence threshold.",
         )
-    return matches
+    canonical = _BY_NAME[canonical_name]
+    return FieldMatch(
+        form_field=form_field,
+        canonical=canonical_name,
+        confidence=confidence,
+        status=FillStatus.SKIPPED_BY_POLICY
+        if canonical.policy is FillPolicy.REVIEW_ONLY
+        else FillStatus.SKIPPED_NO_VALUE,
+        reason=canonical.note if canonical.policy is FillPolicy.REVIEW_ONLY else "",
+    )
 
 
 def resolve_value(canonical_name: str, resume: ResumeData, *, resume_path: str = "") -> str:
@@ -858,8 +1061,12 @@ def resolve_value(canonical_name: str, resume: ResumeData, *, resume_path: str =
     Returns an empty string when the resume did not supply the value, which the
     caller reports as a gap rather than filling with a guess.
     """
+    return _flat_values(resume, resume_path).get(canonical_name, "")
+
+
+def _flat_values(resume: ResumeData, resume_path: str) -> dict[str, str]:
     education = resume.latest_education
-    lookup: dict[str, str] = {
+    return {
         "first_name": resume.first_name,
         "last_name": resume.last_name,
         "full_name": resume.full_name,
@@ -882,7 +1089,6 @@ def resolve_value(canonical_name: str, resume: ResumeData, *, resume_path: str =
         "major": education.major if education else "",
         "graduation_year": education.graduation_year if education else "",
     }
-    return lookup.get(canonical_name, "")
 
 
 _MONTHS = {
@@ -928,37 +1134,82 @@ def resolve_entry_value(
     is reported as a gap.
     """
     source = group_source(group_name)
+    if source == "positions" and row < len(resume.positions):
+        return _position_values(resume.positions[row]).get(canonical_name, "")
+    if source == "education" and row < len(resume.education):
+        return _education_values(resume.education[row]).get(canonical_name, "")
+    return ""
 
-    if source == "positions":
-        if row >= len(resume.positions):
-            return ""
-        position = resume.positions[row]
-        start_month, start_year = _split_date(position.start_date)
-        end_month, end_year = _split_date(position.end_date)
-        return {
-            "entry_title": position.title,
-            "entry_company": position.company,
-            "entry_description": position.description,
-            "entry_start_month": start_month,
-            "entry_start_year": start_year,
-            "entry_end_month": end_month,
-            "entry_end_year": end_year,
-            "entry_currently_here": "yes" if position.is_current else "",
-            "entry_location": position.location,
-        }.get(canonical_name, "")
-
-    if source == "education":
-        if row >= len(resume.education):
-            return ""
-        entry = resume.education[row]
-        return {
-            "entry_school": entry.school,
-            "entry_degree": entry.degree_display,
-            "entry_field_of_study": entry.major,
-            "entry_end_year": entry.graduation_year,
-        }.get(canonical_name, "")
 
-    return ""
+def _position_values(position: Position) -> dict[str, str]:
+    start_month, start_year = _split_date(position.start_date)
+    end_month, end_year = _split_date(position.end_date)
+    return {
+        "entry_title": position.title,
+        "entry_company": position.company,
+        "entry_description": position.description,
+        "entry_start_month": start_month,
+        "entry_start_year": start_year,
+        "entry_end_month": end_month,
+        "entry_end_year": end_year,
+        "entry_currently_here": "yes" if position.is_current else "",
+        "entry_location": position.location,
+    }
+
+
+def _education_values(entry: Education) -> dict[str, str]:
+    return {
+        "entry_school": entry.school,
+        "entry_degree": entry.degree_display,
+        "entry_field_of_study": entry.major,
+        "entry_end_year": entry.graduation_year,
+    }
+
+
+@dataclass(frozen=True)
+class ResumeValues:
+    """Every value a plan can take from one resume and profile, worked out once.
+
+    ``resolve_value`` rebuilds its whole table and ``resolve_entry_value``
+    re-splits a row's dates on every call, which is fine for one form and waste
+    across an ``apply`` batch that plans the same resume against hundreds. Build
+    this once per run and each lookup is a dictionary read. ``rows`` holds one
+    table per entry of each resume collection named by ``GROUP_SOURCES``.
+    """
+
+    flat: dict[str, str]
+    rows: dict[str, tuple[dict[str, str], ...]]
+    profile: dict[str, str]
+
+    @classmethod
+    def build(
+        cls, resume: ResumeData, *, resume_path: str = "", profile: Profile | None = None
+    ) -> ResumeValues:
+        return cls(
+            flat=_flat_values(resume, resume_path),
+            rows={
+                "positions": tuple(_position_values(p) for p in resume.positions),
+                "education": tuple(_education_values(e) for e in resume.education),
+            },
+            profile=dict(profile.values) if profile else {},
+        )
+
+    def supplied(self, canonical_name: str) -> str:
+        """The applicant's own answer from their profile, if they gave one."""
+        return self.profile.get(canonical_name, "")
+
+    def value(self, canonical_name: str) -> str:
+        """What ``resolve_value`` would return."""
+        return self.flat.get(canonical_name, "")
+
+    def entry_value(self, canonical_name: str, group_name: str, row: int) -> str:
+        """What ``resolve_entry_value`` would return."""
+        rows = self.rows.get(group_source(group_name), ())
+        return rows[row].get(canonical_name, "") if 0 <= row < len(rows) else ""
+
+    def has_row(self, group_name: str, row: int) -> bool:
+        """Whether the resume supplies this row of the section's collection."""
+        return 0 <= row < len(self.rows.get(group_source(group_name), ()))
 
 
 # Fields whose correct answer can be "leave it alone" rather than a value.
@@ -966,7 +1217,7 @@ BLANK_IS_AN_ANSWER = frozenset({"entry_currently_here"})
 
 
 def _is_answered_by_leaving_blank(
-    canonical_name: str, resume: ResumeData, field: FormField
+    canonical_name: str, values: ResumeValues, field: FormField
 ) -> bool:
     """Whether an empty value is the answer rather than a missing one.
 
@@ -978,7 +1229,7 @@ def _is_answered_by_leaving_blank(
         return False
     if group_source(field.group) != "positions":
         return False
-    return field.group_index < len(resume.positions)
+    return values.has_row(field.group, field.group_index)
 
 
 def plan_fill(
@@ -988,13 +1239,30 @@ def plan_fill(
     resume_path: str = "",
     threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
     profile: Profile | None = None,
+    strategy: AssignmentStrategy | str = AssignmentStrategy.GREEDY,
+    plan_cache: PlanCache | None = None,
+    values: ResumeValues | None = None,
+    vendor: str = "",
 ) -> list[FieldMatch]:
     """Full planning pass: match every control, then attach the value to use.
 
     The result is a complete, inspectable plan. Nothing has touched a browser
     at this point, so the plan can be printed for review or diffed in tests.
+
+    ``values`` is the resume and profile already built into a ``ResumeValues``,
+    for a caller planning many forms; it stands in for ``resume``,
+    ``resume_path`` and ``profile``.
     """
-    matches = match_form(fields, threshold=threshold)
+    if values is None:
+        values = ResumeValues.build(resume, resume_path=resume_path, profile=profile)
+    matches = match_form(
+        fields, threshold=threshold, strategy=strategy, plan_cache=plan_cache, vendor=vendor
+    )
+    return _attach_values(matches, values)
+
+
+def _attach_values(matches: list[FieldMatch], values: ResumeValues) -> list[FieldMatch]:
+    """Give each match the value to fill, or the reason there is none."""
     for match in matches:
         if not match.canonical:
             continue
@@ -1003,7 +1271,7 @@ def plan_fill(
         # A value the applicant wrote into their own profile is their answer,
         # already considered, so it may settle a question the engine would
         # otherwise refuse to touch. The plan says where it came from.
-        supplied = profile.get(match.canonical) if profile else ""
+        supplied = values.supplied(match.canonical)
         if supplied:
             match.value = supplied
             match.status = FillStatus.FILLED
@@ -1014,13 +1282,13 @@ def plan_fill(
             continue
 
         if field.is_grouped:
-            value = resolve_entry_value(match.canonical, resume, field.group, field.group_index)
+            value = values.entry_value(match.canonical, field.group, field.group_index)
         else:
-            value = resolve_value(match.canonical, resume, resume_path=resume_path)
+            value = values.value(match.canonical)
         if value:
             match.value = value
             match.status = FillStatus.FILLED
-        elif _is_answered_by_leaving_blank(match.canonical, resume, field):
+        elif _is_answered_by_leaving_blank(match.canonical, values, field):
             match.status = FillStatus.NOT_APPLICABLE
             match.reason = "Not applicable to this entry."
         else:
@@ -1030,3 +1298,90 @@ def plan_fill(
                 "file to fill this automatically."
             )
     return matches
+
+
+def plan_fill_many(
+    forms: Iterable[list[FormField]],
+    resume: ResumeData,
+    *,
+    resume_path: str = "",
+    threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+    profile: Profile | None = None,
+    strategy: AssignmentStrategy | str = AssignmentStrategy.GREEDY,
+    plan_cache: PlanCache | None = None,
+    vendor: str = "",
+    workers: int = 1,
+) -> list[list[FieldMatch]]:
+    """``plan_fill`` for a batch of scanned forms, returned in input order.
+
+    For pre-planning every posting on a board before a browser is opened. The
+    resume is built into one ``ResumeValues`` for the whole batch, and the
+    compiled vocabulary and the scoring and normalisation caches are shared by
+    every form planned in the same process.
+
+    With ``workers`` above one the forms are spread over a process pool. Each
+    control is sent without its ``handle``, which may be a live browser element
+    that cannot leave the process, and every returned match refers to the
+    caller's own ``FormField``. The ``plan_cache`` stays in this process: forms
+    it already knows are answered here, and the pool's plans are stored here
+    afterwards. Workers sharing the SQLite file would fight over its write lock
+    and its ``used_at`` order.
+    """
+    forms = list(forms)
+    values = ResumeValues.build(resume, resume_path=resume_path, profile=profile)
+    plan = partial(
+        plan_fill,
+        resume=resume,
+        threshold=threshold,
+        strategy=strategy,
+        plan_cache=plan_cache,
+        values=values,
+        vendor=vendor,
+    )
+    if workers <= 1 or len(forms) <= 1:
+        return [plan(fields) for fields in forms]
+
+    plans: list[list[FieldMatch] | None] = [None] * len(forms)
+    pending: list[int] = []
+    for index, fields in enumerate(forms):
+        cached = None if plan_cache is None else plan_cache.get(fields, threshold, strategy, vendor)
+        if cached is None:
+            pending.append(index)
+        else:
+            plans[index] = _attach_values(_cached_matches(fields, cached), values)
+    if pending:
+        from concurrent.futures import ProcessPoolExecutor
+
+        uncached = partial(plan, plan_cache=None)
+        detached = [[replace(f, handle=None) for f in forms[index]] for index in pending]
+        chunksize = max(1, len(pending) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(
+                pool.map(partial(_plan_detached, uncached), detached, chunksize=chunksize)
+            )
+        for index, planned in zip(pending, outcomes, strict=True):
+            fields = forms[index]
+            matches = [
+                FieldMatch(form_field=form_field, **outcome)
+                for form_field, outcome in zip(fields, planned, strict=True)
+            ]
+            if plan_cache is not None:
+                plan_cache.put(fields, threshold, strategy, matches, vendor)
+            plans[index] = matches
+    return [matches for matches in plans if matches is not None]
+
+
+def _plan_detached(
+    plan: Callable[[list[FormField]], list[FieldMatch]], fields: list[FormField]
+) -> list[dict[str, Any]]:
+    """Run in a pool worker. Sends back each decision without its control."""
+    return [
+        {
+            "canonical": match.canonical,
+            "confidence": match.confidence,
+            "value": match.value,
+            "status": match.status,
+            "reason": match.reason,
+        }
+        for match in plan(fields)
+    ]
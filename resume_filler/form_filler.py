@@ -17,20 +17,32 @@ from __future__ import annotations
 import logging
 import re
 import time
+from collections import deque
+from itertools import groupby
 from pathlib import Path
 from typing import Any
-
-from .extractors import fields_from_driver, switch_to_frame_path
-from .field_map import DEFAULT_CONFIDENCE_THRESHOLD, plan_fill
+from urllib.parse import urlparse
+
+from .extractors import FormWatch, FrameCursor, fields_from_driver
+from .field_map import (
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    AssignmentStrategy,
+    ResumeValues,
+    plan_fill,
+)
 from .models import (
     ApplicationResult,
     ApplicationStatus,
     FieldMatch,
     FillStatus,
+    FormField,
     JobPosting,
     ResumeData,
     RunMode,
 )
+from .plan_cache import PlanCache
+from .snapshot import attach_handles
+from .vendors import detect_vendor
 
 logger = logging.getLogger(__name__)
 
@@ -65,8 +77,240 @@ COMBOBOX_OPTION_SELECTOR = (
 
 MAX_WIZARD_STEPS = 8
 
-# How long a typeahead needs to fetch and render its options.
+# Rounds of newly revealed questions filled after a step, each of which may
+# reveal more. Real conditional questions go one or two deep.
+MAX_REVEAL_ROUNDS = 3
+
+# How long to give a typeahead on a site not yet timed. Once a site's
+# typeaheads have been seen to answer, the wait is TYPEAHEAD_MARGIN times the
+# slowest recent answer, kept between the two bounds below. The floor stays
+# near the old fixed wait: a site whose local lists filter instantly may still
+# send School or Degree to a search debounced by a few hundred milliseconds.
 TYPEAHEAD_SETTLE_SECONDS = 1.5
+TYPEAHEAD_MIN_SECONDS = 1.0
+TYPEAHEAD_MAX_SECONDS = 4.0
+TYPEAHEAD_MARGIN = 3.0
+TYPEAHEAD_SAMPLES = 20
+
+# Remembers the options showing before anything is typed: the full list a
+# combobox opens with, or the results for the previous character. Those are not
+# the typeahead's answer, and timing them as one would teach the budget that
+# the site answers instantly.
+_OPTIONS_BEFORE_SCRIPT = """
+const seen = new Map();
+for (const el of document.querySelectorAll(arguments[0])) {
+  if (el.getClientRects().length) seen.set(el, el.innerText || '');
+}
+window.__resumeFillerOptionsBefore = seen;
+"""
+
+# Waits in the page, rather than sleeping in Python, for the typed-in options
+# to offer the value: it returns as soon as a visible option matches, the same
+# exact or substring test _select_matching_option applies, or at the budget.
+# Options that arrive without a match do not end the wait, however settled they
+# look: they may be the results for an earlier character, with the search for
+# the whole value still in flight. It reports when the match appeared, which is
+# what the budget is learned from, or -1 when it was showing before typing.
+_OPTIONS_SETTLED_SCRIPT = """
+const [selector, wanted, budgetMs] = arguments;
+const done = arguments[arguments.length - 1];
+const before = window.__resumeFillerOptionsBefore || new Map();
+window.__resumeFillerOptionsBefore = null;
+const started = performance.now();
+let finished = false;
+let observer = null;
+let timer = null;
+const finish = (matched, answeredAt) => {
+  if (finished) return;
+  finished = true;
+  if (observer) observer.disconnect();
+  clearTimeout(timer);
+  done([matched, answeredAt, performance.now() - started]);
+};
+const check = () => {
+  for (const el of document.querySelectorAll(selector)) {
+    if (!el.getClientRects().length) continue;
+    const raw = el.innerText || '';
+    const text = raw.replace(/\\s+/g, ' ').trim().toLowerCase();
+    if (text && (text === wanted || text.includes(wanted) || wanted.includes(text))) {
+      finish(true, before.get(el) === raw ? -1 : performance.now() - started);
+      return;
+    }
+  }
+};
+observer = new MutationObserver(check);
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+timer = setTimeout(() => finish(false, -1), budgetMs);
+check();
+"""
+
+# Plain text controls whose value a script can set directly. Date inputs are
+# left to typing: what they accept depends on the browser's locale.
+BATCHED_INPUT_TYPES = {"text", "email", "tel", "url", "search", "number"}
+
+# Sets every value in one round trip. React keeps its own copy of each
+# controlled input's value and ignores a plain assignment to `el.value`, so the
+# value goes through the prototype's setter, which React watches, and is then
+# announced with the events a person typing would cause. Focusing and blurring
+# fires the focusout validation that some forms only run on leaving a field.
+#
+# A disabled or read-only control, or a value longer than the control's
+# maxlength, is refused rather than set: the setter ignores all three, where a
+# person typing would be stopped. Each value is read back, and anything refused
+# or rewritten by an input mask is typed instead, which fails visibly if the
+# control cannot take it.
+_NATIVE_FILL_SCRIPT = """
+return arguments[0].map(([el, value]) => {
+  try {
+    if (el.disabled || el.readOnly) return false;
+    if (el.maxLength > 0 && value.length > el.maxLength) return false;
+    const prototype = el instanceof HTMLTextAreaElement
+      ? HTMLTextAreaElement.prototype
+      : HTMLInputElement.prototype;
+    const setter = Object.getOwnPropertyDescriptor(prototype, 'value').set;
+    el.focus();
+    setter.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+    return el.value === value;
+  } catch (e) {
+    return false;
+  }
+});
+"""
+
+# Picks the option for a value in one round trip, rather than reading each
+# option's text over the wire: a country list has 250 of them. The exact text
+# wins, then the first text containing the value; nothing else is close enough.
+# Sharing words is not: "Bachelor of Arts" would commit "Bachelor of Fine Arts"
+# and "University of Texas at San Antonio" the Austin campus, where reporting
+# no match lets the person choose.
+#
+# Given a <select>, the option is selected in the page and its text returned.
+# Given none, the visible scripted-dropdown option is returned with its text,
+# to be clicked from Python like a person would: those widgets listen for
+# pointer events a scripted click does not send. A native select only matches a
+# value within an option's text, never the reverse, so "No" is not taken for
+# "I do not know". _select_native_option reads options one by one by the same
+# rules when the page refuses the script.
+_OPTION_MATCH_SCRIPT = """
+const [select, selector, wanted] = arguments;
+const norm = (text) => (text || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+const want = norm(wanted);
+if (!want) return null;
+const candidates = select
+  ? Array.from(select.options).filter((option) => !option.disabled)
+  : Array.from(document.querySelectorAll(selector)).filter((el) => el.getClientRects().length);
+const texts = candidates.map((el) => norm(select ? el.text : el.innerText));
+let pick = texts.findIndex((text) => text && text === want);
+if (pick < 0) {
+  pick = texts.findIndex((text) => text && (text.includes(want) || (!select && want.includes(text))));
+}
+if (pick < 0) return null;
+const winner = candidates[pick];
+if (!select) return [winner, winner.innerText.trim()];
+select.selectedIndex = winner.index;
+select.dispatchEvent(new Event('input', {bubbles: true}));
+select.dispatchEvent(new Event('change', {bubbles: true}));
+return [null, winner.text.trim()];
+"""
+
+
+class TypeaheadLatency:
+    """How quickly each site's typeaheads answer, learned over a run.
+
+    A fixed sleep after typing cost 1.5 seconds per typeahead whether the
+    options came back in 80 milliseconds or never would, and a Greenhouse form
+    has four or five: School, Degree, Country and the custom dropdowns. Waiting
+    in the page ends the wait when the options arrive; the learned budget bounds
+    the wait when none ever do.
+
+    Also keeps the totals for the run report: how many waits, how long they
+    took, and how long the fixed sleep would have taken instead.
+    """
+
+    def __init__(self) -> None:
+        self.samples: dict[str, deque[float]] = {}
+        self.waits = 0
+        self.seconds_waited = 0.0
+
+    def budget(self, site: str) -> float:
+        """Seconds to wait for options on ``site`` before giving up."""
+        seen = self.samples.get(site)
+        if not seen:
+            return TYPEAHEAD_SETTLE_SECONDS
+        return min(TYPEAHEAD_MAX_SECONDS, max(TYPEAHEAD_MIN_SECONDS, TYPEAHEAD_MARGIN * max(seen)))
+
+    def record(self, site: str, waited: float, answered_after: float | None) -> None:
+        """Count one wait, and learn from it if the typeahead answered at all."""
+        self.waits += 1
+        self.seconds_waited += waited
+        if answered_after is not None:
+            self.samples.setdefault(site, deque(maxlen=TYPEAHEAD_SAMPLES)).append(answered_after)
+
+    def summary(self) -> dict[str, Any]:
+        fixed = self.waits * TYPEAHEAD_SETTLE_SECONDS
+        return {
+            "waits": self.waits,
+            "seconds_waited": round(self.seconds_waited, 3),
+            "seconds_saved": round(fixed - self.seconds_waited, 3),
+            "budgets": {site: round(self.budget(site), 3) for site in sorted(self.samples)},
+        }
+
+
+TYPEAHEAD_LATENCY = TypeaheadLatency()
+
+
+def _site(driver: Any) -> str:
+    try:
+        return urlparse(driver.current_url).hostname or ""
+    except Exception:  # noqa: BLE001 - an unknown site just shares one budget
+        return ""
+
+
+def _note_options_before_typing(driver: Any) -> None:
+    """Remember the options already showing, so they are not taken for the answer."""
+    from selenium.common.exceptions import WebDriverException
+
+    try:
+        driver.execute_script(_OPTIONS_BEFORE_SCRIPT, COMBOBOX_OPTION_SELECTOR)
+    except WebDriverException:
+        logger.debug("Could not note the options showing before typing", exc_info=True)
+
+
+def _wait_for_options(driver: Any, wanted: str) -> bool:
+    """Wait for a typeahead to offer ``wanted``. Returns whether it did.
+
+    Call ``_note_options_before_typing`` before the keystrokes. A page that will
+    not run the script gets the old fixed-length wait, the site's budget, in
+    Python.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    site = _site(driver)
+    budget = TYPEAHEAD_LATENCY.budget(site)
+    started = time.perf_counter()
+    try:
+        matched, answered_ms, _ = driver.execute_async_script(
+            _OPTIONS_SETTLED_SCRIPT,
+            COMBOBOX_OPTION_SELECTOR,
+            wanted,
+            round(budget * 1000),
+        )
+    except (WebDriverException, ValueError, TypeError):
+        logger.debug("Could not wait for options in the page, sleeping instead", exc_info=True)
+        time.sleep(max(0.0, budget - (time.perf_counter() - started)))
+        matched, answered_ms = False, -1
+    waited = time.perf_counter() - started
+    answered = (
+        answered_ms / 1000
+        if matched and isinstance(answered_ms, (int, float)) and answered_ms >= 0
+        else None
+    )
+    TYPEAHEAD_LATENCY.record(site, waited, answered)
+    logger.debug("Typeahead on %s answered in %s, waited %.2fs", site or "page", answered, waited)
+    return bool(matched)
 
 
 def _dismiss_open_menus(driver: Any) -> None:
@@ -136,12 +380,13 @@ def _fill_combobox(driver: Any, match: FieldMatch, timeout: float) -> None:
     # A typeahead has no options at all until something is typed. Greenhouse
     # uses one for School and Degree, which query as you type, so opening it and
     # looking for a match finds an empty list every time.
+    _note_options_before_typing(driver)
     try:
         element.send_keys(match.value)
     except WebDriverException as exc:
         raise ValueError(f"Could not type into the dropdown for {match.value!r}") from exc
 
-    time.sleep(TYPEAHEAD_SETTLE_SECONDS)
+    _wait_for_options(driver, wanted)
     if _select_matching_option(driver, wanted):
         _dismiss_open_menus(driver)
         return
@@ -180,8 +425,42 @@ def _values_agree(wanted: str, committed: str) -> bool:
     return overlap >= 0.5
 
 
-def _select_matching_option(driver: Any, wanted: str) -> bool:
-    """Click the visible option matching ``wanted``. Returns whether it did."""
+def _pick_option(driver: Any, select: Any, wanted: str) -> list[Any] | None:
+    """Run the in-page option matcher. Raises ``LookupError`` if it could not run.
+
+    Returns ``[element, text]`` for a scripted dropdown, ``[None, text]`` for a
+    native select it has already set, or None when no option matched.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    try:
+        picked = driver.execute_script(
+            _OPTION_MATCH_SCRIPT, select, COMBOBOX_OPTION_SELECTOR, wanted
+        )
+    except WebDriverException as exc:
+        raise LookupError("The option matcher could not run") from exc
+    if picked is None:
+        return None
+    if isinstance(picked, list) and len(picked) == 2 and isinstance(picked[1], str):
+        return picked
+    raise LookupError(f"The option matcher returned {picked!r}")
+
+
+def _select_matching_option(driver: Any, wanted: str) -> str:
+    """Click the visible option matching ``wanted``. Returns its text, or "" if none did."""
+    try:
+        picked = _pick_option(driver, None, wanted)
+    except LookupError:
+        logger.debug("Matching options in the page failed, reading each one", exc_info=True)
+        return _select_matching_option_by_reading(driver, wanted)
+    if picked is None or picked[0] is None:
+        return ""
+    _click_element(driver, picked[0])
+    return picked[1] or wanted
+
+
+def _select_matching_option_by_reading(driver: Any, wanted: str) -> str:
+    """``_select_matching_option`` one option at a time, for a page that refuses scripts."""
     from selenium.common.exceptions import WebDriverException
     from selenium.webdriver.common.by import By
 
@@ -196,14 +475,44 @@ def _select_matching_option(driver: Any, wanted: str) -> bool:
                 continue
             if (text == wanted) if want_exact else (wanted in text or text in wanted):
                 _click_element(driver, option)
-                return True
-    return False
+                return text
+    return ""
 
 
-def _apply_one(driver: Any, match: FieldMatch, timeout: float) -> None:
-    """Write a single value into its element. Raises on failure."""
+def _select_native_option(driver: Any, element: Any, value: str) -> str:
+    """Select the option of a ``<select>`` matching ``value``. Returns its text.
+
+    Raises ``ValueError`` when no option matches.
+    """
     from selenium.webdriver.support.ui import Select
 
+    wanted = " ".join(value.split()).lower()
+    try:
+        picked = _pick_option(driver, element, wanted)
+    except LookupError:
+        logger.debug("Matching options in the page failed, reading each one", exc_info=True)
+    else:
+        if picked is None:
+            raise ValueError(f"No option in the dropdown matched {value!r}")
+        return picked[1]
+
+    select = Select(element)
+    options = [
+        (" ".join(option.text.split()).lower(), option)
+        for option in select.options
+        if option.is_enabled()
+    ]
+    for want_exact in (True, False):
+        for text, option in options:
+            if text and wanted and ((text == wanted) if want_exact else (wanted in text)):
+                if not option.is_selected():
+                    option.click()
+                return option.text
+    raise ValueError(f"No option in the dropdown matched {value!r}")
+
+
+def _apply_one(driver: Any, match: FieldMatch, timeout: float) -> None:
+    """Write a single value into its element. Raises on failure."""
     element = match.form_field.handle
     if element is None:
         raise ValueError("Field match has no live element handle")
@@ -220,23 +529,48 @@ def _apply_one(driver: Any, match: FieldMatch, timeout: float) -> None:
         return
 
     if match.form_field.tag == "select":
-        select = Select(element)
-        wanted = match.value.strip().lower()
-        for option in select.options:
-            if option.text.strip().lower() == wanted:
-                select.select_by_visible_text(option.text)
-                return
-        for option in select.options:
-            if wanted and wanted in option.text.strip().lower():
-                select.select_by_visible_text(option.text)
-                return
-        raise ValueError(f"No option in the dropdown matched {match.value!r}")
+        _select_native_option(driver, element, match.value)
+        return
 
     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
     element.clear()
     element.send_keys(match.value)
 
 
+def _is_batchable(match: FieldMatch) -> bool:
+    """Whether a script may set this control's value rather than typing it."""
+    form_field = match.form_field
+    if form_field.is_combobox or form_field.is_file_input:
+        return False
+    if form_field.tag == "textarea":
+        return True
+    return form_field.tag == "input" and form_field.field_type in BATCHED_INPUT_TYPES
+
+
+def _fill_natively(driver: Any, matches: list[FieldMatch]) -> set[int]:
+    """Set plain text values in the current frame with one script.
+
+    Returns the ``id`` of each match the page took as given. The rest are left
+    for ``_apply_one`` to type, as is everything when the script cannot run.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    batch = [m for m in matches if _is_batchable(m) and m.form_field.handle is not None]
+    if not batch:
+        return set()
+    try:
+        entered = driver.execute_script(
+            _NATIVE_FILL_SCRIPT, [[m.form_field.handle, m.value] for m in batch]
+        )
+    except WebDriverException:
+        logger.debug("Batched fill failed, typing each value instead", exc_info=True)
+        return set()
+    if not isinstance(entered, list) or len(entered) != len(batch):
+        logger.debug("Batched fill returned an unexpected result, typing each value instead")
+        return set()
+    return {id(match) for match, ok in zip(batch, entered, strict=True) if ok is True}
+
+
 def fill_form(
     driver: Any,
     resume: ResumeData,
@@ -244,70 +578,130 @@ def fill_form(
     resume_path: str = "",
     cover_letter_path: str = "",
     threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+    strategy: AssignmentStrategy | str = AssignmentStrategy.GREEDY,
+    plan_cache: PlanCache | None = None,
+    values: ResumeValues | None = None,
     timeout: float = 15.0,
     dry_run: bool = True,
+    batch: bool = True,
+    fields: list[FormField] | None = None,
+    watch: FormWatch | None = None,
 ) -> list[FieldMatch]:
     """Plan and optionally execute a fill of the form on the current page.
 
     With ``dry_run=True`` nothing is typed. The returned plan shows exactly what
     would have been entered, which is the recommended way to validate the engine
     against a new site before letting it touch anything.
-    """
-    from selenium.common.exceptions import WebDriverException
 
-    fields = fields_from_driver(driver)
-    logger.info("Found %d fillable controls on %s", len(fields), driver.current_url)
+    ``fields`` are controls already read from the page, which ``fill_wizard``
+    passes when a watch told it what changed; otherwise the page is scanned.
+    With a ``watch`` on the page, questions that a filled value reveals, such as
+    the follow-up a "Yes" shows, are planned and filled as well.
 
-    matches = plan_fill(fields, resume, resume_path=resume_path, threshold=threshold)
-
-    # The cover letter is a second file input and is not part of the resume
-    # schema, so patch it in when the caller supplied one.
-    if cover_letter_path:
-        for match in matches:
-            if match.canonical == "cover_letter" and not match.value:
-                match.value = cover_letter_path
-                match.status = FillStatus.FILLED
+    ``batch`` sets plain text values with one script per frame instead of
+    typing them; see ``_NATIVE_FILL_SCRIPT``.
+    """
+    if fields is None:
+        fields = fields_from_driver(driver)
+    url = driver.current_url
+    logger.info("Found %d fillable controls on %s", len(fields), url)
+
+    def plan(controls: list[FormField]) -> list[FieldMatch]:
+        matches = plan_fill(
+            controls,
+            resume,
+            resume_path=resume_path,
+            threshold=threshold,
+            strategy=strategy,
+            plan_cache=plan_cache,
+            values=values,
+            vendor=detect_vendor(url),
+        )
+        # The cover letter is a second file input and is not part of the resume
+        # schema, so patch it in when the caller supplied one.
+        if cover_letter_path:
+            for match in matches:
+                if match.canonical == "cover_letter" and not match.value:
+                    match.value = cover_letter_path
+                    match.status = FillStatus.FILLED
+        return matches
 
+    matches = plan(fields)
     if dry_run:
         for match in matches:
             if match.status is FillStatus.FILLED:
                 match.reason = "Dry run. Value not entered."
         return matches
 
+    _execute_plan(driver, matches, timeout, batch)
+    if watch is None:
+        return matches
+
+    # Only what the fill itself revealed is read and planned, never the whole
+    # form again. The rounds are capped for a page that keeps adding controls.
+    for _ in range(MAX_REVEAL_ROUNDS):
+        changes = watch.changes(driver)
+        if changes is None or not changes.added:
+            break
+        revealed = plan(changes.added)
+        _execute_plan(driver, revealed, timeout, batch)
+        matches.extend(revealed)
+    return matches
+
+
+def _execute_plan(driver: Any, matches: list[FieldMatch], timeout: float, batch: bool) -> None:
+    """Enter every planned value, marking the matches that could not be filled."""
+    from selenium.common.exceptions import WebDriverException
+
+    def failed(match: FieldMatch, exc: Exception) -> None:
+        match.status = FillStatus.FAILED
+        match.reason = f"{type(exc).__name__}: {exc}"
+        logger.warning("Could not fill %s: %s", match.form_field.describe(), exc)
+
     # Fill frame by frame. Controls are grouped by browsing context so the driver
     # switches once per frame rather than once per field, and the sort keeps the
-    # top document first.
-    current_path: tuple[int, ...] | None = None
+    # top document first. Within a frame, plain text values are set by one
+    # script; typing a long description a character at a time took most of a
+    # Workday run. Everything else is entered one control at a time.
+    to_fill = sorted(
+        (m for m in matches if m.status is FillStatus.FILLED),
+        key=lambda m: m.form_field.frame_path,
+    )
+    cursor = FrameCursor(driver)
     try:
-        for match in sorted(matches, key=lambda m: m.form_field.frame_path):
-            if match.status is not FillStatus.FILLED:
-                continue
+        for path, grouped in groupby(to_fill, key=lambda m: m.form_field.frame_path):
+            in_frame = list(grouped)
             try:
-                if match.form_field.frame_path != current_path:
-                    switch_to_frame_path(driver, match.form_field.frame_path)
-                    current_path = match.form_field.frame_path
-                _apply_one(driver, match, timeout)
-                logger.debug("Filled %s with %r", match.form_field.describe(), match.value)
-            except (WebDriverException, ValueError, FileNotFoundError) as exc:
-                match.status = FillStatus.FAILED
-                match.reason = f"{type(exc).__name__}: {exc}"
-                logger.warning("Could not fill %s: %s", match.form_field.describe(), exc)
+                cursor.move_to(path)
+                attach_handles(
+                    driver, [m.form_field for m in matches if m.form_field.frame_path == path]
+                )
+            except WebDriverException as exc:
+                for match in in_frame:
+                    failed(match, exc)
+                continue
+            entered = _fill_natively(driver, in_frame) if batch else set()
+            for match in in_frame:
+                try:
+                    if id(match) not in entered:
+                        _apply_one(driver, match, timeout)
+                    logger.debug("Filled %s with %r", match.form_field.describe(), match.value)
+                except (WebDriverException, ValueError, FileNotFoundError) as exc:
+                    failed(match, exc)
     finally:
         try:
             driver.switch_to.default_content()
         except WebDriverException:
             logger.debug("Could not return to the top document", exc_info=True)
 
-    return matches
-
 
-def _step_signature(driver: Any, matches: list[FieldMatch]) -> tuple[str, ...]:
+def _step_signature(driver: Any, fields: list[FormField]) -> tuple[str, ...]:
     """Identify a wizard step so a loop that stops progressing can be detected."""
     try:
         url = driver.current_url
     except Exception:  # noqa: BLE001 - a signature is best effort
         url = ""
-    return (url, *sorted(m.form_field.describe() for m in matches))
+    return (url, *sorted(form_field.describe() for form_field in fields))
 
 
 def fill_wizard(
@@ -317,8 +711,12 @@ def fill_wizard(
     resume_path: str = "",
     cover_letter_path: str = "",
     threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+    strategy: AssignmentStrategy | str = AssignmentStrategy.GREEDY,
+    plan_cache: PlanCache | None = None,
+    values: ResumeValues | None = None,
     timeout: float = 15.0,
     dry_run: bool = True,
+    batch: bool = True,
     max_steps: int = MAX_WIZARD_STEPS,
 ) -> list[FieldMatch]:
     """Fill a form that may span several pages, as Workday and similar ATS do.
@@ -332,20 +730,37 @@ def fill_wizard(
     """
     all_matches: list[FieldMatch] = []
     seen: set[tuple[str, ...]] = set()
+    watch: FormWatch | None = None
 
     for step in range(1, max_steps + 1):
+        # After the first step only the controls the step swapped in are read,
+        # unless the watch was lost, to a navigation or a new frame.
+        changes = watch.changes(driver) if watch is not None else None
+        if changes is not None:
+            fields = changes.added
+        else:
+            fields = fields_from_driver(driver)
+            watch = None if dry_run else FormWatch.start(driver, fields)
+
         matches = fill_form(
             driver,
             resume,
             resume_path=resume_path,
             cover_letter_path=cover_letter_path,
             threshold=threshold,
+            strategy=strategy,
+            plan_cache=plan_cache,
+            values=values,
             timeout=timeout,
             dry_run=dry_run,
+            batch=batch,
+            fields=fields,
+            watch=watch,
         )
         all_matches.extend(matches)
 
-        signature = _step_signature(driver, matches)
+        on_page = watch.fields if watch is not None else [m.form_field for m in matches]
+        signature = _step_signature(driver, on_page)
         if signature in seen:
             logger.info("Step %d looks identical to an earlier one, stopping.", step)
             break
@@ -381,24 +796,60 @@ def _has_next_button(driver: Any) -> bool:
     return False
 
 
-def _click_first(driver: Any, xpaths: tuple[str, ...], timeout: float) -> bool:
-    """Click the first clickable element matching any XPath. Returns success."""
-    from selenium.common.exceptions import TimeoutException, WebDriverException
+def _first_clickable(xpaths: list[str]) -> Any:
+    """A wait condition: the first XPath, in priority order, with a clickable match.
+
+    Clickable as Selenium's ``element_to_be_clickable`` means it: displayed and
+    enabled. An element that goes stale while being checked is passed over.
+    """
+    from selenium.common.exceptions import WebDriverException
     from selenium.webdriver.common.by import By
-    from selenium.webdriver.support import expected_conditions as EC
+
+    def condition(driver: Any) -> tuple[str, Any] | bool:
+        for xpath in xpaths:
+            try:
+                for element in driver.find_elements(By.XPATH, xpath):
+                    if element.is_displayed() and element.is_enabled():
+                        return xpath, element
+            except WebDriverException:
+                continue
+        return False
+
+    return condition
+
+
+def _click_first(driver: Any, xpaths: tuple[str, ...], timeout: float) -> str:
+    """Click the first clickable element matching any XPath, all within ``timeout``.
+
+    Returns the XPath that was clicked, or "" when none was. Waiting out each
+    XPath in turn cost a page with no apply button, a direct link to the form,
+    five full timeouts before the form was even looked at. Every candidate is
+    now checked on each poll of a single wait, and the first in priority order
+    wins. If clicking it fails, the others are raced again in whatever time is
+    left.
+    """
+    from selenium.common.exceptions import TimeoutException, WebDriverException
     from selenium.webdriver.support.ui import WebDriverWait
 
-    for xpath in xpaths:
+    deadline = time.monotonic() + timeout
+    candidates = list(xpaths)
+    while candidates:
         try:
-            element = WebDriverWait(driver, timeout).until(
-                EC.element_to_be_clickable((By.XPATH, xpath))
+            xpath, element = WebDriverWait(driver, max(0.0, deadline - time.monotonic())).until(
+                _first_clickable(candidates)
             )
+        except TimeoutException:
+            break
+        try:
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
             element.click()
-            return True
-        except (TimeoutException, WebDriverException):
+        except WebDriverException:
+            logger.debug("Could not click %s, trying the other candidates", xpath, exc_info=True)
+            candidates.remove(xpath)
             continue
-    return False
+        logger.debug("Clicked %s", xpath)
+        return xpath
+    return ""
 
 
 def apply_to_job(
@@ -409,8 +860,12 @@ def apply_to_job(
     resume_path: str = "",
     cover_letter_path: str = "",
     threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+    strategy: AssignmentStrategy | str = AssignmentStrategy.GREEDY,
+    plan_cache: PlanCache | None = None,
+    values: ResumeValues | None = None,
     timeout: float = 15.0,
     mode: RunMode = RunMode.PREVIEW,
+    batch: bool = True,
     max_steps: int = MAX_WIZARD_STEPS,
 ) -> ApplicationResult:
     """Open a posting, fill the application, and go only as far as ``mode`` allows.
@@ -445,8 +900,12 @@ def apply_to_job(
         resume_path=resume_path,
         cover_letter_path=cover_letter_path,
         threshold=threshold,
+        strategy=strategy,
+        plan_cache=plan_cache,
+        values=values,
         timeout=timeout,
         dry_run=not mode.types_anything,
+        batch=batch,
         max_steps=max_steps,
     )
 
@@ -211,6 +211,14 @@ class FormField:
     BeautifulSoup Tag in tests, and the matching engine must not depend on
     either. Only ``form_filler`` ever touches it.
     """
+    normalized_attributes: dict[str, tuple[str, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """Normalised descriptive text, filled in by the matching engine as it reads it.
+
+    Each entry keeps the raw text it was made from, so an attribute changed
+    after the scan is normalised again instead of being served stale.
+    """
 
     @property
     def is_file_input(self) -> bool:
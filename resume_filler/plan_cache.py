@@ -0,0 +1,140 @@
+"""Remembered matches for application forms seen before.
+
+A Greenhouse board serves the same application template for every posting on
+it, and a Workday tenant reuses its own, so a run over a 200-posting board used
+to match the identical form 200 times. The cache keys each matched form by its
+fingerprint and stores only the decision per control, the canonical field and
+its confidence, never a value from the resume. Values are still resolved fresh
+on every run.
+
+Entries made under a different vocabulary are dropped when the cache is
+opened, and the threshold, assignment strategy and vendor are part of every
+key, so a change to any of them is a miss rather than a stale plan.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+from .field_map import AssignmentStrategy, form_fingerprint, vocabulary_version
+from .models import FieldMatch, FormField
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PLANS = 500
+
+# A counter rather than a clock, so recency is exact however fast plans arrive.
+_NEXT_USE = "(SELECT COALESCE(MAX(used_at), 0) + 1 FROM plans)"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    key         TEXT PRIMARY KEY,
+    vocabulary  TEXT NOT NULL,
+    outcome     TEXT NOT NULL,
+    used_at     INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_plans_used_at ON plans(used_at);
+"""
+
+
+class PlanCache:
+    """A bounded, least recently used store of matched forms, kept in SQLite."""
+
+    def __init__(
+        self, path: str | Path = "plan_cache.db", *, max_plans: int = DEFAULT_MAX_PLANS
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.max_plans = max_plans
+        self.vocabulary = vocabulary_version()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.executescript(SCHEMA)
+            stale = connection.execute(
+                "DELETE FROM plans WHERE vocabulary != ?", (self.vocabulary,)
+            ).rowcount
+            connection.commit()
+        if stale:
+            logger.info("Dropped %d cached plan(s) made by an older vocabulary", stale)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def _key(
+        self,
+        fields: list[FormField],
+        threshold: float,
+        strategy: AssignmentStrategy | str,
+        vendor: str,
+    ) -> str:
+        parts = (
+            self.vocabulary,
+            repr(float(threshold)),
+            AssignmentStrategy(strategy).value,
+            vendor,
+            form_fingerprint(fields),
+        )
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        fields: list[FormField],
+        threshold: float,
+        strategy: AssignmentStrategy | str,
+        vendor: str = "",
+    ) -> list[tuple[str, float]] | None:
+        """The canonical field and confidence per control, or None when not cached."""
+        key = self._key(fields, threshold, strategy, vendor)
+        with closing(self._connect()) as connection:
+            row = connection.execute("SELECT outcome FROM plans WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            connection.execute(f"UPDATE plans SET used_at = {_NEXT_USE} WHERE key = ?", (key,))
+            connection.commit()
+        outcome = [(str(name), float(confidence)) for name, confidence in json.loads(row[0])]
+        if len(outcome) != len(fields):
+            return None
+        logger.debug("Plan cache hit for a form of %d controls", len(fields))
+        return outcome
+
+    def put(
+        self,
+        fields: list[FormField],
+        threshold: float,
+        strategy: AssignmentStrategy | str,
+        matches: list[FieldMatch],
+        vendor: str = "",
+    ) -> None:
+        """Remember the matches for this form, evicting the least recently used."""
+        if self.max_plans <= 0:
+            return
+        key = self._key(fields, threshold, strategy, vendor)
+        outcome = json.dumps([[match.canonical, match.confidence] for match in matches])
+        with closing(self._connect()) as connection:
+            connection.execute(
+                f"""
+                INSERT INTO plans (key, vocabulary, outcome, used_at)
+                VALUES (?, ?, ?, {_NEXT_USE})
+                ON CONFLICT(key) DO UPDATE SET
+                    outcome = excluded.outcome,
+                    used_at = excluded.used_at
+                """,
+                (key, self.vocabulary, outcome),
+            )
+            connection.execute(
+                """
+                DELETE FROM plans WHERE key NOT IN (
+                    SELECT key FROM plans ORDER BY used_at DESC LIMIT ?
+                )
+                """,
+                (self.max_plans,),
+            )
+            connection.commit()
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as connection:
+            return int(connection.execute("SELECT COUNT(*) FROM plans").fetchone()[0])
@@ -7,6 +7,7 @@ import logging
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 from .models import ApplicationResult, FieldMatch, FillStatus, ResumeData
 
@@ -291,8 +292,13 @@ def write_json_report(
     results: list[ApplicationResult],
     output_dir: str | Path,
     resume: ResumeData | None = None,
+    timings: dict[str, Any] | None = None,
 ) -> Path:
-    """Persist the full run for later inspection or diffing."""
+    """Persist the full run for later inspection or diffing.
+
+    ``timings`` records where the run spent its waiting, such as the typeahead
+    totals, so a slow run can be told apart from a slow site.
+    """
     directory = Path(output_dir).expanduser()
     directory.mkdir(parents=True, exist_ok=True)
     stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
@@ -327,6 +333,8 @@ def write_json_report(
             for result in results
         ],
     }
+    if timings:
+        payload["timings"] = timings
 
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
     logger.info("Wrote run report to %s", path)
@@ -0,0 +1,573 @@
+"""Scanning a live Chromium page from one DevTools snapshot.
+
+The frame walk in ``fields_from_driver`` pays for every browsing context in
+driver calls: counting the frames, switching into each one from the top
+document, then the bulk scan script. An embedded Greenhouse board inside a
+careers page with a cookie banner and a video player runs to several hundred
+calls before planning can start. ``DOMSnapshot.captureSnapshot`` returns every
+same-process frame and every shadow root in one response, with each node's
+attributes, text and layout, so here the whole page is read in one call and
+described in Python as the bulk scan describes it in the page:
+
+* controls are collected in the order ``collect`` finds them, light DOM first,
+  then each open shadow root, to the same depth;
+* frames are numbered as the walk numbers them, so ``frame_path`` means the same
+  thing whichever scan produced a field;
+* labels are resolved the way ``labelOf`` resolves them, from the rendered text.
+
+A snapshot carries no WebDriver elements. Each field holds a ``SnapshotHandle``
+until the fill enters its frame, and ``attach_handles`` then swaps every handle
+in that frame for the live element in one script call. A dry run never needs
+them.
+
+Firefox has no DevTools protocol, and a cross-origin frame lives in another
+renderer process that the snapshot cannot see into. The first falls back to the
+frame walk for the whole page, the second for that frame only.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .extractors import (
+    _SHADOW_WALK_FUNCTION,
+    CONTROL_SELECTOR,
+    SHADOW_MAX_DEPTH,
+    FrameCursor,
+    _clean,
+    _report_too_deep,
+    _scan_context,
+    _walk_frames,
+)
+from .models import FormField
+
+logger = logging.getLogger(__name__)
+
+# Read from the layout of every rendered node, in this order.
+_COMPUTED_STYLES = ["display", "visibility", "opacity"]
+
+_ELEMENT = 1
+_TEXT = 3
+_FRAGMENT = 11
+
+# What ``el.type`` reports for an input. Anything else reads as "text".
+_INPUT_TYPES = {
+    "button",
+    "checkbox",
+    "color",
+    "date",
+    "datetime-local",
+    "email",
+    "file",
+    "hidden",
+    "image",
+    "month",
+    "number",
+    "password",
+    "radio",
+    "range",
+    "reset",
+    "search",
+    "submit",
+    "tel",
+    "text",
+    "time",
+    "url",
+    "week",
+}
+
+_NATIVE_CONTROLS = {"input", "select", "textarea"}
+
+# Finds the same controls as the bulk scan, reporting only enough about each to
+# check it is the one the snapshot described.
+_LOCATE_SCRIPT = (
+    _SHADOW_WALK_FUNCTION
+    + """
+const [found, tooDeep] = collect(arguments[0], arguments[1]);
+const identify = (el) => [el.tagName.toLowerCase(), el.id || '', el.getAttribute('name') || ''];
+return [found, found.map(identify), tooDeep];
+"""
+)
+
+
+@dataclass(frozen=True)
+class SnapshotHandle:
+    """Stands in for a control's WebElement until its frame is entered.
+
+    ``position`` is the control's index in the order ``collect`` finds it in
+    its browsing context. The tag, id and name check that the page has not
+    changed underneath it.
+    """
+
+    frame_path: tuple[int, ...]
+    position: int
+    tag: str
+    element_id: str
+    name: str
+
+
+def _matches_control(tag: str, attributes: dict[str, str]) -> bool:
+    """Python reading of ``CONTROL_SELECTOR``. Keep the two in step."""
+    return (
+        tag in _NATIVE_CONTROLS
+        or attributes.get("role") in {"combobox", "listbox"}
+        or attributes.get("aria-haspopup") == "listbox"
+        or attributes.get("aria-autocomplete") == "list"
+    )
+
+
+def _is_combobox(tag: str, attributes: dict[str, str]) -> bool:
+    """Mirrors ``isCombobox`` in the bulk scan."""
+    if attributes.get("role", "").lower() in {"combobox", "listbox"}:
+        return True
+    if attributes.get("aria-autocomplete", "").lower() == "list":
+        return True
+    if tag in _NATIVE_CONTROLS:
+        return False
+    return attributes.get("aria-haspopup", "").lower() == "listbox"
+
+
+def _element_type(tag: str, attributes: dict[str, str]) -> str:
+    """What ``el.type`` would report, as the bulk scan reads it."""
+    declared = attributes.get("type", "").strip().lower()
+    if tag == "input":
+        return declared if declared in _INPUT_TYPES else "text"
+    if tag == "select":
+        return "select-multiple" if "multiple" in attributes else "select-one"
+    if tag == "textarea":
+        return "textarea"
+    return declared or "text"
+
+
+def _breaks_line(display: str) -> bool:
+    """Whether ``innerText`` sets an element with this display on its own line.
+
+    Inline boxes, inline-block included, run into the text around them, and
+    ``display: contents`` has no box of its own. Everything else is a block.
+    """
+    return bool(display) and not display.startswith("inline") and display != "contents"
+
+
+def _rare(data: dict[str, list[int]] | None) -> dict[int, int]:
+    """A snapshot's sparse per-node column, as node index to value."""
+    if not data:
+        return {}
+    return dict(zip(data["index"], data["value"], strict=True))
+
+
+class _Document:
+    """One document of a snapshot, with the lookups label resolution needs.
+
+    Nodes arrive in document order, each naming its parent, so the children of
+    every node come out in order too. A shadow root is a fragment among its
+    host's children; a frame's document is a separate entry in the snapshot.
+    """
+
+    def __init__(self, document: dict[str, Any], strings: list[str]) -> None:
+        def string(index: int) -> str:
+            return strings[index] if index >= 0 else ""
+
+        nodes = document["nodes"]
+        self.parents: list[int] = nodes["parentIndex"]
+        count = len(self.parents)
+        self.types: list[int] = nodes["nodeType"]
+        self.names = [string(index).lower() for index in nodes["nodeName"]]
+        self.values = [string(index) for index in nodes.get("nodeValue") or [-1] * count]
+        self.attributes = [
+            {string(pair[i]).lower(): string(pair[i + 1]) for i in range(0, len(pair) - 1, 2)}
+            for pair in nodes.get("attributes") or [[]] * count
+        ]
+        self.children: list[list[int]] = [[] for _ in range(count)]
+        for node, parent in enumerate(self.parents):
+            if parent >= 0:
+                self.children[parent].append(node)
+        self.frames = _rare(nodes.get("contentDocumentIndex"))
+        self.shadow_types = {
+            node: string(value) for node, value in _rare(nodes.get("shadowRootType")).items()
+        }
+
+        layout = document.get("layout") or {}
+        self.layout = {node: position for position, node in enumerate(layout.get("nodeIndex", []))}
+        self.styles = [[string(index) for index in row] for row in layout.get("styles", [])]
+        self.bounds: list[list[float]] = layout.get("bounds", [])
+
+        # Filled on first use, as LabelIndex is for a saved page.
+        self._labels_for: dict[int, dict[str, int]] = {}
+        self._by_id: dict[int, dict[str, int]] = {}
+        self._candidates: dict[int, list[int]] = {}
+
+    def light_nodes(self, root: int) -> Iterator[int]:
+        """Every node under ``root`` in document order, not entering shadow roots.
+
+        Template contents and pseudo-elements are skipped as well: neither is
+        something ``querySelectorAll`` returns.
+        """
+        stack = list(reversed(self.children[root]))
+        while stack:
+            node = stack.pop()
+            if self.types[node] == _FRAGMENT or self.names[node].startswith("::"):
+                continue
+            yield node
+            if self.names[node] != "template":
+                stack.extend(reversed(self.children[node]))
+
+    def light_elements(self, root: int) -> Iterator[int]:
+        return (node for node in self.light_nodes(root) if self.types[node] == _ELEMENT)
+
+    def open_shadow_roots(self, host: int) -> list[int]:
+        """The shadow roots script can see. Closed and user-agent roots it cannot."""
+        if self.names[host] == "template":
+            return []
+        roots = []
+        for child in self.children[host]:
+            if self.types[child] != _FRAGMENT:
+                continue
+            kind = self.shadow_types.get(child) or next(
+                (self.shadow_types[n] for n in self.children[child] if n in self.shadow_types),
+                "open",
+            )
+            if kind == "open":
+                roots.append(child)
+        return roots
+
+    def collect(self, max_depth: int) -> tuple[list[int], int]:
+        """The controls ``collect`` finds in this document, in its order."""
+        found: list[int] = []
+        too_deep = 0
+
+        def walk(root: int, depth: int) -> None:
+            nonlocal too_deep
+            if depth > max_depth:
+                too_deep += 1
+                return
+            elements = list(self.light_elements(root))
+            found.extend(
+                node
+                for node in elements
+                if _matches_control(self.names[node], self.attributes[node])
+            )
+            for host in elements:
+                for shadow in self.open_shadow_roots(host):
+                    walk(shadow, depth + 1)
+
+        walk(0, 0)
+        return found, too_deep
+
+    def root_of(self, node: int) -> int:
+        """The document or shadow root a node belongs to."""
+        while self.parents[node] >= 0 and self.types[node] != _FRAGMENT:
+            node = self.parents[node]
+        return node
+
+    def parent_element(self, node: int) -> int:
+        parent = self.parents[node]
+        return parent if parent >= 0 and self.types[parent] == _ELEMENT else -1
+
+    def closest(self, node: int, tag: str) -> int:
+        while node >= 0:
+            if self.names[node] == tag:
+                return node
+            node = self.parent_element(node)
+        return -1
+
+    def _style(self, node: int, name: str) -> str:
+        row = self.styles[self.layout[node]]
+        position = _COMPUTED_STYLES.index(name)
+        return row[position] if position < len(row) else ""
+
+    def shown(self, node: int) -> bool:
+        """The bulk scan's ``shown``, from the snapshot's layout."""
+        if node not in self.layout:
+            return False
+        if self._style(node, "display") == "none":
+            return False
+        if self._style(node, "visibility") in {"hidden", "collapse"}:
+            return False
+        ancestor = node
+        while ancestor >= 0:
+            if ancestor in self.layout and self._style(ancestor, "opacity") == "0":
+                return False
+            ancestor = self.parents[ancestor]
+        bounds = self.bounds[self.layout[node]]
+        return len(bounds) == 4 and bounds[2] > 0 and bounds[3] > 0
+
+    def text_content(self, node: int) -> str:
+        """``textContent``: every text node run together, as the page joins them."""
+        return _clean(
+            "".join(
+                self.values[text] for text in self.light_nodes(node) if self.types[text] == _TEXT
+            )
+        )
+
+    def inner_text(self, node: int) -> str:
+        """Rendered text, as ``innerText`` reads it.
+
+        An element that is not rendered reports its text content instead,
+        which is what ``innerText`` does too. Inline text runs together, so
+        ``First<span>Name</span>`` reads "FirstName"; a ``<br>`` or an element
+        laid out as a block, list item or table part starts a new line, which
+        cleaning turns into a space.
+        """
+        if node not in self.layout:
+            return self.text_content(node)
+        parts: list[str] = []
+        stack: list[int | str] = list(reversed(self.children[node]))
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                parts.append(item)
+                continue
+            if self.types[item] == _TEXT:
+                if item in self.layout:
+                    parts.append(self.values[item])
+                continue
+            if (
+                self.types[item] != _ELEMENT
+                or self.names[item] in {"template", "::before", "::after", "::marker"}
+                or item not in self.layout
+            ):
+                continue
+            if self.names[item] == "br":
+                parts.append("\n")
+                continue
+            breaks = _breaks_line(self._style(item, "display"))
+            if breaks:
+                parts.append("\n")
+                stack.append("\n")
+            stack.extend(reversed(self.children[item]))
+        return _clean("".join(parts))
+
+    def _index_root(self, root: int) -> None:
+        labels_for: dict[str, int] = {}
+        by_id: dict[str, int] = {}
+        for node in self.light_elements(root):
+            attributes = self.attributes[node]
+            if "id" in attributes:
+                by_id.setdefault(attributes["id"], node)
+            if self.names[node] == "label" and "for" in attributes:
+                labels_for.setdefault(attributes["for"], node)
+        self._labels_for[root] = labels_for
+        self._by_id[root] = by_id
+
+    def _label_for(self, root: int, element_id: str) -> int:
+        if root not in self._labels_for:
+            self._index_root(root)
+        return self._labels_for[root].get(element_id, -1)
+
+    def _element(self, root: int, element_id: str) -> int:
+        if root not in self._by_id:
+            self._index_root(root)
+        return self._by_id[root].get(element_id, -1)
+
+    def _legend_text(self, node: int) -> str:
+        fieldset = self.closest(node, "fieldset")
+        if fieldset < 0:
+            return ""
+        legend = next((n for n in self.light_elements(fieldset) if self.names[n] == "legend"), -1)
+        return self.inner_text(legend) if legend >= 0 else ""
+
+    def _container_candidates(self, container: int) -> list[int]:
+        if container not in self._candidates:
+            self._candidates[container] = [
+                node
+                for node in self.light_elements(container)
+                if self.names[node] in {"label", "legend"}
+                or "label" in self.attributes[node].get("class", "")
+            ]
+        return self._candidates[container]
+
+    def label(self, node: int) -> str:
+        """``labelOf`` in the bulk scan, step for step."""
+        attributes = self.attributes[node]
+        root = self.root_of(node)
+        element_id = attributes.get("id", "")
+        if element_id:
+            explicit = self._label_for(root, element_id)
+            if explicit >= 0:
+                return self.inner_text(explicit)
+        labelled_by = attributes.get("aria-labelledby", "")
+        if labelled_by:
+            targets = [self._element(root, token) for token in labelled_by.split()]
+            parts = [self.inner_text(target) for target in targets if target >= 0]
+            if parts:
+                return _clean(" ".join(parts))
+        if attributes.get("type", "").lower() in {"radio", "checkbox"}:
+            legend = self._legend_text(node)
+            if legend:
+                return legend
+        ancestor = self.closest(node, "label")
+        if ancestor >= 0:
+            return self.inner_text(ancestor)
+        legend = self._legend_text(node)
+        if legend:
+            return legend
+        current = node
+        for _ in range(4):
+            parent = self.parent_element(current)
+            if parent < 0:
+                break
+            for candidate in self._container_candidates(parent):
+                bound_to = self.attributes[candidate].get("for", "")
+                if bound_to and bound_to != element_id:
+                    continue
+                text = self.inner_text(candidate) or self.text_content(candidate)
+                if text:
+                    return text
+            current = parent
+        return ""
+
+    def describe(self, node: int) -> dict[str, Any]:
+        """The bulk scan's ``describe`` for one control."""
+        tag = self.names[node]
+        attributes = self.attributes[node]
+        return {
+            "tag": tag,
+            "type": _element_type(tag, attributes),
+            "name": attributes.get("name", ""),
+            "id": attributes.get("id", ""),
+            "ariaLabel": attributes.get("aria-label", ""),
+            "placeholder": attributes.get("placeholder", ""),
+            "autocomplete": attributes.get("autocomplete", ""),
+            "accept": attributes.get("accept", ""),
+            "required": "required" in attributes
+            or attributes.get("aria-required", "").lower() == "true",
+            "ariaHidden": attributes.get("aria-hidden", ""),
+            "displayed": self.shown(node),
+            "combobox": _is_combobox(tag, attributes),
+            "label": self.label(node),
+            "options": [
+                self.text_content(option)
+                for option in self.light_elements(node)
+                if self.names[option] == "option"
+            ]
+            if tag == "select"
+            else [],
+        }
+
+    def frame_elements(self) -> list[int]:
+        """The frames the walk would count here: ``iframe, frame`` in the light DOM."""
+        return [node for node in self.light_elements(0) if self.names[node] in {"iframe", "frame"}]
+
+
+def capture_snapshot(driver: Any) -> dict[str, Any] | None:
+    """The page's DOM snapshot, or None when the driver cannot take one."""
+    from selenium.common.exceptions import WebDriverException
+
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return None
+    try:
+        snapshot = driver.execute_cdp_cmd(
+            "DOMSnapshot.captureSnapshot", {"computedStyles": _COMPUTED_STYLES}
+        )
+    except WebDriverException:
+        logger.debug("DOM snapshot failed, walking the frames instead", exc_info=True)
+        return None
+    if not isinstance(snapshot, dict) or not snapshot.get("documents"):
+        logger.debug("DOM snapshot came back empty, walking the frames instead")
+        return None
+    return snapshot
+
+
+def fields_from_snapshot(
+    driver: Any, max_depth: int, cursor: FrameCursor
+) -> list[FormField] | None:
+    """Every control on the page from one snapshot, or None to walk the frames instead.
+
+    Fields come out in the order the frame walk produces them, before
+    ``normalize_fields``, which the caller runs on either. ``cursor`` is at the
+    top document, and takes the driver into any frame the snapshot left out.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    snapshot = capture_snapshot(driver)
+    if snapshot is None:
+        return None
+    try:
+        strings = snapshot["strings"]
+        documents = [_Document(document, strings) for document in snapshot["documents"]]
+    except (KeyError, IndexError, TypeError, ValueError):
+        logger.debug("DOM snapshot had an unexpected shape, walking the frames instead")
+        return None
+
+    fields: list[FormField] = []
+    walked = 0
+
+    def scan(index: int, path: tuple[int, ...]) -> None:
+        nonlocal walked
+        document = documents[index]
+        found, too_deep = document.collect(SHADOW_MAX_DEPTH)
+        _report_too_deep(too_deep)
+        described = []
+        for position, node in enumerate(found):
+            control = document.describe(node)
+            handle = SnapshotHandle(path, position, control["tag"], control["id"], control["name"])
+            described.append((handle, control))
+        fields.extend(_scan_context(driver, path, described))
+        if len(path) >= max_depth:
+            return
+        for frame_index, frame in enumerate(document.frame_elements()):
+            child_path = (*path, frame_index)
+            child = document.frames.get(frame)
+            if child is not None:
+                scan(child, child_path)
+                continue
+            # Out of process, so out of the snapshot. Walk this one frame.
+            walked += 1
+            try:
+                cursor.move_to(child_path)
+                _walk_frames(driver, child_path, max_depth, fields, cursor)
+            except WebDriverException:
+                logger.debug("Skipped inaccessible frame at path %s", child_path)
+
+    try:
+        scan(0, ())
+    except (KeyError, IndexError, TypeError, ValueError):
+        logger.debug("DOM snapshot had an unexpected shape, walking the frames instead")
+        return None
+    logger.debug(
+        "Read %d document(s) from one DOM snapshot, walked %d frame(s) outside it",
+        len(documents),
+        walked,
+    )
+    return fields
+
+
+def attach_handles(driver: Any, fields: list[FormField]) -> None:
+    """Swap snapshot handles for live elements, for fields in the current frame.
+
+    One script finds the controls in the order the snapshot listed them. A
+    control whose tag, id and name no longer agree is looked up by those
+    instead, and one that is gone is left without a handle, so the fill
+    reports it as failed rather than writing into its neighbour.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    pending = [f for f in fields if isinstance(f.handle, SnapshotHandle)]
+    if not pending:
+        return
+    located: list[tuple[Any, tuple[str, ...]]] = []
+    try:
+        found, identities, too_deep = driver.execute_script(
+            _LOCATE_SCRIPT, CONTROL_SELECTOR, SHADOW_MAX_DEPTH
+        )
+        located = [
+            (element, tuple(identity)) for element, identity in zip(found, identities, strict=True)
+        ]
+        _report_too_deep(too_deep)
+    except (WebDriverException, ValueError, TypeError):
+        logger.debug("Could not locate controls from the snapshot", exc_info=True)
+
+    for form_field in pending:
+        handle: SnapshotHandle = form_field.handle
+        wanted = (handle.tag, handle.element_id, handle.name)
+        element = None
+        if handle.position < len(located) and located[handle.position][1] == wanted:
+            element = located[handle.position][0]
+        elif handle.element_id or handle.name:
+            element = next((el for el, identity in located if identity == wanted), None)
+        if element is None:
+            logger.debug("No live element for %s", form_field.describe())
+        form_field.handle = element
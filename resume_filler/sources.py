@@ -14,10 +14,12 @@ from __future__ import annotations
 
 import csv
 import logging
+import re
 from pathlib import Path
 
 import requests
 
+from .extractors import DEFAULT_HTML_PARSER, parse_html, prune_html
 from .models import JobPosting
 
 logger = logging.getLogger(__name__)
@@ -116,7 +118,27 @@ def _best_description(meta_text: str, body_text: str) -> str:
     return meta_text if len(meta_text) > len(body_text) else body_text
 
 
-def from_html_file(path: str | Path) -> list[JobPosting]:
+_NOSCRIPT = re.compile(r"<noscript\b[^>]*>.*?</noscript\s*>", re.IGNORECASE | re.DOTALL)
+_HEAD = re.compile(r"<head\b[^>]*>(.*?)</head\s*>", re.IGNORECASE | re.DOTALL)
+_HEAD_KEPT = re.compile(r"<title\b[^>]*>.*?</title\s*>|<meta\b[^>]*>", re.IGNORECASE | re.DOTALL)
+
+
+def _posting_markup(html: str) -> str:
+    """Only what a posting is read from: the head's title and meta tags, and the body.
+
+    A saved page's head is mostly links, preloads and inline bundles, none of
+    which the reader looks at, so they are dropped before parsing rather than
+    after. ``prune_html`` takes the scripts, styles and icons out of the body.
+    """
+    pruned = _NOSCRIPT.sub(" ", prune_html(html))
+    return _HEAD.sub(
+        lambda head: "<head>" + "".join(_HEAD_KEPT.findall(head.group(1))) + "</head>",
+        pruned,
+        count=1,
+    )
+
+
+def from_html_file(path: str | Path, parser: str = DEFAULT_HTML_PARSER) -> list[JobPosting]:
     """Read a single posting from a page saved out of the browser.
 
     Only Greenhouse and Lever publish an API the tool can query. Everything else
@@ -125,15 +147,12 @@ def from_html_file(path: str | Path) -> list[JobPosting]:
     text alone comes back as form chrome ("mm", "yyyy", "spin buttons").
     Both sources are read and the longer one wins.
     """
-    from bs4 import BeautifulSoup
-
     file_path = Path(path).expanduser()
     if not file_path.is_file():
         raise FileNotFoundError(f"Saved posting not found: {file_path}")
 
-    soup = BeautifulSoup(file_path.read_text(encoding="utf-8", errors="replace"), "html.parser")
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
+    html = file_path.read_text(encoding="utf-8", errors="replace")
+    soup = parse_html(_posting_markup(html), parser)
 
     meta_text = ""
     for selector in ("meta[name='description']", "meta[property='og:description']"):
@@ -0,0 +1,63 @@
+"""Which ATS a page belongs to, and the vocabulary packs that go with it.
+
+The matching vocabulary lives in JSON files under ``packs/``. ``base.json`` is
+what every form is matched against. A vendor pack adds patterns and negatives
+to base fields for markup only that vendor produces, and is read the first time
+a form from that vendor is planned, never before. Its patterns go into a
+vocabulary of their own, so a Workday rule cannot cost a Greenhouse form
+anything, or change how one is matched.
+
+Detection is a substring search for the vendor's hostnames, which works on a
+live page's URL and on a saved page alike: a saved Workday page still loads its
+scripts from myworkdayjobs.com.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+PACK_DIR = Path(__file__).resolve().parent / "packs"
+BASE_PACK = "base"
+
+# Vendors with a pack, and the hostnames that identify their pages.
+VENDOR_HOSTS: dict[str, tuple[str, ...]] = {
+    "workday": ("myworkdayjobs.com", "myworkday.com", "myworkdaysite.com"),
+    "icims": ("icims.com",),
+    "smartrecruiters": ("smartrecruiters.com",),
+}
+
+
+def detect_vendor(text: str) -> str:
+    """The vendor whose hostnames appear in a URL or page source, or empty."""
+    lowered = text.lower()
+    for vendor, hosts in VENDOR_HOSTS.items():
+        if any(host in lowered for host in hosts):
+            return vendor
+    return ""
+
+
+@cache
+def load_pack(name: str) -> dict[str, Any]:
+    """The parsed pack file. Read once per process, and only when asked for.
+
+    Raises ValueError for a name with no pack, since a misspelt vendor would
+    otherwise silently match with the base vocabulary alone.
+    """
+    if name != BASE_PACK and name not in VENDOR_HOSTS:
+        raise ValueError(f"No vocabulary pack named {name!r}")
+    pack: dict[str, Any] = json.loads((PACK_DIR / f"{name}.json").read_text(encoding="utf-8"))
+    return pack
+
+
+@cache
+def packs_digest() -> str:
+    """Changes whenever any pack file does, whether or not it has been loaded."""
+    digest = hashlib.sha256()
+    for name in (BASE_PACK, *VENDOR_HOSTS):
+        digest.update(name.encode("utf-8"))
+        digest.update((PACK_DIR / f"{name}.json").read_bytes())
+    return digest.hexdigest()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from resume_filler import sources
+from resume_filler import cli, sources
 from resume_filler.cli import build_parser
 from resume_filler.config import Settings
 from resume_filler.models import JobPosting
@@ -49,6 +49,74 @@ class TestSettings:
         settings = Settings(resume_path=resume, browser="netscape")
         assert any("Unsupported browser" in p for p in settings.validate_for_browsing())
 
+    def test_assignment_strategy_is_read_and_checked(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv("ASSIGNMENT_STRATEGY", "Optimal")
+        assert Settings.from_env(tmp_path / "missing.env").assignment_strategy == "optimal"
+
+        monkeypatch.setenv("ASSIGNMENT_STRATEGY", "fastest")
+        with pytest.raises(ValueError, match="ASSIGNMENT_STRATEGY 'fastest'"):
+            Settings.from_env(tmp_path / "missing.env")
+
+    def test_bad_assignment_strategy_stops_inspect_before_it_starts(
+        self, monkeypatch, tmp_path, capsys
+    ) -> None:
+        monkeypatch.setenv("ASSIGNMENT_STRATEGY", "bogus")
+        argv = ["--env-file", str(tmp_path / "missing.env"), "inspect", "--html", "page.html"]
+        assert cli.main(argv) == 2
+        out = capsys.readouterr()
+        assert "Configuration error" in out.err and "ASSIGNMENT_STRATEGY" in out.err
+        assert not out.out, "nothing is reported before the settings are checked"
+
+    def test_plan_cache_sits_beside_the_tracker(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv("PLAN_CACHE_SIZE", "0")
+        settings = Settings.from_env(tmp_path / "missing.env")
+        assert settings.plan_cache_size == 0
+        assert settings.plan_cache_path.parent == settings.database_path.parent
+
+    @pytest.mark.parametrize("raw", ["-1", "abc", "500 plans"])
+    def test_malformed_plan_cache_size_is_an_error(self, monkeypatch, tmp_path, raw) -> None:
+        monkeypatch.setenv("PLAN_CACHE_SIZE", raw)
+        with pytest.raises(ValueError, match="PLAN_CACHE_SIZE"):
+            Settings.from_env(tmp_path / "missing.env")
+
+    def test_malformed_plan_cache_size_stops_the_cli(self, monkeypatch, tmp_path, capsys) -> None:
+        monkeypatch.setenv("PLAN_CACHE_SIZE", "abc")
+        assert cli.main(["--env-file", str(tmp_path / "missing.env"), "export"]) == 2
+        assert "PLAN_CACHE_SIZE" in capsys.readouterr().err
+
+    def test_inspect_writes_no_plan_cache(self, monkeypatch, tmp_path, resume, fixture_dir) -> None:
+        monkeypatch.setattr(cli, "parse_resume", lambda path: resume)
+        settings = Settings(
+            database_path=tmp_path / "applications.db", profile_path=tmp_path / "none.json"
+        )
+        args = build_parser().parse_args(
+            ["inspect", "--html", str(fixture_dir / "greenhouse_form.html")]
+        )
+        assert cli.command_inspect(args, settings) == 0
+        assert not settings.plan_cache_path.exists()
+
+    def test_html_parser_is_read_and_checked(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv("HTML_PARSER", " LXML ")
+        assert Settings.from_env(tmp_path / "missing.env").html_parser == "lxml"
+
+        monkeypatch.setenv("HTML_PARSER", "regex")
+        with pytest.raises(ValueError, match="HTML_PARSER 'regex'"):
+            Settings.from_env(tmp_path / "missing.env")
+
+    def test_bad_html_parser_stops_a_corpus_run_before_any_worker(
+        self, monkeypatch, tmp_path, capsys
+    ) -> None:
+        monkeypatch.setenv("HTML_PARSER", "html5lib")
+        argv = ["--env-file", str(tmp_path / "missing.env"), "inspect", "--html-dir", "pages"]
+        assert cli.main(argv) == 2
+        assert "HTML_PARSER" in capsys.readouterr().err
+
+    def test_batch_fill_is_on_unless_turned_off(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.delenv("BATCH_FILL", raising=False)
+        assert Settings.from_env(tmp_path / "missing.env").batch_fill
+        monkeypatch.setenv("BATCH_FILL", "false")
+        assert not Settings.from_env(tmp_path / "missing.env").batch_fill
+
     def test_malformed_numeric_env_falls_back_to_default(self, monkeypatch, tmp_path) -> None:
         monkeypatch.setenv("PAGE_TIMEOUT", "not-a-number")
         settings = Settings.from_env(tmp_path / "missing.env")
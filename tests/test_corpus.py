@@ -0,0 +1,161 @@
+"""Tests for planning a directory of saved pages, as inspect --html-dir does."""
+
+from __future__ import annotations
+
+import io
+import json
+import shutil
+from argparse import Namespace
+
+import pytest
+
+from resume_filler import cli, corpus
+from resume_filler.config import Settings
+from resume_filler.field_map import ResumeValues
+
+ICIMS_PAGE = """<html><body>
+<input name="search" placeholder="Search jobs">
+<iframe src="apply_files/form.html"></iframe>
+</body></html>"""
+
+ICIMS_FRAME = """<html><body><form>
+<label for="fn">First Name</label><input id="fn" required>
+<label for="em">Email</label><input id="em" type="email" required>
+<label for="q">Favourite colour of the hiring manager</label><input id="q" required>
+</form></body></html>"""
+
+
+@pytest.fixture
+def saved_dir(tmp_path, fixture_dir):
+    """A small corpus: two fixtures, and an iCIMS page with its frame saved beside it."""
+    shutil.copy(fixture_dir / "greenhouse_form.html", tmp_path / "greenhouse.html")
+    (tmp_path / "nested").mkdir()
+    shutil.copy(fixture_dir / "lever_form.html", tmp_path / "nested" / "lever.htm")
+    (tmp_path / "apply.html").write_text(ICIMS_PAGE, encoding="utf-8")
+    (tmp_path / "apply_files").mkdir()
+    (tmp_path / "apply_files" / "form.html").write_text(ICIMS_FRAME, encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("not a page", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def planner(resume):
+    return corpus.PagePlanner(resume, ResumeValues.build(resume))
+
+
+def _without_timings(records):
+    return [{k: v for k, v in record.items() if k != "seconds"} for record in records]
+
+
+class TestSavedPages:
+    def test_frame_companions_are_not_pages_of_their_own(self, saved_dir) -> None:
+        pages = corpus.saved_pages(saved_dir)
+        assert [page.relative_to(saved_dir).as_posix() for page in pages] == [
+            "apply.html",
+            "greenhouse.html",
+            "nested/lever.htm",
+        ]
+
+
+class TestPagePlanner:
+    def test_a_page_is_planned_through_its_saved_frames(self, saved_dir, planner) -> None:
+        record = planner(saved_dir / "apply.html")
+        assert record["controls"] == 4
+        assert record["filled"] == 2
+        assert record["unrecognised_required"] == 1
+        assert set(record["seconds"]) == {"extract", "plan"}
+        assert [f["canonical"] for f in record["fields"]][1:3] == ["first_name", "email"]
+
+    def test_an_unreadable_page_is_recorded_not_raised(self, tmp_path, planner) -> None:
+        record = planner(tmp_path / "gone.html")
+        assert record["page"].endswith("gone.html")
+        assert "error" in record
+
+    def test_a_page_that_breaks_planning_is_recorded_not_raised(
+        self, saved_dir, planner, monkeypatch
+    ) -> None:
+        def broken(*args, **kwargs):
+            raise KeyError("canonical")
+
+        monkeypatch.setattr(corpus, "plan_fill", broken)
+        record = planner(saved_dir / "greenhouse.html")
+        assert record == {
+            "page": str(saved_dir / "greenhouse.html"),
+            "error": "KeyError: 'canonical'",
+        }
+
+
+class TestPlanPages:
+    def test_a_pool_gives_the_serial_records_in_page_order(self, saved_dir, planner) -> None:
+        pages = corpus.saved_pages(saved_dir) * 3
+        serial = list(corpus.plan_pages(pages, planner))
+        pooled = list(corpus.plan_pages(pages, planner, workers=2))
+        assert _without_timings(pooled) == _without_timings(serial)
+        assert [record["page"] for record in pooled] == [str(page) for page in pages]
+
+    def test_no_more_than_the_bound_is_queued(self, saved_dir, planner, monkeypatch) -> None:
+        submitted: list[int] = []
+        consumed = 0
+
+        class CountingPool:
+            def __init__(self, **kwargs) -> None:
+                kwargs["initializer"](*kwargs["initargs"])
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc) -> None:
+                return None
+
+            def submit(self, func, page):
+                from concurrent.futures import Future
+
+                submitted.append(consumed)
+                future: Future = Future()
+                future.set_result(func(page))
+                return future
+
+        monkeypatch.setattr(corpus, "ProcessPoolExecutor", CountingPool)
+        pages = corpus.saved_pages(saved_dir) * 10
+        for _ in corpus.plan_pages(pages, planner, workers=2):
+            consumed += 1
+        limit = 2 * (1 + corpus.PAGES_IN_FLIGHT_PER_WORKER)
+        assert all(index - done <= limit for index, done in enumerate(submitted))
+
+
+class TestCorpusReport:
+    def test_one_line_per_page_then_the_totals(self, saved_dir, planner) -> None:
+        out = io.StringIO()
+        pages = [*corpus.saved_pages(saved_dir), saved_dir / "gone.html"]
+        totals = corpus.write_corpus_report(corpus.plan_pages(pages, planner), out)
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert len(lines) == 5
+        assert lines[-1] == {"totals": totals}
+        assert totals["pages"] == 4 and totals["errors"] == 1
+        assert totals["filled"] == sum(line.get("filled", 0) for line in lines[:-1])
+
+    def test_inspect_html_dir(self, saved_dir, resume, tmp_path, monkeypatch, capsys) -> None:
+        args = cli.build_parser().parse_args(
+            ["inspect", "--html-dir", str(saved_dir), "--workers", "1", "--output", "out.jsonl"]
+        )
+        assert isinstance(args, Namespace) and args.html_dir == str(saved_dir)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(cli, "parse_resume", lambda path: resume)
+        assert cli.command_inspect(args, Settings(profile_path=tmp_path / "none.json")) == 0
+        lines = (tmp_path / "out.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 4
+        assert "Planned 3 page(s)" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("workers", ["0", "-3"])
+    def test_workers_below_one_are_refused(self, saved_dir, workers, capsys) -> None:
+        with pytest.raises(SystemExit) as exited:
+            cli.main(["inspect", "--html-dir", str(saved_dir), "--workers", workers])
+        assert exited.value.code == 2
+        assert "--workers must be 1 or more" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("extra", [["--workers", "2"], ["--output", "out.jsonl"]])
+    def test_corpus_options_need_html_dir(self, extra, capsys) -> None:
+        with pytest.raises(SystemExit) as exited:
+            cli.main(["inspect", "--html", "page.html", *extra])
+        assert exited.value.code == 2
+        assert "--html-dir" in capsys.readouterr().err
@@ -6,16 +6,23 @@ end to end without a browser, a network connection, or a driver binary.
 
 from __future__ import annotations
 
+import re
+from pathlib import Path
+
 import pytest
 
 from resume_filler.extractors import fields_from_html
 from resume_filler.field_map import (
+    ATTRIBUTE_WEIGHTS,
     CANONICAL_FIELDS,
+    VOCABULARIES,
     FillPolicy,
     match_form,
     normalize,
+    pattern_scores,
     plan_fill,
     resolve_value,
+    score_control,
     score_field,
 )
 from resume_filler.models import FillStatus, FormField
@@ -45,6 +52,31 @@ class TestNormalize:
     def test_normalizes_identifier_styles(self, raw: str, expected: str) -> None:
         assert normalize(raw) == expected
 
+    def test_each_attribute_is_normalised_once_per_control(self, monkeypatch) -> None:
+        from resume_filler import field_map
+
+        seen: list[str] = []
+        real = field_map.normalize
+
+        def counting(text: str) -> str:
+            seen.append(text)
+            return real(text)
+
+        monkeypatch.setattr(field_map, "normalize", counting)
+        control = FormField(tag="input", label="First Name", name="firstName")
+        match_form([control])
+        match_form([control])
+        assert seen.count("First Name") == 1
+        assert seen.count("firstName") == 1
+
+    def test_an_attribute_changed_after_the_scan_is_normalised_again(self) -> None:
+        from resume_filler.field_map import normalized_attribute
+
+        control = FormField(tag="input", label="First Name")
+        assert normalized_attribute(control, "label") == "first name"
+        control.label = "Last Name"
+        assert normalized_attribute(control, "label") == "last name"
+
 
 class TestScoring:
     def test_autocomplete_token_wins_outright(self) -> None:
@@ -68,6 +100,118 @@ class TestScoring:
         assert all(score_field(field, canonical) == 0.0 for canonical in CANONICAL_FIELDS)
 
 
+def _per_pattern_score(canonical, text: str) -> float:
+    """The original scorer: one ``re.search`` per raw pattern string."""
+    if not text:
+        return 0.0
+    if any(re.search(negative, text) for negative in canonical.negatives):
+        return 0.0
+    return max((s for p, s in canonical.patterns if re.search(p, text)), default=0.0)
+
+
+class TestCompiledPatterns:
+    """Compiling the vocabulary must not change a single score."""
+
+    @pytest.mark.parametrize(
+        "fixture", sorted(p.name for p in (Path(__file__).parent / "fixtures").glob("*.html"))
+    )
+    def test_scores_match_the_per_pattern_search(self, fixture_dir, fixture) -> None:
+        html = (fixture_dir / fixture).read_text(encoding="utf-8")
+        texts = {
+            normalize(getattr(field, attribute))
+            for field in fields_from_html(html)
+            for attribute in ATTRIBUTE_WEIGHTS
+        }
+        for text in texts:
+            for vocabulary, fields in VOCABULARIES.items():
+                for canonical in fields:
+                    expected = _per_pattern_score(canonical, text)
+                    assert canonical.best_pattern_score(text) == expected, (canonical.name, text)
+                    assert pattern_scores(text, vocabulary).get(canonical.name, 0.0) == expected
+
+    @pytest.mark.parametrize(
+        "fixture", sorted(p.name for p in (Path(__file__).parent / "fixtures").glob("*.html"))
+    )
+    def test_scoring_a_whole_control_agrees_with_each_pair(self, fixture_dir, fixture) -> None:
+        html = (fixture_dir / fixture).read_text(encoding="utf-8")
+        for field in fields_from_html(html):
+            for vocabulary in VOCABULARIES.values():
+                scores = score_control(field, vocabulary)
+                assert scores == {c.name: score_field(field, c) for c in vocabulary}
+
+    def test_best_tier_wins_whatever_order_the_patterns_match_in(self) -> None:
+        full_name = next(f for f in CANONICAL_FIELDS if f.name == "full_name")
+        # "your name" (0.90) appears before "legal name" (0.95) in the text.
+        assert full_name.best_pattern_score("your name as legal name") == 0.95
+
+    def test_a_field_outside_the_vocabulary_is_still_scored(self) -> None:
+        from resume_filler.field_map import CanonicalField
+
+        custom = CanonicalField(name="email", patterns=((r"\bcorreo\b", 1.0),))
+        assert score_field(FormField(tag="input", label="Correo"), custom) == 1.0
+
+
+class TestTokenIndex:
+    """The shortlist may offer a field that then scores zero, never drop one that would not."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "literal"),
+        [
+            (r"\bfirst\s*name\b", "first"),
+            (r"(confirm|verify|re-?enter|repeat)\w*\s*e-?mail", "mail"),
+            (r"\byears?\s*(of\s*)?experience\b", "experience"),
+            (r"x[abc]yz", "yz"),
+            (r"^\d{2}\s*-?\s*\d{2}$", ""),
+            (r"\bcv\b|\bresume\b", ""),
+        ],
+    )
+    def test_required_literal(self, pattern: str, literal: str) -> None:
+        from resume_filler.field_map import _required_literal
+
+        assert _required_literal(pattern) == literal
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_pruned_scores_equal_scoring_every_field(self, seed: int) -> None:
+        import random
+
+        rng = random.Random(seed)
+        words = sorted(
+            {
+                word
+                for f in CANONICAL_FIELDS
+                for p, _ in f.patterns
+                for word in re.findall("[a-z]+", p)
+            }
+        )
+        for _ in range(50):
+            glue = rng.choice((" ", "", " "))
+            text = glue.join(rng.sample(words, rng.randint(1, 4)))
+            for vocabulary, fields in VOCABULARIES.items():
+                expected = {f.name: f.best_pattern_score(text) for f in fields}
+                scores = pattern_scores(text, vocabulary)
+                assert {n: scores.get(n, 0.0) for n in expected} == expected, text
+
+    def test_a_label_is_only_scored_against_fields_sharing_a_word(self) -> None:
+        from resume_filler.field_map import candidate_fields
+
+        shortlist = candidate_fields("job title")
+        assert "current_title" in shortlist
+        assert not shortlist & {"email", "phone", "school", "resume_file"}
+        assert "first_name" in candidate_fields("applicantfirstname")
+
+    def test_a_file_input_is_never_scored_as_anything_but_an_upload(self) -> None:
+        from resume_filler.field_map import ConfidenceMatrix
+
+        upload = FormField(tag="input", field_type="file", label="Email us your phone number")
+        matrix = ConfidenceMatrix.score([upload], [0], CANONICAL_FIELDS, 0.55)
+        scored = {
+            CANONICAL_FIELDS[column].name
+            for column, value in enumerate(matrix.confidences[0])
+            if value
+        }
+        assert scored <= {"resume_file", "cover_letter"}
+
+
 class TestGreenhouseForm:
     def test_extracts_only_fillable_controls(self, greenhouse_html: str) -> None:
         fields = fields_from_html(greenhouse_html)
@@ -213,6 +357,70 @@ class TestPlanFill:
         assert loose_filled > strict_filled
 
 
+class TestPlanFillMany:
+    @staticmethod
+    def _forms(fixture_dir) -> list[list[FormField]]:
+        return [
+            fields_from_html(path.read_text(encoding="utf-8"))
+            for path in sorted(fixture_dir.glob("*.html"))
+        ]
+
+    @staticmethod
+    def _decisions(plan) -> list[tuple]:
+        return [(m.canonical, m.confidence, m.value, m.status, m.reason) for m in plan]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_planning_each_form_alone_in_input_order(
+        self, fixture_dir, resume, workers
+    ) -> None:
+        from resume_filler.field_map import plan_fill_many
+
+        forms = self._forms(fixture_dir)
+        plans = plan_fill_many(forms, resume, resume_path="/tmp/cv.pdf", workers=workers)
+        assert [self._decisions(plan) for plan in plans] == [
+            self._decisions(plan_fill(fields, resume, resume_path="/tmp/cv.pdf"))
+            for fields in forms
+        ]
+
+    def test_pooled_matches_refer_to_the_callers_controls(self, fixture_dir, resume) -> None:
+        from resume_filler.field_map import plan_fill_many
+
+        forms = self._forms(fixture_dir)
+        for fields in forms:
+            for form_field in fields:
+                form_field.handle = lambda: None  # stands in for an unpicklable element
+        plans = plan_fill_many(forms, resume, workers=2)
+        for fields, plan in zip(forms, plans, strict=True):
+            assert all(m.form_field is f for m, f in zip(plan, fields, strict=True))
+
+    def test_a_pool_keeps_the_plan_cache_in_the_parent(
+        self, fixture_dir, resume, tmp_path, monkeypatch
+    ) -> None:
+        import concurrent.futures
+
+        from resume_filler.field_map import form_fingerprint, plan_fill_many
+        from resume_filler.plan_cache import PlanCache
+
+        # An empty form plans to an empty list, which is still a cached plan.
+        forms = [*self._forms(fixture_dir), []]
+        cache = PlanCache(tmp_path / "plans.db")
+        first = plan_fill_many(forms, resume, plan_cache=cache, workers=2)
+        assert len(cache) == len({form_fingerprint(fields) for fields in forms})
+
+        def no_pool(**kwargs):
+            raise AssertionError("every form was cached, so no pool is needed")
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_pool)
+        lookups: list[int] = []
+        get = cache.get
+        monkeypatch.setattr(cache, "get", lambda fields, *a: lookups.append(1) or get(fields, *a))
+        again = plan_fill_many(forms, resume, plan_cache=cache, workers=2)
+        assert [self._decisions(plan) for plan in again] == [
+            self._decisions(plan) for plan in first
+        ]
+        assert len(lookups) == len(forms), "one cache read per form"
+
+
 class TestResolveValue:
     def test_confirm_email_reuses_the_email_value(self, resume) -> None:
         assert resolve_value("confirm_email", resume) == resume.email
@@ -223,3 +431,187 @@ class TestResolveValue:
     def test_education_fields_use_the_latest_entry(self, resume) -> None:
         assert resolve_value("school", resume) == "The University of Texas at Austin"
         assert resolve_value("graduation_year", resume) == "2015"
+
+
+class TestResumeValues:
+    """The prebuilt table must answer exactly as the per-call resolvers do."""
+
+    def test_agrees_with_resolve_value_for_every_field(self, resume) -> None:
+        from resume_filler.field_map import ResumeValues
+
+        values = ResumeValues.build(resume, resume_path="/tmp/cv.pdf")
+        for canonical in CANONICAL_FIELDS:
+            expected = resolve_value(canonical.name, resume, resume_path="/tmp/cv.pdf")
+            assert values.value(canonical.name) == expected
+
+    @pytest.mark.parametrize("group", ["workExperience", "education", "references"])
+    def test_agrees_with_resolve_entry_value_for_every_row(self, resume, group) -> None:
+        from resume_filler.field_map import ENTRY_FIELDS, ResumeValues, resolve_entry_value
+
+        values = ResumeValues.build(resume)
+        for row in range(-1, len(resume.positions) + 2):
+            for canonical in ENTRY_FIELDS:
+                expected = (
+                    resolve_entry_value(canonical.name, resume, group, row) if row >= 0 else ""
+                )
+                assert values.entry_value(canonical.name, group, row) == expected
+
+    def test_plan_fill_reads_the_profile_from_the_table(self, resume) -> None:
+        from resume_filler.field_map import ResumeValues
+        from resume_filler.profile import Profile
+
+        control = FormField(tag="input", label="Street Address")
+        values = ResumeValues.build(resume, profile=Profile({"address_line1": "1 Main St"}))
+        [match] = plan_fill([control], resume, values=values)
+        assert match.value == "1 Main St"
+        assert match.status is FillStatus.FILLED
+
+
+def _sorted_greedy(matrix) -> dict[int, tuple[str, float]]:
+    """The original claim loop: sort every eligible pairing, then walk it."""
+    candidates = [
+        (matrix.confidences[row][column], matrix.indexes[row], matrix.vocabulary[column])
+        for row in range(len(matrix.indexes))
+        for column in matrix.eligible[row]
+    ]
+    candidates.sort(key=lambda item: (-item[0], item[1], item[2].name))
+    assignment: dict[int, tuple[str, float]] = {}
+    claimed: set[str] = set()
+    for confidence, index, canonical in candidates:
+        if index in assignment or (canonical.name in claimed and not canonical.allow_multiple):
+            continue
+        assignment[index] = (canonical.name, confidence)
+        claimed.add(canonical.name)
+    return assignment
+
+
+class TestGreedyClaiming:
+    @pytest.mark.parametrize("seed", range(25))
+    def test_agrees_with_sorting_every_pairing(self, seed: int) -> None:
+        import random
+
+        from resume_filler.field_map import ConfidenceMatrix, _claim_greedily
+
+        rng = random.Random(seed)
+        vocabulary = CANONICAL_FIELDS
+        rows = rng.randint(1, 40)
+        # Coarse values so ties are common and the tie-break is exercised.
+        confidences = [
+            [rng.choice((0.0, 0.0, 0.6, 0.8, 0.9, 1.0)) for _ in vocabulary] for _ in range(rows)
+        ]
+        eligible = [
+            sorted(
+                (c for c, value in enumerate(row) if value >= 0.55),
+                key=lambda c, row=row: (-row[c], vocabulary[c].name),
+            )
+            for row in confidences
+        ]
+        matrix = ConfidenceMatrix(
+            indexes=rng.sample(range(1000), rows),
+            vocabulary=vocabulary,
+            confidences=confidences,
+            eligible=eligible,
+        )
+        claimed = _claim_greedily(matrix)
+        expected = _sorted_greedy(matrix)
+        assert claimed == expected
+        assert list(claimed) == list(expected), "claim order feeds duplicate detection"
+
+    def test_matrix_marks_type_incompatible_pairings_ineligible(self) -> None:
+        from resume_filler.field_map import ConfidenceMatrix
+
+        upload = FormField(tag="input", field_type="file", label="Email your resume")
+        matrix = ConfidenceMatrix.score([upload], [0], CANONICAL_FIELDS, 0.55)
+        names = [CANONICAL_FIELDS[column].name for column in matrix.eligible[0]]
+        assert names == ["resume_file"]
+
+
+def _best_total(matrix) -> int:
+    """Brute force the highest total confidence, in ten-thousandths."""
+    import itertools
+
+    best = 0
+    for combo in itertools.product(*[[None, *columns] for columns in matrix.eligible]):
+        exclusive = [c for c in combo if c is not None and not matrix.vocabulary[c].allow_multiple]
+        if len(exclusive) != len(set(exclusive)):
+            continue
+        total = sum(
+            round(matrix.confidences[row][c] * 10_000)
+            for row, c in enumerate(combo)
+            if c is not None
+        )
+        best = max(best, total)
+    return best
+
+
+class TestOptimalAssignment:
+    """The optimal strategy maximises total confidence under the same rules as greedy."""
+
+    @staticmethod
+    def _matrix(confidences, allow_multiple=()):
+        from resume_filler.field_map import CanonicalField, ConfidenceMatrix
+
+        vocabulary = tuple(
+            CanonicalField(name=f"field_{c}", patterns=(), allow_multiple=c in allow_multiple)
+            for c in range(len(confidences[0]))
+        )
+        eligible = [
+            sorted(
+                (c for c, value in enumerate(row) if value >= 0.55),
+                key=lambda c, row=row: (-row[c], vocabulary[c].name),
+            )
+            for row in confidences
+        ]
+        return ConfidenceMatrix(list(range(len(confidences))), vocabulary, confidences, eligible)
+
+    def test_gives_up_the_strongest_pairing_to_fill_both_controls(self) -> None:
+        from resume_filler.field_map import _claim_greedily, _claim_optimally
+
+        matrix = self._matrix([[0.95, 0.90], [0.90, 0.0]])
+        assert _claim_greedily(matrix) == {0: ("field_0", 0.95)}
+        assert _claim_optimally(matrix) == {1: ("field_0", 0.90), 0: ("field_1", 0.90)}
+
+    def test_shared_fields_are_not_competed_for(self) -> None:
+        from resume_filler.field_map import _claim_optimally
+
+        matrix = self._matrix([[0.9, 0.7], [0.8, 0.0], [0.6, 0.0]], allow_multiple=(0,))
+        assert _claim_optimally(matrix) == {
+            0: ("field_0", 0.9),
+            1: ("field_0", 0.8),
+            2: ("field_0", 0.6),
+        }
+
+    @pytest.mark.parametrize("seed", range(40))
+    def test_matches_brute_force_and_is_repeatable(self, seed: int) -> None:
+        import random
+
+        from resume_filler.field_map import _claim_optimally
+
+        rng = random.Random(seed)
+        columns, rows = rng.randint(1, 4), rng.randint(1, 5)
+        confidences = [
+            [rng.choice((0.0, 0.0, 0.6, 0.75, 0.8, 0.9, 1.0)) for _ in range(columns)]
+            for _ in range(rows)
+        ]
+        shared = tuple(c for c in range(columns) if rng.random() < 0.25)
+        matrix = self._matrix(confidences, allow_multiple=shared)
+
+        claimed = _claim_optimally(matrix)
+        exclusive = [name for name, _ in claimed.values() if int(name[-1]) not in shared]
+        assert len(exclusive) == len(set(exclusive))
+        assert sum(round(value * 10_000) for _, value in claimed.values()) == _best_total(matrix)
+        assert list(claimed.items()) == list(_claim_optimally(matrix).items())
+
+    @pytest.mark.parametrize(
+        "fixture", ["greenhouse_form.html", "tricky_form.html", "workday_experience.html"]
+    )
+    def test_agrees_with_greedy_on_the_saved_forms(self, fixture: str) -> None:
+        html = (Path(__file__).parent / "fixtures" / fixture).read_text(encoding="utf-8")
+        fields = fields_from_html(html)
+        greedy = [(m.canonical, m.confidence) for m in match_form(fields)]
+        optimal = [(m.canonical, m.confidence) for m in match_form(fields, strategy="optimal")]
+        assert optimal == greedy
+
+    def test_unknown_strategy_is_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            match_form([FormField(tag="input", label="Email")], strategy="fastest")
@@ -119,6 +119,260 @@ class TestLiveFill:
         assert "does not exist" in upload.reason
 
 
+class PageElement(StubElement):
+    """A control with the limits the batched fill script checks for."""
+
+    def __init__(self, max_length: int = -1, mask=None, read_only: bool = False) -> None:
+        super().__init__()
+        self.max_length = max_length
+        self.mask = mask
+        self.read_only = read_only
+        self.value = ""
+
+    def send_keys(self, value: str) -> None:
+        if self.read_only:
+            from selenium.common.exceptions import InvalidElementStateException
+
+            raise InvalidElementStateException("invalid element state: element is read-only")
+        super().send_keys(value)
+
+
+class BatchingDriver(StubDriver):
+    """Answers the batched fill script as a page would.
+
+    A value in ``refused``, for a read-only ``PageElement`` or longer than its
+    maxlength, is not set; one an input mask rewrites is set but does not read
+    back the same.
+    """
+
+    def __init__(self, refused: set[str] | None = None, answer=None) -> None:
+        super().__init__()
+        self.refused = refused or set()
+        self.answer = answer
+        self.batches: list[list[tuple[object, str]]] = []
+
+    def _set(self, element: object, value: str) -> bool:
+        if value in self.refused:
+            return False
+        if not isinstance(element, PageElement):
+            return True
+        if element.read_only or 0 < element.max_length < len(value):
+            return False
+        element.value = element.mask(value) if element.mask else value
+        return element.value == value
+
+    def execute_script(self, script: str, *args: object):
+        if script is form_filler._NATIVE_FILL_SCRIPT:
+            pairs = [(element, value) for element, value in args[0]]
+            self.batches.append(pairs)
+            if self.answer is not None:
+                return self.answer
+            return [self._set(element, value) for element, value in pairs]
+        return super().execute_script(script, *args)
+
+
+# Two inputs for the batched fill script, the second locked. The value setter
+# assigns regardless, as a browser's does.
+_LOCKED_INPUT_PAGE = """
+class HTMLInputElement {
+  constructor() { this.maxLength = -1; this._value = ''; }
+  focus() {}
+  blur() {}
+  dispatchEvent() {}
+  get value() { return this._value; }
+  set value(value) { this._value = value; }
+}
+globalThis.HTMLInputElement = HTMLInputElement;
+globalThis.HTMLTextAreaElement = class {};
+globalThis.Event = class { constructor(type) { this.type = type; } };
+const open = new HTMLInputElement();
+const locked = new HTMLInputElement();
+locked.STATE = true;
+console.log(JSON.stringify(new Function(FILL)([[open, 'Jane'], [locked, 'Rivera']])));
+"""
+
+
+class TestBatchedFill:
+    """Plain text values are set by one script per frame, not typed."""
+
+    def test_one_script_sets_every_plain_text_value(self, patched_fields, resume) -> None:
+        driver = BatchingDriver()
+        matches = form_filler.fill_form(driver, resume, resume_path="/tmp/cv.pdf", dry_run=False)
+        by_canonical = {m.canonical: m for m in matches}
+        assert len(driver.batches) == 1
+        batched = {value for _, value in driver.batches[0]}
+        assert {"Jane", "jane.rivera@example.com"} <= batched
+        assert by_canonical["first_name"].status is FillStatus.FILLED
+        assert not by_canonical["first_name"].form_field.handle.sent
+        # An upload still goes through its own path.
+        assert "/tmp/cv.pdf" not in batched
+
+    def test_a_value_the_page_rewrites_is_typed_instead(self, patched_fields, resume) -> None:
+        driver = BatchingDriver(refused={"Jane"})
+        matches = form_filler.fill_form(driver, resume, dry_run=False)
+        by_canonical = {m.canonical: m for m in matches}
+        assert by_canonical["first_name"].form_field.handle.sent == ["Jane"]
+        assert not by_canonical["email"].form_field.handle.sent
+
+    def test_batching_can_be_turned_off(self, patched_fields, resume) -> None:
+        driver = BatchingDriver()
+        matches = form_filler.fill_form(driver, resume, dry_run=False, batch=False)
+        by_canonical = {m.canonical: m for m in matches}
+        assert not driver.batches
+        assert by_canonical["first_name"].form_field.handle.sent == ["Jane"]
+
+    def test_only_plain_text_controls_are_batched(self) -> None:
+        from resume_filler.models import FieldMatch, FormField
+
+        def batchable(**kwargs) -> bool:
+            return form_filler._is_batchable(FieldMatch(form_field=FormField(**kwargs)))
+
+        assert batchable(tag="input", field_type="email")
+        assert batchable(tag="textarea", field_type="textarea")
+        assert not batchable(tag="input", field_type="file")
+        assert not batchable(tag="input", field_type="date")
+        assert not batchable(tag="input", field_type="radio")
+        assert not batchable(tag="select", field_type="select")
+        assert not batchable(tag="input", field_type="text", widget="combobox")
+
+    @staticmethod
+    def _matches(*elements: PageElement, value: str = "4155550123"):
+        from resume_filler.models import FieldMatch, FormField
+
+        return [
+            FieldMatch(
+                form_field=FormField(tag="input", field_type="tel", handle=element),
+                value=value,
+                status=FillStatus.FILLED,
+            )
+            for element in elements
+        ]
+
+    def test_a_value_over_maxlength_is_left_to_typing(self) -> None:
+        roomy, tight = PageElement(max_length=20), PageElement(max_length=6)
+        matches = self._matches(roomy, tight)
+        entered = form_filler._fill_natively(BatchingDriver(), matches)
+        assert entered == {id(matches[0])}
+        assert tight.value == "", "a refused value is not half set"
+
+    def test_a_value_the_mask_rewrites_is_left_to_typing(self) -> None:
+        plain = PageElement()
+        masked = PageElement(mask=lambda v: f"({v[:3]}) {v[3:6]}-{v[6:]}")
+        matches = self._matches(plain, masked)
+        entered = form_filler._fill_natively(BatchingDriver(), matches)
+        assert entered == {id(matches[0])}
+
+    def test_the_refused_values_are_the_ones_typed(self, resume, monkeypatch) -> None:
+        from resume_filler.models import FormField
+
+        short = FormField(tag="input", label="First Name", handle=PageElement(max_length=2))
+        email = FormField(tag="input", field_type="email", label="Email", handle=PageElement())
+        monkeypatch.setattr(form_filler, "fields_from_driver", lambda driver: [short, email])
+        form_filler.fill_form(BatchingDriver(), resume, dry_run=False)
+        assert short.handle.sent == ["Jane"]
+        assert not email.handle.sent
+
+    def test_a_read_only_control_fails_rather_than_passing(self, resume, monkeypatch) -> None:
+        from resume_filler.models import FormField
+
+        locked = FormField(tag="input", label="First Name", handle=PageElement(read_only=True))
+        monkeypatch.setattr(form_filler, "fields_from_driver", lambda driver: [locked])
+        matches = form_filler.fill_form(BatchingDriver(), resume, dry_run=False)
+        assert matches[0].status is FillStatus.FAILED
+        assert locked.handle.value == ""
+
+    @pytest.mark.parametrize("state", ["readOnly", "disabled"])
+    def test_the_script_refuses_a_locked_control(self, state) -> None:
+        """The value setter works on these too, and the value then reads back."""
+        import json
+        import shutil
+        import subprocess
+
+        node = shutil.which("node")
+        if node is None:
+            pytest.skip("needs node to run the page script")
+        page = _LOCKED_INPUT_PAGE.replace("STATE", state)
+        page = page.replace("FILL", json.dumps(form_filler._NATIVE_FILL_SCRIPT))
+        out = subprocess.run([node, "-e", page], capture_output=True, text=True, timeout=10)
+        assert json.loads(out.stdout) == [True, False]
+
+    @pytest.mark.parametrize("answer", [[True], "done", {"0": True}])
+    def test_an_unexpected_answer_leaves_everything_to_typing(self, answer) -> None:
+        matches = self._matches(PageElement(), PageElement())
+        entered = form_filler._fill_natively(BatchingDriver(answer=answer), matches)
+        assert entered == set()
+
+
+class ButtonStub:
+    def __init__(self, clickable: bool = True, fails: bool = False) -> None:
+        self.clickable = clickable
+        self.fails = fails
+        self.clicked = False
+
+    def is_displayed(self) -> bool:
+        return self.clickable
+
+    def is_enabled(self) -> bool:
+        return True
+
+    def click(self) -> None:
+        if self.fails:
+            from selenium.common.exceptions import ElementClickInterceptedException
+
+            raise ElementClickInterceptedException("covered by a cookie banner")
+        self.clicked = True
+
+
+class ButtonDriver(StubDriver):
+    """Serves buttons by XPath, counting the lookups."""
+
+    def __init__(self, buttons: dict[str, ButtonStub]) -> None:
+        super().__init__()
+        self.buttons = buttons
+        self.lookups = 0
+
+    def find_elements(self, by: object, selector: str) -> list[object]:
+        self.lookups += 1
+        button = self.buttons.get(selector)
+        return [button] if button else []
+
+
+class TestClickFirst:
+    """All candidates are raced under one deadline, in priority order."""
+
+    def test_the_highest_priority_clickable_candidate_wins(self) -> None:
+        xpaths = form_filler.APPLY_BUTTON_XPATHS
+        low, high = ButtonStub(), ButtonStub()
+        driver = ButtonDriver({xpaths[1]: high, xpaths[4]: low})
+
+        assert form_filler._click_first(driver, xpaths, timeout=5) == xpaths[1]
+        assert high.clicked and not low.clicked
+
+    def test_a_hidden_match_is_passed_over(self) -> None:
+        xpaths = form_filler.APPLY_BUTTON_XPATHS
+        visible = ButtonStub()
+        driver = ButtonDriver({xpaths[0]: ButtonStub(clickable=False), xpaths[2]: visible})
+
+        assert form_filler._click_first(driver, xpaths, timeout=5) == xpaths[2]
+        assert visible.clicked
+
+    def test_no_button_costs_one_timeout_not_one_per_candidate(self) -> None:
+        import time
+
+        driver = ButtonDriver({})
+        started = time.monotonic()
+        assert form_filler._click_first(driver, form_filler.APPLY_BUTTON_XPATHS, timeout=0.2) == ""
+        assert time.monotonic() - started < 1.0
+
+    def test_a_failed_click_falls_through_to_the_next_candidate(self) -> None:
+        xpaths = form_filler.SUBMIT_BUTTON_XPATHS
+        fallback = ButtonStub()
+        driver = ButtonDriver({xpaths[0]: ButtonStub(fails=True), xpaths[3]: fallback})
+
+        assert form_filler._click_first(driver, xpaths, timeout=5) == xpaths[3]
+        assert fallback.clicked
+
+
 class TestSubmissionGuardrails:
     def test_default_run_never_submits(
         self, stub_driver, patched_fields, resume, monkeypatch
@@ -0,0 +1,108 @@
+"""Tests for the persistent cache of matched form templates."""
+
+from __future__ import annotations
+
+import pytest
+
+from resume_filler import field_map, plan_cache
+from resume_filler.extractors import fields_from_html
+from resume_filler.field_map import form_fingerprint, match_form, plan_fill
+from resume_filler.models import FormField
+from resume_filler.plan_cache import PlanCache
+
+
+def outcome(matches) -> list[tuple[str, float, str]]:
+    return [(m.canonical, m.confidence, m.status.value) for m in matches]
+
+
+def form(*labels: str) -> list[FormField]:
+    return [FormField(tag="input", label=label) for label in labels]
+
+
+class TestPlanCache:
+    def test_a_repeated_template_is_answered_without_matching(
+        self, tmp_path, greenhouse_html, monkeypatch
+    ) -> None:
+        cache = PlanCache(tmp_path / "plan_cache.db")
+        fields = fields_from_html(greenhouse_html)
+        first = match_form(fields, plan_cache=cache)
+
+        def refuse(*args, **kwargs):
+            raise AssertionError("matched again")
+
+        monkeypatch.setattr(field_map, "_match_scope", refuse)
+        # A fresh scan of the same template on the next posting.
+        second = match_form(fields_from_html(greenhouse_html), plan_cache=cache)
+        assert outcome(second) == outcome(first)
+
+    def test_plans_survive_reopening_and_values_are_still_resolved(
+        self, tmp_path, greenhouse_html, resume
+    ) -> None:
+        fields = fields_from_html(greenhouse_html)
+        expected = plan_fill(fields, resume)
+        plan_fill(fields, resume, plan_cache=PlanCache(tmp_path / "plans.db"))
+        cached = plan_fill(fields, resume, plan_cache=PlanCache(tmp_path / "plans.db"))
+        assert [(m.canonical, m.value, m.status) for m in cached] == [
+            (m.canonical, m.value, m.status) for m in expected
+        ]
+
+    def test_threshold_and_strategy_are_part_of_the_key(self, tmp_path) -> None:
+        cache = PlanCache(tmp_path / "plan_cache.db")
+        fields = form("First Name", "Email")
+        match_form(fields, plan_cache=cache)
+        assert cache.get(fields, 0.9, "greedy") is None
+        assert cache.get(fields, field_map.DEFAULT_CONFIDENCE_THRESHOLD, "optimal") is None
+        assert cache.get(fields, field_map.DEFAULT_CONFIDENCE_THRESHOLD, "greedy") is not None
+
+    def test_a_vocabulary_change_drops_every_plan(self, tmp_path, monkeypatch) -> None:
+        path = tmp_path / "plan_cache.db"
+        match_form(form("First Name"), plan_cache=PlanCache(path))
+        assert len(PlanCache(path)) == 1
+        monkeypatch.setattr(plan_cache, "vocabulary_version", lambda: "a newer vocabulary")
+        assert len(PlanCache(path)) == 0
+
+    def test_the_least_recently_used_plan_is_evicted(self, tmp_path) -> None:
+        cache = PlanCache(tmp_path / "plan_cache.db", max_plans=2)
+        threshold = field_map.DEFAULT_CONFIDENCE_THRESHOLD
+        first, second, third = form("First Name"), form("Last Name"), form("Email")
+        match_form(first, plan_cache=cache)
+        match_form(second, plan_cache=cache)
+        assert cache.get(first, threshold, "greedy") is not None
+        match_form(third, plan_cache=cache)
+        assert len(cache) == 2
+        assert cache.get(second, threshold, "greedy") is None
+        assert cache.get(first, threshold, "greedy") is not None
+
+    def test_a_size_of_zero_stores_nothing(self, tmp_path) -> None:
+        cache = PlanCache(tmp_path / "plan_cache.db", max_plans=0)
+        match_form(form("First Name"), plan_cache=cache)
+        assert len(cache) == 0
+
+
+class TestFormFingerprint:
+    def test_ignores_what_matching_never_reads(self) -> None:
+        plain = form("First Name", "Email")
+        decorated = form("First Name", "Email")
+        decorated[0].handle = object()
+        decorated[1].required = True
+        assert form_fingerprint(plain) == form_fingerprint(decorated)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"label": "Last Name"},
+            {"field_type": "email"},
+            {"widget": "combobox"},
+            {"group": "workExperience", "group_index": 0},
+        ],
+    )
+    def test_changes_with_anything_matching_reads(self, change) -> None:
+        changed = form("First Name", "Email")
+        for attribute, value in change.items():
+            setattr(changed[0], attribute, value)
+        assert form_fingerprint(changed) != form_fingerprint(form("First Name", "Email"))
+
+    def test_control_order_matters(self) -> None:
+        assert form_fingerprint(form("First Name", "Email")) != form_fingerprint(
+            form("Email", "First Name")
+        )
@@ -92,6 +92,32 @@ class TestGroupParsing:
         assert by_id["workExperience-7--jobTitle"] == 1
         assert by_id["workExperience-9--jobTitle"] == 2
 
+    def test_the_combined_pattern_agrees_with_trying_each_in_turn(self) -> None:
+        import random
+
+        from benchmarks.groups import _previous_parse_group
+
+        pieces = ["work", "Experience", "education", "_", "-", "--", "[", "]", "3", "12", "x"]
+        rng = random.Random(7)
+        identifiers = [
+            "".join(rng.choice(pieces) for _ in range(rng.randint(1, 8))) for _ in range(5000)
+        ]
+        identifiers += ["a-1--b_2_c", "a_b[1]c", "ab[1][c]_2_d", " workExperience-2--x "]
+        for identifier in identifiers:
+            assert parse_group(identifier) == _previous_parse_group(identifier), identifier
+
+    def test_many_groups_normalise_as_before(self, workday_html) -> None:
+        from dataclasses import replace
+
+        from benchmarks.groups import _previous_normalize, form
+
+        raw = form(30, 7) + fields_from_html(workday_html)
+        current = normalize_fields([replace(f, group="", group_index=-1) for f in raw])
+        previous = _previous_normalize([replace(f, group="", group_index=-1) for f in raw])
+        assert [(f.group, f.group_index, f.label) for f in current] == [
+            (f.group, f.group_index, f.label) for f in previous
+        ]
+
     def test_group_source_maps_to_a_resume_collection(self) -> None:
         assert group_source("workExperience") == "positions"
         assert group_source("education") == "education"
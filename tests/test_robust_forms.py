@@ -15,7 +15,7 @@ from pathlib import Path
 import pytest
 
 from resume_filler import form_filler
-from resume_filler.extractors import fields_from_html
+from resume_filler.extractors import FrameCursor, fields_from_html
 from resume_filler.field_map import match_form, plan_fill
 from resume_filler.models import FillStatus, FormField, JobPosting, RunMode
 
@@ -111,6 +111,140 @@ class TestShadowDom:
         assert _elements_in_context(OddDriver(), "input") == ["fallback"]
 
 
+def _control(**overrides) -> dict:
+    """A bulk scan descriptor for a plain visible text input."""
+    described = {
+        "tag": "input",
+        "type": "text",
+        "name": "",
+        "id": "",
+        "ariaLabel": "",
+        "placeholder": "",
+        "autocomplete": "",
+        "accept": "",
+        "required": False,
+        "ariaHidden": "",
+        "displayed": True,
+        "combobox": False,
+        "label": "",
+        "options": [],
+    }
+    described.update(overrides)
+    return described
+
+
+class BulkDriver:
+    """Answers the bulk scan script and nothing else.
+
+    The elements are bare objects, so any per-element call would fail loudly.
+    """
+
+    def __init__(self, controls: list[dict]) -> None:
+        self.elements = [object() for _ in controls]
+        self.controls = controls
+        self.scripts = 0
+
+    def execute_script(self, script: str, *args: object) -> list:
+        self.scripts += 1
+        return [self.elements, self.controls, 0]
+
+    def find_elements(self, by, selector):
+        raise AssertionError("should not fall back")
+
+
+class TestBulkScan:
+    """A live scan reads every control in one script per browsing context."""
+
+    def test_builds_fields_from_one_script(self) -> None:
+        from resume_filler.extractors import _scan_context
+
+        driver = BulkDriver(
+            [
+                _control(name="first", id="fn", label="  First   Name ", required=True),
+                _control(tag="select", type="select-one", options=[" Yes ", "No"]),
+                _control(tag="div", combobox=True, label="Country"),
+            ]
+        )
+        fields = _scan_context(driver, (1,))
+        assert driver.scripts == 1
+        assert [(f.tag, f.field_type, f.label) for f in fields] == [
+            ("input", "text", "First Name"),
+            ("select", "select", ""),
+            ("div", "div", "Country"),
+        ]
+        assert fields[0].required and fields[0].element_id == "fn"
+        assert fields[1].options == ["Yes", "No"]
+        assert fields[2].widget == "combobox"
+        assert [f.handle for f in fields] == driver.elements
+        assert all(f.frame_path == (1,) for f in fields)
+
+    def test_applies_the_same_filters_as_the_per_element_scan(self) -> None:
+        from resume_filler.extractors import _scan_context
+
+        fields = _scan_context(
+            BulkDriver(
+                [
+                    _control(type="hidden"),
+                    _control(ariaHidden="true"),
+                    _control(displayed=False),
+                    _control(type="file", displayed=False, name="resume"),
+                    _control(tag="div"),
+                ]
+            ),
+            (),
+        )
+        assert [f.name for f in fields] == ["resume"]
+
+    def test_falls_back_to_each_element_when_scripts_are_blocked(self) -> None:
+        from selenium.common.exceptions import WebDriverException
+
+        from resume_filler.extractors import _scan_context
+
+        class Element:
+            tag_name = "input"
+
+            def get_attribute(self, name):
+                return {"type": "email", "name": "email"}.get(name)
+
+            def is_displayed(self):
+                return True
+
+        class BlockedDriver:
+            def execute_script(self, *args):
+                raise WebDriverException("blocked")
+
+            def find_elements(self, by, selector):
+                return [Element()]
+
+        fields = _scan_context(BlockedDriver(), ())
+        assert [(f.name, f.field_type) for f in fields] == [("email", "email")]
+
+    @pytest.mark.parametrize("result", [None, [["element"], [], 0], "oops"])
+    def test_an_unexpected_result_falls_back(self, result) -> None:
+        from resume_filler.extractors import _describe_controls
+
+        class OddDriver:
+            def execute_script(self, *args):
+                return result
+
+        assert _describe_controls(OddDriver(), "input") is None
+
+    def test_shares_the_label_and_shadow_logic(self) -> None:
+        from resume_filler.extractors import (
+            _BULK_SCAN_SCRIPT,
+            _LABEL_FUNCTION,
+            _LABEL_SCRIPT,
+            _SHADOW_SCAN_SCRIPT,
+            _SHADOW_WALK_FUNCTION,
+        )
+
+        for shared, script in (
+            (_LABEL_FUNCTION, _LABEL_SCRIPT),
+            (_SHADOW_WALK_FUNCTION, _SHADOW_SCAN_SCRIPT),
+        ):
+            assert shared in script and shared in _BULK_SCAN_SCRIPT
+
+
 class TestAdapterParity:
     """The static and live adapters must resolve labels the same way.
 
@@ -158,6 +292,345 @@ class TestAdapterParity:
             assert "_is_decorative" in inspect.getsource(func)
 
 
+class SearchingLabels:
+    """Label lookups as they were before ``LabelIndex``: a document search each."""
+
+    def __init__(self, soup) -> None:
+        self.soup = soup
+
+    def label_for(self, element_id):
+        return self.soup.find("label", attrs={"for": element_id})
+
+    def element(self, element_id):
+        return self.soup.find(id=element_id)
+
+    def legend(self, element) -> str:
+        fieldset = element.find_parent("fieldset")
+        legend = fieldset.find("legend") if fieldset else None
+        return " ".join(legend.get_text(" ").split()) if legend else ""
+
+    def candidates(self, container):
+        found = []
+        for candidate in container.select("label, legend, [class*='label']"):
+            text = " ".join(candidate.get_text(" ").split())
+            if text:
+                found.append((candidate.get("for") or "", text))
+        return found
+
+
+AWKWARD_LABELS = """
+<form>
+  <label for="dup">First of two</label><label for="dup">Second of two</label>
+  <input id="dup">
+  <span id="same">Earlier</span><span id="same">Later</span>
+  <span id="q">Which</span>
+  <input aria-labelledby="q missing same">
+  <input aria-labelledby="nowhere">
+  <fieldset>
+    <div><legend>Deep legend</legend></div>
+    <label><input type="radio" name="r" value="a"> A</label>
+    <fieldset>
+      <label><input type="checkbox" name="c"> Inner</label>
+    </fieldset>
+  </fieldset>
+  <fieldset><legend>  Spaced
+     legend </legend><input name="plain"></fieldset>
+  <ul class="questions">
+    <li><div class="application-label"> </div><input name="blank"></li>
+    <li><label for="bound">Bound</label><input id="bound"><input name="unbound"></li>
+    <li><div class="application-label">Why us?</div><textarea name="why"></textarea></li>
+  </ul>
+</form>
+"""
+
+
+class TestLabelIndex:
+    """One pass over the document resolves labels exactly as searching did."""
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "greenhouse_form.html",
+            "lever_form.html",
+            "react_select_form.html",
+            "tricky_form.html",
+            "workday_experience.html",
+            "workday_step1.html",
+        ],
+    )
+    def test_fixture_labels_are_unchanged(self, name, monkeypatch) -> None:
+        self._assert_parity((FIXTURES / name).read_text(encoding="utf-8"), monkeypatch)
+
+    def test_awkward_associations_are_unchanged(self, monkeypatch) -> None:
+        labels = self._assert_parity(AWKWARD_LABELS, monkeypatch)
+        assert labels[:2] == ["First of two", "Which Earlier"]
+
+    def test_shared_containers_are_selected_once(self, monkeypatch) -> None:
+        """Controls in one list share its candidates but still filter by id."""
+        from resume_filler import extractors
+
+        selected: list[str] = []
+        original = extractors.Tag.select
+
+        def counting(tag, selector, *args, **kwargs):
+            selected.append(f"{tag.name}:{id(tag)}")
+            return original(tag, selector, *args, **kwargs)
+
+        monkeypatch.setattr(extractors.Tag, "select", counting)
+        fields = {
+            field.name or field.element_id: field.label
+            for field in fields_from_html(AWKWARD_LABELS)
+        }
+        assert fields["unbound"] == "Why us?"
+        assert fields["bound"] == "Bound"
+        assert fields["why"] == "Why us?"
+        assert len(selected) == len(set(selected))
+
+    def test_large_synthetic_forms_are_unchanged(self, monkeypatch) -> None:
+        from benchmarks import synthetic
+
+        for shape in synthetic.SHAPES:
+            self._assert_parity(synthetic.SHAPES[shape](200), monkeypatch)
+
+    @staticmethod
+    def _assert_parity(html: str, monkeypatch) -> list[str]:
+        from types import SimpleNamespace
+
+        from resume_filler import extractors
+
+        indexed = [field.label for field in fields_from_html(html)]
+        with monkeypatch.context() as patch:
+            patch.setattr(extractors, "LabelIndex", SimpleNamespace(build=SearchingLabels))
+            searched = [field.label for field in fields_from_html(html)]
+        assert indexed == searched
+        return indexed
+
+
+def _scanned(html: str, parser: str) -> list[tuple]:
+    return [
+        (f.tag, f.field_type, f.name, f.element_id, f.label, f.options, f.required, f.group)
+        for f in fields_from_html(html, parser=parser)
+    ]
+
+
+class TestParserBackends:
+    """Every tree builder must yield the controls html.parser does."""
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "greenhouse_form.html",
+            "lever_form.html",
+            "react_select_form.html",
+            "tricky_form.html",
+            "workday_experience.html",
+            "workday_step1.html",
+        ],
+    )
+    def test_lxml_scans_fixtures_identically(self, name) -> None:
+        pytest.importorskip("lxml")
+        html = (FIXTURES / name).read_text(encoding="utf-8")
+        assert _scanned(html, "lxml") == _scanned(html, "html.parser")
+
+    def test_lxml_scans_large_synthetic_forms_identically(self) -> None:
+        pytest.importorskip("lxml")
+        from benchmarks import synthetic
+
+        for shape in synthetic.SHAPES:
+            html = synthetic.SHAPES[shape](200)
+            assert _scanned(html, "lxml") == _scanned(html, "html.parser")
+
+    def test_an_unknown_parser_is_refused(self) -> None:
+        with pytest.raises(ValueError, match="html5lib"):
+            fields_from_html("<input name='email'>", parser="html5lib")
+
+    def test_a_missing_lxml_falls_back_to_html_parser(self, monkeypatch, caplog) -> None:
+        from resume_filler import extractors
+
+        monkeypatch.setattr(extractors, "_parser_available", lambda parser: False)
+        fields = fields_from_html("<label for='e'>Email</label><input id='e'>", parser="lxml")
+        assert [f.label for f in fields] == ["Email"]
+        assert "lxml is not installed" in caplog.text
+
+
+class TestPruning:
+    """Scripts, styles and icons are stripped before a saved page is parsed."""
+
+    def test_non_content_regions_are_removed(self) -> None:
+        from resume_filler.extractors import prune_html
+
+        html = (
+            "<head><style>label{color:red}</style>"
+            '<script type="application/json">{"label": "<input>"}</script></head>'
+            '<body><!-- <script> --><input name="kept"><svg><path d="M0 0"/></svg></body>'
+        )
+        pruned = prune_html(html)
+        assert "color:red" not in pruned and "application/json" not in pruned
+        assert "<path" not in pruned and "<!--" not in pruned
+        assert '<input name="kept">' in pruned
+
+    def test_an_icon_with_words_is_kept(self) -> None:
+        fields = fields_from_html(
+            "<label>Portfolio <svg><title>external link</title></svg><input name='p'></label>"
+        )
+        assert fields[0].label == "Portfolio external link"
+
+    def test_text_either_side_of_a_script_does_not_run_together(self) -> None:
+        fields = fields_from_html("<label>First<script>x()</script>Name<input name='n'></label>")
+        assert fields[0].label == "First Name"
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "greenhouse_form.html",
+            "lever_form.html",
+            "react_select_form.html",
+            "tricky_form.html",
+            "workday_experience.html",
+            "workday_step1.html",
+        ],
+    )
+    def test_fixtures_scan_identically(self, name, monkeypatch) -> None:
+        self._assert_parity((FIXTURES / name).read_text(encoding="utf-8"), monkeypatch)
+
+    def test_heavy_saved_pages_scan_identically(self, monkeypatch) -> None:
+        from benchmarks import synthetic
+
+        for shape in synthetic.SHAPES:
+            self._assert_parity(synthetic.saved(synthetic.SHAPES[shape](100), 50), monkeypatch)
+
+    @staticmethod
+    def _assert_parity(html: str, monkeypatch) -> None:
+        from resume_filler import extractors
+
+        pruned = _scanned(html, "html.parser")
+        with monkeypatch.context() as patch:
+            patch.setattr(extractors, "prune_html", lambda html: html)
+            assert _scanned(html, "html.parser") == pruned
+
+
+FRAME_DOCUMENT = """<form>
+<label for="fn">First Name</label><input id="fn">
+<label for="workExperience-4--jobTitle">Job Title</label><input id="workExperience-4--jobTitle">
+</form>"""
+
+
+class TestFrameCache:
+    """Saved frame documents are read and scanned once however often they appear."""
+
+    @pytest.fixture
+    def frame_cache(self, monkeypatch):
+        from resume_filler import extractors
+
+        cache = extractors.FrameCache()
+        monkeypatch.setattr(extractors, "FRAME_CACHE", cache)
+        return cache
+
+    @pytest.fixture
+    def scans(self, monkeypatch) -> list[int]:
+        """How many documents were scanned, by the number of controls in each."""
+        from resume_filler import extractors
+
+        counted: list[int] = []
+        original = extractors._fields_from_soup
+
+        def counting(soup, *args):
+            fields = original(soup, *args)
+            counted.append(len(fields))
+            return fields
+
+        monkeypatch.setattr(extractors, "_fields_from_soup", counting)
+        return counted
+
+    @staticmethod
+    def _page(tmp_path, *sources: str) -> str:
+        frames = "".join(f'<iframe src="{src}"></iframe>' for src in sources)
+        page = tmp_path / "page.html"
+        page.write_text(f"<body><input name='search'>{frames}</body>", encoding="utf-8")
+        return page
+
+    def test_a_repeated_frame_is_scanned_once(self, tmp_path, frame_cache, scans) -> None:
+        (tmp_path / "page_files").mkdir()
+        (tmp_path / "page_files" / "a.html").write_text(FRAME_DOCUMENT, encoding="utf-8")
+        (tmp_path / "page_files" / "b.html").write_text(FRAME_DOCUMENT, encoding="utf-8")
+        page = self._page(
+            tmp_path, "page_files/a.html", "https://example.com/ad", "page_files/b.html"
+        )
+        fields = fields_from_html(page.read_text(encoding="utf-8"), base_path=page)
+        assert [(f.label, f.frame_path) for f in fields] == [
+            ("", ()),
+            ("First Name", (0,)),
+            ("Job Title", (0,)),
+            ("First Name", (2,)),
+            ("Job Title", (2,)),
+        ]
+        assert scans == [1, 2]
+        assert len(frame_cache) == 1
+
+    def test_cached_scans_are_not_changed_by_normalising(self, tmp_path, frame_cache) -> None:
+        (tmp_path / "page_files").mkdir()
+        (tmp_path / "page_files" / "a.html").write_text(FRAME_DOCUMENT, encoding="utf-8")
+        page = self._page(tmp_path, "page_files/a.html", "page_files/a.html")
+        html = page.read_text(encoding="utf-8")
+        first = [(f.label, f.group, f.group_index) for f in fields_from_html(html, base_path=page)]
+        again = [(f.label, f.group, f.group_index) for f in fields_from_html(html, base_path=page)]
+        assert first == again
+        assert first[2] == ("Job Title", "workExperience", 0)
+
+    def test_nested_frames_resolve_against_their_own_folder(self, tmp_path, frame_cache) -> None:
+        outer = '<input name="outer"><iframe src="inner.html"></iframe>'
+        for folder, label in (("one", "Email"), ("two", "Phone")):
+            (tmp_path / folder).mkdir()
+            (tmp_path / folder / "outer.html").write_text(outer, encoding="utf-8")
+            (tmp_path / folder / "inner.html").write_text(
+                f'<label for="x">{label}</label><input id="x">', encoding="utf-8"
+            )
+        page = self._page(tmp_path, "one/outer.html", "two/outer.html")
+        fields = fields_from_html(page.read_text(encoding="utf-8"), base_path=page)
+        assert [(f.label, f.frame_path) for f in fields if f.label] == [
+            ("Email", (0, 0)),
+            ("Phone", (1, 0)),
+        ]
+
+    def test_a_frame_changed_on_disk_is_read_again(self, tmp_path, frame_cache) -> None:
+        (tmp_path / "page_files").mkdir()
+        frame = tmp_path / "page_files" / "a.html"
+        frame.write_text(FRAME_DOCUMENT, encoding="utf-8")
+        page = self._page(tmp_path, "page_files/a.html")
+        html = page.read_text(encoding="utf-8")
+        assert len(fields_from_html(html, base_path=page)) == 3
+        frame.write_text('<label for="e">Email address</label><input id="e">', encoding="utf-8")
+        assert [f.label for f in fields_from_html(html, base_path=page)] == ["", "Email address"]
+
+    def test_the_cache_is_bounded_by_size(self, tmp_path) -> None:
+        from resume_filler.extractors import FrameCache
+
+        cache = FrameCache(max_bytes=len(FRAME_DOCUMENT) * 2)
+        for n in range(5):
+            frame = tmp_path / f"{n}.html"
+            frame.write_text(FRAME_DOCUMENT + f"<!-- {n} -->", encoding="utf-8")
+            assert len(cache.scan(frame, 0, "html.parser")) == 2
+        assert len(cache) == 1
+
+    def test_the_bound_is_bytes_on_disk(self, tmp_path) -> None:
+        from resume_filler.extractors import FrameCache
+
+        document = FRAME_DOCUMENT.replace("First Name", "Prénom — 名前")
+        frame = tmp_path / "a.html"
+        frame.write_text(document, encoding="utf-8")
+        assert len(document) < frame.stat().st_size
+        cache = FrameCache(max_bytes=len(document))
+        cache.scan(frame, 0, "html.parser")
+        assert len(cache) == 0, "too big on disk, however few characters it has"
+
+    def test_cached_scans_hold_no_parse_tree(self, tmp_path, frame_cache) -> None:
+        (tmp_path / "page_files").mkdir()
+        (tmp_path / "page_files" / "a.html").write_text(FRAME_DOCUMENT, encoding="utf-8")
+        page = self._page(tmp_path, "page_files/a.html")
+        fields = fields_from_html(page.read_text(encoding="utf-8"), base_path=page)
+        assert [f.handle is None for f in fields] == [False, True, True]
+
+
 class TestRealLeverMarkup:
     """Regressions found by running the engine against a live Lever page."""
 
@@ -343,6 +816,12 @@ class ComboboxDriver:
     def execute_script(self, script: str, *args: object) -> str:
         return ""
 
+    def execute_async_script(self, script: str, *args: object) -> list[object]:
+        # The options are already rendered, so the page answers at once.
+        wanted = str(args[1])
+        matched = any(wanted in option.text.lower() for option in self._options)
+        return [matched, 40 if self._options else -1, 40]
+
     def find_elements(self, by: object, selector: str) -> list[StubOption]:
         return self._options
 
@@ -390,6 +869,359 @@ class TestComboboxFilling:
             form_filler._fill_combobox(driver, match, timeout=5)
 
 
+class MatchingDriver(ComboboxDriver):
+    """Answers the in-page option matcher the way the page would."""
+
+    def __init__(self, options: list[StubOption], picked: object) -> None:
+        super().__init__(options)
+        self.picked = picked
+        self.matcher_calls: list[tuple[object, ...]] = []
+        self.options_read = 0
+
+    def execute_script(self, script: str, *args: object) -> object:
+        if script == form_filler._OPTION_MATCH_SCRIPT:
+            self.matcher_calls.append(args)
+            if isinstance(self.picked, Exception):
+                raise self.picked
+            return self.picked
+        return ""
+
+    def find_elements(self, by: object, selector: str) -> list[StubOption]:
+        self.options_read += 1
+        return super().find_elements(by, selector)
+
+
+class NativeSelect:
+    """A <select> that fails the test if Selenium's Select starts reading it."""
+
+    @property
+    def tag_name(self) -> str:
+        raise AssertionError("the options were read one by one")
+
+
+# The option matcher run against a list of option texts, as a <select> when
+# asked, printing the text of the option it picks.
+_OPTION_PAGE = """
+const [texts, native, wanted] = JSON.parse(process.argv.at(-1));
+const options = texts.map((text, index) =>
+  ({text, innerText: text, index, disabled: false, getClientRects: () => [1]}));
+globalThis.document = {querySelectorAll: () => options};
+const select = native ? {options, dispatchEvent() {}} : null;
+const picked = new Function(MATCH)(select, 'li', wanted);
+console.log(JSON.stringify(picked && picked[1]));
+"""
+
+
+def _match_option(texts: list[str], wanted: str, native: bool) -> str | None:
+    import json
+    import shutil
+    import subprocess
+
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("needs node to run the page script")
+    page = _OPTION_PAGE.replace("MATCH", json.dumps(form_filler._OPTION_MATCH_SCRIPT))
+    out = subprocess.run(
+        [node, "-e", page, json.dumps([texts, native, wanted])],
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+    return json.loads(out.stdout)
+
+
+UTSA = "university of texas at san antonio"
+
+# Options sharing most of a value's words without being it.
+NEAR_MISSES = [
+    (["Bachelor of Science", "Bachelor of Fine Arts"], "bachelor of arts"),
+    (["Rice University", "University of Texas at Austin"], UTSA),
+    (["Canada", "United States"], "united states of america"),
+]
+
+
+class ReadableSelect:
+    """A <select> for Selenium's Select to read when the matcher cannot run."""
+
+    tag_name = "select"
+
+    def __init__(self, texts: list[str]) -> None:
+        self.options = [SelectOption(text) for text in texts]
+
+    def get_dom_attribute(self, name: str) -> None:
+        return None
+
+    def find_elements(self, by: object, selector: str) -> list[SelectOption]:
+        return self.options
+
+
+class SelectOption(StubOption):
+    def is_enabled(self) -> bool:
+        return True
+
+    def is_selected(self) -> bool:
+        return self.clicked
+
+
+class TestInPageOptionMatching:
+    def test_a_scripted_dropdown_is_not_matched_on_shared_words(self) -> None:
+        """The list open before typing must not commit the wrong campus."""
+        schools = ["Rice University", "University of Texas at Austin"]
+
+        assert _match_option(schools, UTSA, native=False) is None
+
+    @pytest.mark.parametrize(("options", "wanted"), NEAR_MISSES)
+    def test_a_native_select_is_not_matched_on_shared_words(
+        self, options: list[str], wanted: str
+    ) -> None:
+        assert _match_option(options, wanted, native=True) is None
+        driver = MatchingDriver([], None)
+        with pytest.raises(ValueError, match="No option"):
+            form_filler._select_native_option(driver, NativeSelect(), wanted)
+
+    @pytest.mark.parametrize(("options", "wanted"), NEAR_MISSES)
+    def test_reading_a_select_option_by_option_matches_by_the_same_rules(
+        self, options: list[str], wanted: str
+    ) -> None:
+        from selenium.common.exceptions import WebDriverException
+
+        driver = MatchingDriver([], WebDriverException("javascript error"))
+        element = ReadableSelect(options)
+        with pytest.raises(ValueError, match="No option"):
+            form_filler._select_native_option(driver, element, wanted)
+        assert not any(option.clicked for option in element.options)
+
+    def test_reading_a_select_takes_the_exact_then_the_containing_option(self) -> None:
+        from selenium.common.exceptions import WebDriverException
+
+        driver = MatchingDriver([], WebDriverException("javascript error"))
+        element = ReadableSelect(["United States Minor Outlying Islands", "United  States"])
+        assert form_filler._select_native_option(driver, element, "United States") == (
+            "United  States"
+        )
+        element = ReadableSelect(["Canada", "United States Minor Outlying Islands"])
+        form_filler._select_native_option(driver, element, "minor outlying")
+        assert element.options[1].clicked
+
+    def test_one_script_picks_the_option_to_click(self) -> None:
+        options = [StubOption("Canada"), StubOption("United States")]
+        driver = MatchingDriver(options, [options[1], "United States"])
+
+        assert form_filler._select_matching_option(driver, "united states") == "United States"
+        assert options[1].clicked
+        assert len(driver.matcher_calls) == 1 and driver.options_read == 0
+
+    def test_no_match_in_the_page_is_final(self) -> None:
+        driver = MatchingDriver([StubOption("Canada")], None)
+
+        assert form_filler._select_matching_option(driver, "united states") == ""
+        assert driver.options_read == 0
+
+    def test_a_page_refusing_the_script_is_read_option_by_option(self) -> None:
+        options = [StubOption("Canada"), StubOption("United States")]
+        from selenium.common.exceptions import WebDriverException
+
+        driver = MatchingDriver(options, WebDriverException("javascript error"))
+        assert form_filler._select_matching_option(driver, "united states") == "united states"
+        assert options[1].clicked
+
+    def test_a_native_select_is_set_in_the_page(self) -> None:
+        element = NativeSelect()
+        driver = MatchingDriver([], [None, "Yes"])
+        match = plan_fill(
+            [FormField(tag="select", label="Are you authorized to work?", handle=element)],
+            _resume_with_country(),
+        )[0]
+        match.value = "Yes"
+
+        form_filler._apply_one(driver, match, timeout=5)
+
+        assert driver.matcher_calls == [(element, form_filler.COMBOBOX_OPTION_SELECTOR, "yes")]
+
+    def test_a_native_select_without_the_value_raises(self) -> None:
+        driver = MatchingDriver([], None)
+        with pytest.raises(ValueError, match="No option"):
+            form_filler._select_native_option(driver, NativeSelect(), "Martian")
+
+
+class SleepingComboboxDriver(ComboboxDriver):
+    """A page that will not run the wait script, as some remote grids refuse."""
+
+    def execute_async_script(self, script: str, *args: object) -> list[object]:
+        from selenium.common.exceptions import WebDriverException
+
+        raise WebDriverException("script timeout")
+
+
+# Just enough of a page for the typeahead scripts: a list of options that a
+# scenario replaces over time, announcing each change to the observers.
+_TYPEAHEAD_PAGE = """
+const scenario = JSON.parse(process.argv.at(-1));
+const observers = [];
+let options = [];
+const show = (texts) => {
+  options = texts.map((text) => options.find((o) => o.innerText === text)
+    || {innerText: text, getClientRects: () => [1]});
+};
+globalThis.window = globalThis;
+globalThis.document = {documentElement: {}, querySelectorAll: () => options};
+globalThis.MutationObserver = class {
+  constructor(callback) { this.callback = callback; observers.push(this); }
+  observe() {}
+  disconnect() { this.callback = null; }
+};
+const before = new Function(BEFORE);
+const settled = new Function(SETTLED);
+show(scenario.showing);
+before(scenario.selector);
+for (const [at, texts] of scenario.later) {
+  setTimeout(() => {
+    show(texts);
+    for (const observer of observers) if (observer.callback) observer.callback([]);
+  }, at);
+}
+settled(scenario.selector, scenario.wanted, scenario.budget, (result) => {
+  console.log(JSON.stringify(result));
+  process.exit(0);
+});
+"""
+
+
+def _run_typeahead(showing: list[str], later: list, wanted: str, budget: int) -> list:
+    import json
+    import shutil
+    import subprocess
+
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("needs node to run the page script")
+    page = _TYPEAHEAD_PAGE.replace("BEFORE", json.dumps(form_filler._OPTIONS_BEFORE_SCRIPT))
+    page = page.replace("SETTLED", json.dumps(form_filler._OPTIONS_SETTLED_SCRIPT))
+    scenario = {"showing": showing, "later": later, "wanted": wanted, "budget": budget}
+    scenario["selector"] = form_filler.COMBOBOX_OPTION_SELECTOR
+    out = subprocess.run(
+        [node, "-e", page, json.dumps(scenario)], capture_output=True, text=True, timeout=10
+    )
+    return json.loads(out.stdout)
+
+
+class TestTypeaheadWait:
+    def test_options_showing_before_typing_are_not_the_answer(self) -> None:
+        """Results for the previous character must not end the wait, or be learned."""
+        matched, answered_ms, _ = _run_typeahead(
+            ["United Kingdom", "United Arab Emirates"],
+            [[300, ["United States"]]],
+            "united states",
+            budget=2000,
+        )
+        assert matched
+        assert answered_ms >= 250, "timed from the stale list, not the typed results"
+
+    def test_only_stale_options_wait_out_the_budget(self) -> None:
+        matched, answered_ms, elapsed_ms = _run_typeahead(
+            ["United Kingdom"], [], "united states", budget=500
+        )
+        assert not matched
+        assert answered_ms == -1
+        assert elapsed_ms >= 450
+
+    def test_results_for_earlier_characters_do_not_end_the_wait(self) -> None:
+        """A debounced search answers the whole value after the partial results settle."""
+        matched, answered_ms, _ = _run_typeahead(
+            [],
+            [[100, ["United Kingdom", "United Arab Emirates"]], [700, ["United States"]]],
+            "united states",
+            budget=2000,
+        )
+        assert matched
+        assert answered_ms >= 650
+
+    def test_new_options_without_the_value_wait_out_the_budget(self) -> None:
+        matched, answered_ms, elapsed_ms = _run_typeahead(
+            [], [[100, ["Uganda", "Ukraine"]]], "united states", budget=600
+        )
+        assert not matched
+        assert answered_ms == -1, "only a match is an answer to learn from"
+        assert elapsed_ms >= 550
+
+    def test_a_match_already_showing_is_taken_but_not_learned(self) -> None:
+        matched, answered_ms, _ = _run_typeahead(
+            ["Canada", "United States"], [], "united states", budget=2000
+        )
+        assert matched and answered_ms == -1
+
+    def test_the_list_is_noted_before_typing(self, monkeypatch) -> None:
+        calls: list[str] = []
+        driver = ComboboxDriver([])
+        driver.execute_script = lambda script, *args: calls.append(script) or ""
+        element = ComboboxElement()
+        element.send_keys = lambda value: calls.append("typed")
+        monkeypatch.setattr(form_filler, "_wait_for_options", lambda d, w: calls.append("waited"))
+        match = plan_fill(
+            [FormField(tag="div", label="Country", widget="combobox", handle=element)],
+            _resume_with_country(),
+        )[0]
+        with pytest.raises(ValueError):
+            form_filler._fill_combobox(driver, match, timeout=5)
+        noted = calls.index(form_filler._OPTIONS_BEFORE_SCRIPT)
+        assert noted < calls.index("typed") < calls.index("waited")
+
+    def test_an_unseen_site_gets_the_fixed_budget(self) -> None:
+        latency = form_filler.TypeaheadLatency()
+        assert latency.budget("boards.greenhouse.io") == form_filler.TYPEAHEAD_SETTLE_SECONDS
+
+    def test_the_budget_follows_the_slowest_recent_answer(self) -> None:
+        latency = form_filler.TypeaheadLatency()
+        for answered in (0.2, 0.5, 0.3):
+            latency.record("boards.greenhouse.io", answered, answered)
+        assert latency.budget("boards.greenhouse.io") == pytest.approx(1.5)
+        latency.record("fast.example.com", 0.01, 0.01)
+        assert latency.budget("fast.example.com") == form_filler.TYPEAHEAD_MIN_SECONDS
+        latency.record("slow.example.com", 4.0, 2.5)
+        assert latency.budget("slow.example.com") == form_filler.TYPEAHEAD_MAX_SECONDS
+
+    def test_a_fast_site_keeps_time_for_a_debounced_search(self) -> None:
+        latency = form_filler.TypeaheadLatency()
+        for _ in range(form_filler.TYPEAHEAD_SAMPLES):
+            latency.record("boards.greenhouse.io", 0.02, 0.02)
+        assert latency.budget("boards.greenhouse.io") >= 1.0
+
+    def test_a_wait_with_no_answer_is_counted_but_not_learned(self) -> None:
+        latency = form_filler.TypeaheadLatency()
+        latency.record("example.com", 1.5, None)
+        assert latency.budget("example.com") == form_filler.TYPEAHEAD_SETTLE_SECONDS
+        assert latency.summary()["waits"] == 1
+
+    def test_the_page_answer_is_learned_for_the_site(self, monkeypatch) -> None:
+        latency = form_filler.TypeaheadLatency()
+        monkeypatch.setattr(form_filler, "TYPEAHEAD_LATENCY", latency)
+        driver = ComboboxDriver([StubOption("Canada"), StubOption("United States")])
+
+        assert form_filler._wait_for_options(driver, "united states")
+        assert list(latency.samples["example.com"]) == [0.04]
+        assert latency.summary()["seconds_saved"] > 1.0
+
+    def test_options_without_a_match_are_not_learned(self, monkeypatch) -> None:
+        latency = form_filler.TypeaheadLatency()
+        monkeypatch.setattr(form_filler, "TYPEAHEAD_LATENCY", latency)
+        driver = ComboboxDriver([StubOption("Canada")])
+        driver.execute_async_script = lambda script, *args: [False, 40, 1500]
+
+        assert not form_filler._wait_for_options(driver, "united states")
+        assert not latency.samples
+
+    def test_a_page_that_refuses_the_script_gets_a_plain_wait(self, monkeypatch) -> None:
+        latency = form_filler.TypeaheadLatency()
+        monkeypatch.setattr(form_filler, "TYPEAHEAD_LATENCY", latency)
+        slept: list[float] = []
+        monkeypatch.setattr(form_filler.time, "sleep", slept.append)
+        driver = SleepingComboboxDriver([StubOption("United States")])
+
+        assert not form_filler._wait_for_options(driver, "united states")
+        assert slept and slept[0] == pytest.approx(form_filler.TYPEAHEAD_SETTLE_SECONDS, abs=0.05)
+        assert not latency.samples
+
+
 def _resume_with_country():
     from resume_filler.models import ResumeData
 
@@ -425,6 +1257,10 @@ class SwitchRecorder:
         self._driver.context = (*self._driver.context, index)
         self._driver.switches.append(f"frame:{index}")
 
+    def parent_frame(self) -> None:
+        self._driver.context = self._driver.context[:-1]
+        self._driver.switches.append("parent")
+
 
 class FrameDriver:
     """Tracks which browsing context the driver is in."""
@@ -501,6 +1337,81 @@ class TestFrameSwitching:
         assert driver.context == (), "a stranded frame context breaks the next page"
 
 
+class FrameTreeDriver(FrameDriver):
+    """A page whose frames nest as ``tree`` says: the number of frames in each context."""
+
+    def __init__(self, tree: dict[tuple[int, ...], int]) -> None:
+        super().__init__()
+        self.tree = tree
+
+    def execute_script(self, script: str, *args: object) -> list:
+        return [[], [], 0]
+
+    def find_elements(self, by: object, selector: str) -> list[object]:
+        return [object()] * self.tree.get(self.context, 0)
+
+
+class UnsteadySwitches(SwitchRecorder):
+    def parent_frame(self) -> None:
+        from selenium.common.exceptions import NoSuchFrameException
+
+        raise NoSuchFrameException("the frame was replaced")
+
+
+class TestFrameCursor:
+    def _at(self, path: tuple[int, ...]) -> tuple[FrameDriver, FrameCursor]:
+        driver = FrameDriver()
+        cursor = FrameCursor(driver)
+        cursor.move_to(path)
+        driver.switches.clear()
+        return driver, cursor
+
+    def test_the_first_move_walks_from_the_top(self) -> None:
+        driver, _ = self._at((0, 2))
+        assert driver.context == (0, 2)
+
+    def test_a_child_is_entered_from_where_the_driver_is(self) -> None:
+        driver, cursor = self._at((0,))
+        cursor.move_to((0, 2))
+        assert driver.switches == ["frame:2"]
+        cursor.move_to((0, 2))
+        assert driver.switches == ["frame:2"], "staying put costs nothing"
+
+    def test_a_sibling_is_one_step_up_and_one_down(self) -> None:
+        driver, cursor = self._at((0, 1, 2))
+        cursor.move_to((0, 1, 3))
+        assert driver.switches == ["parent", "frame:3"]
+        assert driver.context == (0, 1, 3)
+
+    def test_a_distant_frame_is_reached_from_the_top(self) -> None:
+        driver, cursor = self._at((0, 1))
+        cursor.move_to((2,))
+        assert driver.switches == ["top", "frame:2"]
+
+    def test_a_failed_step_walks_from_the_top(self) -> None:
+        driver, cursor = self._at((0, 1, 2))
+        driver.switch_to = UnsteadySwitches(driver)
+        cursor.move_to((0, 1, 3))
+        assert driver.switches == ["top", "frame:0", "frame:1", "frame:3"]
+        assert driver.context == (0, 1, 3)
+
+    def test_walking_nested_frames_steps_between_them(self) -> None:
+        from resume_filler.extractors import fields_from_driver
+
+        driver = FrameTreeDriver({(): 2, (0,): 2})
+        fields_from_driver(driver)
+        assert driver.switches == [
+            "top",
+            "frame:0",
+            "frame:0",
+            "parent",
+            "frame:1",
+            "top",
+            "frame:1",
+            "top",
+        ]
+
+
 # --------------------------------------------------------------------------
 # Multi-step wizards
 # --------------------------------------------------------------------------
@@ -652,6 +1563,142 @@ class TestWizardIntegration:
         assert any(g.form_field.label == "Desired Salary" for g in result.required_gaps)
 
 
+class WatchedDriver(WizardDriver):
+    """Answers the watch scripts, reporting each queued change in turn.
+
+    A change is the added controls as (element, descriptor) pairs, the removed
+    elements, and whether a frame came or went.
+    """
+
+    def __init__(self) -> None:
+        super().__init__([[]])
+        self.queued: list[tuple[list[tuple[object, dict]], list[object], bool]] = []
+        self.reads = 0
+
+    def execute_script(self, script: str, *args: object) -> object:
+        from resume_filler.extractors import _CHANGES_SCRIPT, _WATCH_SCRIPT
+
+        if script is _WATCH_SCRIPT:
+            return True
+        if script is _CHANGES_SCRIPT:
+            self.reads += 1
+            added, removed, frames_changed = self.queued.pop(0) if self.queued else ([], [], False)
+            return [[e for e, _ in added], [d for _, d in added], removed, frames_changed]
+        return ""
+
+
+def _watched(driver: WatchedDriver, fields: list[FormField]):
+    from resume_filler.extractors import FormWatch
+
+    watch = FormWatch.start(driver, fields)
+    assert watch is not None
+    return watch
+
+
+class TestFormWatch:
+    """After one scan, a wizard reads only the controls that came and went."""
+
+    def test_reads_added_and_removed_controls(self) -> None:
+        driver = WatchedDriver()
+        kept, dropped = FrameStubElement("kept"), FrameStubElement("dropped")
+        fields = [
+            FormField(tag="input", name="kept", handle=kept),
+            FormField(tag="input", name="dropped", handle=dropped),
+        ]
+        watch = _watched(driver, fields)
+        added = FrameStubElement("added")
+        driver.queued.append(([(added, _control(name="added", label="Email"))], [dropped], False))
+
+        changes = watch.changes(driver)
+        assert changes is not None
+        assert [(f.name, f.label, f.handle) for f in changes.added] == [("added", "Email", added)]
+        assert [f.name for f in changes.removed] == ["dropped"]
+        assert [f.name for f in watch.fields] == ["kept", "added"]
+        assert driver.context == ()
+
+    def test_an_added_row_is_numbered_after_the_rows_already_there(self) -> None:
+        """Read alone, a third experience row would be taken for the first."""
+        driver = WatchedDriver()
+        fields = [
+            FormField(tag="input", element_id=f"workExperience-{raw}--jobTitle", handle=object())
+            for raw in (1, 2)
+        ]
+        watch = _watched(driver, fields)
+        driver.queued.append(
+            ([(object(), _control(id="workExperience-4--jobTitle", label="Job Title"))], [], False)
+        )
+        changes = watch.changes(driver)
+        assert changes is not None
+        assert [(f.group, f.group_index) for f in changes.added] == [("workExperience", 2)]
+
+    def test_a_frame_coming_or_going_loses_the_watch_for_good(self) -> None:
+        driver = WatchedDriver()
+        watch = _watched(driver, [])
+        driver.queued.append(([], [], True))
+        assert watch.changes(driver) is None
+        assert watch.changes(driver) is None
+        assert driver.reads == 1, "a lost watch is not read again"
+
+    def test_a_reused_control_with_a_new_descriptor_is_read_again(self) -> None:
+        """React keeps the <input> between steps and only renames and relabels it."""
+        driver = WatchedDriver()
+        reused, kept = FrameStubElement("reused"), FrameStubElement("kept")
+        fields = [
+            FormField(tag="input", name="firstName", label="First Name", handle=reused),
+            FormField(tag="input", name="email", label="Email", handle=kept),
+        ]
+        watch = _watched(driver, fields)
+        # What the changes script reports for it: removed as it was, added as it is.
+        driver.queued.append(
+            ([(reused, _control(name="employer", label="Current employer"))], [reused], False)
+        )
+
+        changes = watch.changes(driver)
+        assert changes is not None
+        assert [(f.name, f.label) for f in changes.removed] == [("firstName", "First Name")]
+        assert [(f.name, f.label, f.handle) for f in changes.added] == [
+            ("employer", "Current employer", reused)
+        ]
+        assert [f.name for f in watch.fields] == ["email", "employer"]
+
+    def test_a_page_that_will_not_run_the_observer_is_not_watched(self) -> None:
+        from resume_filler.extractors import FormWatch
+
+        assert FormWatch.start(WizardDriver([[]]), []) is None
+
+    def test_a_revealed_question_is_filled_in_the_same_step(self, resume) -> None:
+        driver = WatchedDriver()
+        first = FormField(tag="input", label="First Name", handle=FrameStubElement("a"))
+        watch = _watched(driver, [first])
+        email = FrameStubElement("email")
+        driver.queued.append(([(email, _control(type="email", label="Email"))], [], False))
+
+        matches = form_filler.fill_form(driver, resume, dry_run=False, fields=[first], watch=watch)
+        assert [m.form_field.label for m in matches] == ["First Name", "Email"]
+        assert email.sent == [resume.email]
+        assert driver.reads == 2, "one read found the question, the next found nothing new"
+
+    def test_later_wizard_steps_read_only_what_changed(self, monkeypatch, resume) -> None:
+        driver = WatchedDriver()
+        first = FrameStubElement("a")
+        scans: list[int] = []
+
+        def scan(d):
+            scans.append(1)
+            return [FormField(tag="input", label="First Name", handle=first)]
+
+        def advance(d, xpaths, timeout):
+            d.queued.append(([(FrameStubElement("b"), _control(label="City"))], [first], False))
+            return True
+
+        monkeypatch.setattr(form_filler, "fields_from_driver", scan)
+        monkeypatch.setattr(form_filler, "_click_first", advance)
+        matches = form_filler.fill_wizard(driver, resume, dry_run=False, max_steps=2)
+        assert [m.form_field.label for m in matches] == ["First Name", "City"]
+        assert len(scans) == 1
+        assert driver.reads == 3, "one read per step, and one finding nothing revealed"
+
+
 class TestWorkdayFixture:
     def test_maps_workday_generated_ids_by_label_alone(self, workday_html: str) -> None:
         result = {
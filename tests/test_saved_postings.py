@@ -65,6 +65,34 @@ class TestSavedPostings:
         assert "clearance" in terms or "dod" in terms
         assert not terms & {"mm", "yyyy", "arrows", "spin"}
 
+    def test_lxml_reads_the_same_posting(self, saved_page) -> None:
+        pytest.importorskip("lxml")
+        assert sources.from_html_file(saved_page, "lxml") == sources.from_html_file(saved_page)
+
+    def test_a_heavy_saved_page_reads_as_it_did_unpruned(self, tmp_path, monkeypatch) -> None:
+        from benchmarks import synthetic
+
+        path = tmp_path / "heavy.html"
+        path.write_text(synthetic.saved(synthetic.workday(50), 50), encoding="utf-8")
+        pruned = sources.from_html_file(path)
+        with monkeypatch.context() as patch:
+            patch.setattr(sources, "_posting_markup", lambda html: html)
+            unpruned = sources.from_html_file(path)
+        assert pruned[0].title == "Software Engineer"
+        assert "Python experience required" in pruned[0].description
+        assert "window.__bundle" not in unpruned[0].description
+        assert pruned == unpruned
+
+    def test_only_title_and_meta_survive_in_the_head(self) -> None:
+        markup = sources._posting_markup(
+            '<html><head><link rel="preload" href="a.js"><title>T</title>'
+            '<meta name="description" content="D"><noscript>Enable JS</noscript></head>'
+            "<body><noscript>Enable JS</noscript><p>Body</p></body></html>"
+        )
+        assert "preload" not in markup and "Enable JS" not in markup
+        assert '<title>T</title><meta name="description" content="D">' in markup
+        assert "<p>Body</p>" in markup
+
     def test_body_text_is_used_when_there_is_no_useful_meta(self, tmp_path) -> None:
         path = tmp_path / "plain.html"
         path.write_text(
@@ -0,0 +1,372 @@
+"""Tests for scanning a Chromium page from one DevTools snapshot.
+
+There is no browser here, so pages are turned into the snapshot Chrome would
+return by ``snapshot_of``: every node in document order with its parent, a
+``<template shadowrootmode>`` as the shadow root it declares, and each
+``<iframe src>`` found in ``frames`` as a document of its own. Layout follows
+inline styles and each tag's usual display closely enough for the visibility
+and rendered-text rules to be exercised.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup, Comment, Doctype, NavigableString, Tag
+
+from resume_filler import form_filler
+from resume_filler.extractors import fields_from_driver, fields_from_html
+from resume_filler.models import FormField, ResumeData
+from resume_filler.snapshot import SnapshotHandle, attach_handles
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+_UNRENDERED = {"head", "script", "style", "template", "title", "meta", "link"}
+
+# The user agent's display for the tags these pages use. Anything else is a block.
+_DISPLAY = {
+    **dict.fromkeys(["a", "abbr", "b", "em", "i", "label", "small", "span", "strong"], "inline"),
+    **dict.fromkeys(["button", "input", "select", "textarea"], "inline-block"),
+    "li": "list-item",
+}
+
+
+def _style(element: Tag, name: str) -> str:
+    match = re.search(rf"{name}\s*:\s*([\w-]+)", str(element.get("style", "")))
+    return match.group(1) if match else ""
+
+
+def snapshot_of(html: str, frames: dict[str, str] | None = None) -> dict:
+    """The ``DOMSnapshot.captureSnapshot`` result for a page and its frames."""
+    frames = frames or {}
+    strings: list[str] = []
+    interned: dict[str, int] = {}
+    documents: list[dict] = []
+
+    def string(text: str) -> int:
+        if text not in interned:
+            interned[text] = len(strings)
+            strings.append(text)
+        return interned[text]
+
+    def document(markup: str) -> int:
+        position = len(documents)
+        nodes: dict = {
+            "parentIndex": [],
+            "nodeType": [],
+            "nodeName": [],
+            "nodeValue": [],
+            "attributes": [],
+            "contentDocumentIndex": {"index": [], "value": []},
+            "shadowRootType": {"index": [], "value": []},
+        }
+        layout: dict = {"nodeIndex": [], "styles": [], "bounds": []}
+        documents.append({"nodes": nodes, "layout": layout})
+
+        def add(kind: int, name: str, parent: int, value: str = "", attrs=()) -> int:
+            node = len(nodes["parentIndex"])
+            nodes["parentIndex"].append(parent)
+            nodes["nodeType"].append(kind)
+            nodes["nodeName"].append(string(name))
+            nodes["nodeValue"].append(string(value) if value else -1)
+            nodes["attributes"].append([string(part) for pair in attrs for part in pair])
+            return node
+
+        def render(node: int, display: str, visibility: str, opacity: str, size: int) -> None:
+            layout["nodeIndex"].append(node)
+            layout["styles"].append([string(display), string(visibility), string(opacity)])
+            layout["bounds"].append([0, 0, size, size])
+
+        def visit(element: Tag, parent: int, rendered: bool, visibility: str) -> None:
+            for child in element.children:
+                if isinstance(child, (Comment, Doctype)):
+                    continue
+                if isinstance(child, NavigableString):
+                    text = add(3, "#text", parent, str(child))
+                    if rendered and str(child).strip():
+                        render(text, "", visibility, "1", 10)
+                    continue
+                if not isinstance(child, Tag):
+                    continue
+                if child.name == "template" and child.get("shadowrootmode"):
+                    root = add(11, "#document-fragment", parent)
+                    nodes["shadowRootType"]["index"].append(root)
+                    nodes["shadowRootType"]["value"].append(string(child["shadowrootmode"]))
+                    visit(child, root, rendered, visibility)
+                    continue
+                attrs = [
+                    (k, " ".join(v) if isinstance(v, list) else v) for k, v in child.attrs.items()
+                ]
+                node = add(1, child.name.upper(), parent, attrs=attrs)
+                shown = (
+                    rendered
+                    and child.name not in _UNRENDERED
+                    and not child.has_attr("hidden")
+                    and _style(child, "display") != "none"
+                )
+                inherited = _style(child, "visibility") or visibility
+                if shown:
+                    size = 0 if _style(child, "width") == "0" else 10
+                    display = _style(child, "display") or _DISPLAY.get(child.name, "block")
+                    render(node, display, inherited, _style(child, "opacity") or "1", size)
+                if child.name == "iframe" and child.get("src") in frames:
+                    nodes["contentDocumentIndex"]["index"].append(node)
+                    nodes["contentDocumentIndex"]["value"].append(document(frames[child["src"]]))
+                visit(child, node, shown, inherited)
+
+        root = add(9, "#document", -1)
+        render(root, "block", "visible", "1", 10)
+        visit(BeautifulSoup(markup, "html.parser"), root, True, "visible")
+        return position
+
+    document(html)
+    return {"documents": documents, "strings": strings}
+
+
+class Switches:
+    def __init__(self, driver: RecordingDriver) -> None:
+        self._driver = driver
+
+    def default_content(self) -> None:
+        self._driver.calls.append("top")
+
+    def frame(self, index: int) -> None:
+        self._driver.calls.append(f"frame:{index}")
+
+
+class RecordingDriver:
+    """A driver with no DevTools protocol, as Firefox is, on an empty page."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.switch_to = Switches(self)
+        self.current_url = "https://example.com/apply"
+
+    def execute_script(self, script: str, *args: object) -> list:
+        self.calls.append("script")
+        return [[], [], 0]
+
+    def find_elements(self, by, selector) -> list:
+        self.calls.append("find")
+        return []
+
+
+class CdpDriver(RecordingDriver):
+    """A Chromium driver, answering the snapshot command with ``snapshot``."""
+
+    def __init__(self, snapshot: dict | Exception) -> None:
+        super().__init__()
+        self.snapshot = snapshot
+
+    def execute_cdp_cmd(self, command: str, params: dict) -> dict:
+        self.calls.append(command)
+        if isinstance(self.snapshot, Exception):
+            raise self.snapshot
+        return self.snapshot
+
+
+def _summary(fields: list[FormField]) -> list[tuple]:
+    return [
+        (f.tag, f.field_type, f.name, f.element_id, f.label, f.required, f.widget, f.frame_path)
+        for f in fields
+    ]
+
+
+def _scan(html: str, frames: dict[str, str] | None = None) -> list[FormField]:
+    return fields_from_driver(CdpDriver(snapshot_of(html, frames)))
+
+
+class TestSnapshotScan:
+    @pytest.mark.parametrize(
+        "fixture", ["greenhouse_form.html", "lever_form.html", "workday_step1.html"]
+    )
+    def test_agrees_with_the_static_adapter(self, fixture) -> None:
+        html = (FIXTURES / fixture).read_text(encoding="utf-8")
+        assert _summary(_scan(html)) == _summary(fields_from_html(html))
+
+    def test_reads_the_whole_page_in_one_command(self) -> None:
+        frame = '<label for="em">Email</label><input id="em"><iframe src="inner"></iframe>'
+        driver = CdpDriver(
+            snapshot_of(
+                '<input name="q"><iframe src="ad"></iframe><iframe src="board"></iframe>',
+                {"ad": "<p>Advert</p>", "board": frame, "inner": '<input name="deep">'},
+            )
+        )
+        fields = fields_from_driver(driver)
+        assert driver.calls == ["top", "DOMSnapshot.captureSnapshot", "top"]
+        assert [(f.name or f.label, f.frame_path) for f in fields] == [
+            ("q", ()),
+            ("Email", (1,)),
+            ("deep", (1, 0)),
+        ]
+
+    def test_frames_beyond_the_depth_limit_are_not_read(self) -> None:
+        snapshot = snapshot_of(
+            '<iframe src="a"></iframe>', {"a": '<input name="a"><iframe src="b"></iframe>'}
+        )
+        fields = fields_from_driver(CdpDriver(snapshot), max_depth=1)
+        assert [f.name for f in fields] == ["a"]
+
+    def test_walks_only_the_frame_missing_from_the_snapshot(self) -> None:
+        """A cross-origin frame is in another process, so not in the snapshot."""
+        driver = CdpDriver(snapshot_of('<input name="top"><iframe src="elsewhere"></iframe>'))
+        fields = fields_from_driver(driver)
+        assert [f.name for f in fields] == ["top"]
+        assert driver.calls == [
+            "top",
+            "DOMSnapshot.captureSnapshot",
+            "frame:0",
+            "script",
+            "find",
+            "top",
+        ]
+
+    def test_open_shadow_roots_after_the_light_dom(self) -> None:
+        html = """
+        <x-name><template shadowrootmode="open">
+          <label for="fn">First Name</label><input id="fn">
+        </template></x-name>
+        <x-secret><template shadowrootmode="closed"><input name="secret"></template></x-secret>
+        <label>Email <input name="email"></label>
+        """
+        assert [(f.label, f.element_id or f.name) for f in _scan(html)] == [
+            ("Email", "email"),
+            ("First Name", "fn"),
+        ]
+
+    def test_applies_the_bulk_scan_visibility_rules(self) -> None:
+        html = """
+        <input name="shown">
+        <input name="none" style="display:none">
+        <div style="visibility:hidden"><input name="invisible"></div>
+        <div style="opacity:0"><input name="transparent"></div>
+        <input name="flat" style="width:0">
+        <input type="file" name="resume" hidden>
+        <input type="hidden" name="token">
+        """
+        assert [f.name for f in _scan(html)] == ["shown", "resume"]
+
+    def test_labels_come_from_rendered_text(self) -> None:
+        html = """
+        <label for="a">Phone<span style="display:none"> (hidden hint)</span></label>
+        <input id="a">
+        <select name="b" aria-labelledby="q"><option> Yes </option><option>No</option></select>
+        <span id="q">Authorised to work?</span>
+        """
+        fields = _scan(html)
+        assert [f.label for f in fields] == ["Phone", "Authorised to work?"]
+        assert fields[1].options == ["Yes", "No"]
+
+    def test_labels_join_text_as_inner_text_does(self) -> None:
+        """The walked scan reads ``innerText``, so a snapshot label must match it."""
+        html = """
+        <label for="a">First<span>Name</span></label><input id="a">
+        <label for="b">Street<br>Address</label><input id="b">
+        <label for="c"><div>City</div><div>Town</div></label><input id="c">
+        <label for="d">E<b>mail</b><span style="display:block">(work)</span></label>
+        <input id="d">
+        """
+        assert [f.label for f in _scan(html)] == [
+            "FirstName",
+            "Street Address",
+            "City Town",
+            "Email (work)",
+        ]
+
+    def test_handles_stand_in_for_elements(self) -> None:
+        fields = _scan('<input id="a" name="first"><input name="second">')
+        assert [f.handle for f in fields] == [
+            SnapshotHandle((), 0, "input", "a", "first"),
+            SnapshotHandle((), 1, "input", "", "second"),
+        ]
+
+    def test_firefox_walks_the_frames(self) -> None:
+        driver = RecordingDriver()
+        assert fields_from_driver(driver) == []
+        assert driver.calls == ["top", "script", "find", "top"]
+
+    def test_a_failed_snapshot_walks_the_frames(self) -> None:
+        from selenium.common.exceptions import WebDriverException
+
+        driver = CdpDriver(WebDriverException("DOMSnapshot is not available"))
+        assert fields_from_driver(driver) == []
+        assert driver.calls[-3:] == ["script", "find", "top"]
+
+    @pytest.mark.parametrize("answer", [None, {"documents": []}, {"documents": [{}]}])
+    def test_an_unexpected_snapshot_walks_the_frames(self, answer) -> None:
+        driver = CdpDriver(answer)
+        assert fields_from_driver(driver) == []
+        assert driver.calls[-3:] == ["script", "find", "top"]
+
+
+class LocatingDriver:
+    """Answers the locate script with the controls currently on the page."""
+
+    def __init__(self, controls: list[tuple[str, str, str]]) -> None:
+        self.elements = [f"element-{i}" for i in range(len(controls))]
+        self.controls = [list(control) for control in controls]
+        self.scripts = 0
+
+    def execute_script(self, script: str, *args: object) -> list:
+        self.scripts += 1
+        return [self.elements, self.controls, 0]
+
+
+def _pending(position: int, element_id: str = "", name: str = "") -> FormField:
+    handle = SnapshotHandle((), position, "input", element_id, name)
+    return FormField(tag="input", element_id=element_id, name=name, handle=handle)
+
+
+class TestAttachHandles:
+    def test_one_script_resolves_every_field_in_the_frame(self) -> None:
+        driver = LocatingDriver([("input", "a", ""), ("input", "", "b")])
+        fields = [_pending(0, element_id="a"), _pending(1, name="b")]
+        attach_handles(driver, fields)
+        assert driver.scripts == 1
+        assert [f.handle for f in fields] == ["element-0", "element-1"]
+
+    def test_a_control_that_moved_is_found_by_identity(self) -> None:
+        driver = LocatingDriver([("input", "", "banner"), ("input", "a", "")])
+        fields = [_pending(0, element_id="a")]
+        attach_handles(driver, fields)
+        assert fields[0].handle == "element-1"
+
+    def test_a_control_that_is_gone_has_no_handle(self) -> None:
+        """Better a failed field than a value written into its neighbour."""
+        driver = LocatingDriver([("input", "", "other")])
+        fields = [_pending(0, element_id="a"), _pending(3)]
+        attach_handles(driver, fields)
+        assert [f.handle for f in fields] == [None, None]
+
+    def test_live_handles_cost_nothing(self) -> None:
+        driver = LocatingDriver([])
+        attach_handles(driver, [FormField(tag="input", handle="live")])
+        assert driver.scripts == 0
+
+    def test_fill_attaches_handles_when_it_enters_the_frame(self, monkeypatch) -> None:
+        class Element:
+            def __init__(self) -> None:
+                self.sent: list[str] = []
+
+            def clear(self) -> None:
+                pass
+
+            def send_keys(self, value: str) -> None:
+                self.sent.append(value)
+
+        element = Element()
+        driver = RecordingDriver()
+        driver.execute_script = lambda script, *args: [[element], [["input", "em", ""]], 0]
+        field = FormField(
+            tag="input",
+            field_type="email",
+            label="Email",
+            element_id="em",
+            frame_path=(0,),
+            handle=SnapshotHandle((0,), 0, "input", "em", ""),
+        )
+        monkeypatch.setattr(form_filler, "fields_from_driver", lambda d: [field])
+        form_filler.fill_form(driver, ResumeData(email="jane@example.com"), dry_run=False)
+        assert element.sent == ["jane@example.com"]
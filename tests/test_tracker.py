@@ -118,6 +118,13 @@ class TestReporting:
         path = write_json_report([make_result("https://example.com/j")], tmp_path, resume)
         assert "SENSITIVE FULL RESUME BODY" not in path.read_text(encoding="utf-8")
 
+    def test_json_report_records_where_the_run_waited(self, tmp_path, resume) -> None:
+        timings = {"typeahead": {"waits": 3, "seconds_waited": 0.6}}
+        path = write_json_report(
+            [make_result("https://example.com/j")], tmp_path, resume, timings=timings
+        )
+        assert json.loads(path.read_text(encoding="utf-8"))["timings"] == timings
+
 
 class TestConsoleEncoding:
     def test_plan_with_non_ascii_labels_encodes_on_a_cp1252_console(self) -> None:
@@ -0,0 +1,115 @@
+"""Tests for vendor detection and the vocabulary packs."""
+
+from __future__ import annotations
+
+import pytest
+
+from resume_filler import field_map
+from resume_filler.extractors import fields_from_html
+from resume_filler.field_map import (
+    CANONICAL_FIELDS,
+    VOCABULARIES,
+    match_form,
+    pattern_scores,
+    vendor_vocabulary,
+)
+from resume_filler.models import FormField
+from resume_filler.plan_cache import PlanCache
+from resume_filler.vendors import PACK_DIR, VENDOR_HOSTS, detect_vendor, load_pack
+
+
+class TestDetectVendor:
+    @pytest.mark.parametrize(
+        ("text", "vendor"),
+        [
+            ("https://acme.wd5.myworkdayjobs.com/en-US/careers/job/123/apply", "workday"),
+            ("https://careers-acme.icims.com/jobs/4567/engineer/job", "icims"),
+            ("https://jobs.smartrecruiters.com/Acme/7443", "smartrecruiters"),
+            ("https://boards.greenhouse.io/acme/jobs/1", ""),
+            ("", ""),
+        ],
+    )
+    def test_from_a_url(self, text, vendor) -> None:
+        assert detect_vendor(text) == vendor
+
+    def test_from_a_saved_page(self, fixture_dir, greenhouse_html) -> None:
+        workday = (fixture_dir / "workday_experience.html").read_text(encoding="utf-8")
+        assert detect_vendor(workday) == "workday"
+        assert detect_vendor(greenhouse_html) == ""
+
+
+class TestPacks:
+    def test_every_vendor_has_a_pack_and_every_pack_a_vendor(self) -> None:
+        assert {path.stem for path in PACK_DIR.glob("*.json")} == {"base", *VENDOR_HOSTS}
+
+    def test_an_unknown_pack_is_refused(self) -> None:
+        with pytest.raises(ValueError, match="No vocabulary pack"):
+            load_pack("taleo")
+
+    @pytest.mark.parametrize("vendor", sorted(VENDOR_HOSTS))
+    def test_packs_only_extend_base_fields(self, vendor) -> None:
+        for kind in ("canonical", "entry"):
+            base_names = [canonical.name for canonical in VOCABULARIES[kind]]
+            assert [c.name for c in vendor_vocabulary(kind, vendor)] == base_names
+
+    def test_a_pack_naming_an_unknown_field_is_refused(self, monkeypatch) -> None:
+        pack = {"canonical": [{"name": "shoe_size", "patterns": [["\\bshoe\\b", 1.0]]}]}
+        monkeypatch.setattr(field_map, "load_pack", lambda name: pack)
+        with pytest.raises(ValueError, match="shoe_size"):
+            vendor_vocabulary.__wrapped__("canonical", "workday")
+
+    def test_base_pack_is_the_base_vocabulary(self) -> None:
+        base = load_pack("base")
+        for kind in ("canonical", "entry"):
+            names = [entry["name"] for entry in base[kind]]
+            assert names == [canonical.name for canonical in VOCABULARIES[kind]]
+
+
+class TestVendorVocabulary:
+    def test_no_vendor_is_the_base_vocabulary(self) -> None:
+        assert vendor_vocabulary("canonical") is CANONICAL_FIELDS
+        assert vendor_vocabulary("entry", "icims") is VOCABULARIES["entry"]
+
+    def test_unextended_fields_are_shared_with_the_base(self) -> None:
+        extended = vendor_vocabulary("canonical", "icims")
+        shared = [a is b for a, b in zip(extended, CANONICAL_FIELDS, strict=True)]
+        assert shared.count(False) == 1
+
+    def test_a_pack_only_changes_its_own_vendor(self) -> None:
+        assert "address_line1" not in pattern_scores("address street1")
+        vendor_vocabulary("canonical", "icims")
+        assert "address_line1" in pattern_scores("address street1", "canonical:icims")
+        assert "address_line1" not in pattern_scores("address street1")
+
+    def test_workday_education_years(self) -> None:
+        html = """
+        <form>
+          <label for="education-4--schoolName">School or University</label>
+          <input id="education-4--schoolName">
+          <div><span>To (Actual or Expected)</span>
+            <input role="spinbutton" id="education-4--lastYearAttended" aria-label="Year">
+          </div>
+        </form>
+        """
+        fields = fields_from_html(html)
+        assert match_form(fields)[1].canonical == ""
+        assert match_form(fields, vendor="workday")[1].canonical == "entry_end_year"
+
+    def test_other_vendors_never_read_a_pack(self, greenhouse_html, monkeypatch) -> None:
+        expected = [m.canonical for m in match_form(fields_from_html(greenhouse_html))]
+
+        def refuse(name):
+            raise AssertionError(f"read the {name} pack")
+
+        monkeypatch.setattr(field_map, "load_pack", refuse)
+        fields = fields_from_html(greenhouse_html)
+        assert [m.canonical for m in match_form(fields)] == expected
+
+    def test_the_vendor_is_part_of_the_plan_cache_key(self, tmp_path) -> None:
+        cache = PlanCache(tmp_path / "plan_cache.db")
+        fields = [FormField(tag="input", label="Address 1")]
+        match_form(fields, plan_cache=cache)
+        threshold = field_map.DEFAULT_CONFIDENCE_THRESHOLD
+        assert cache.get(fields, threshold, "greedy", "icims") is None
+        assert match_form(fields, plan_cache=cache, vendor="icims")[0].canonical == "address_line1"
+        assert cache.get(fields, threshold, "greedy", "icims") is not None